@@ -1,6 +1,18 @@
 from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, pre_delete
 
 
 class EvaluationConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "eva_reg.evaluation"
+
+    def ready(self):
+        from . import models, search_index
+
+        # Queryset deletes don't call Model.delete, so listen for the signal instead
+        for related_field in models.search_document_related_fields:
+            related_model = models.Evaluation._meta.get_field(related_field).related_model
+            post_delete.connect(search_index.remove_fragment, sender=related_model)
+
+        m2m_changed.connect(models.touch_contributed_evaluations, sender=models.Evaluation.users.through)
+        pre_delete.connect(models.touch_evaluations_of_deleted_user, sender=models.User)
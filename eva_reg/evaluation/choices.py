@@ -1,4 +1,4 @@
-from . import enums, utils
+from . import utils
 
 
 class EvaluationTypeOptions(utils.Choices):
@@ -258,7 +258,6 @@ dropdown_choices = {
     "process_evaluation_aspect": ProcessEvaluationAspects.choices,
     "process_evaluation_method": ProcessEvaluationMethods.choices,
     "measure_type": MeasureType.choices,
-    "organisations": enums.Organisation.choices,
     "topics": Topic.choices,
 }
 
@@ -269,6 +268,15 @@ def get_db_values(choices):
 
 
 def get_display_name(db_name, choices_options):
+    """
+    The label for db_name, or None if it isn't one of the choices. choices_options is a Choices class,
+    which is looked up directly, or a sequence of options
+    """
+    if isinstance(choices_options, utils.ChoicesMeta):
+        try:
+            return choices_options.mapping.get(db_name)
+        except TypeError:  # Unhashable, e.g. a list, so not a choice
+            return None
     result = [choice["text"] for choice in choices_options if choice["value"] == db_name]
     if not result:
         return None
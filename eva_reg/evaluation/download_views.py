@@ -1,71 +1,129 @@
-import csv
+import tempfile
 
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponse
+from django.db.models import Q
+from django.http import FileResponse, StreamingHttpResponse
 from django.shortcuts import render
+from django.utils.cache import get_conditional_response, patch_vary_headers
 
+from eva_reg.evaluation import exports, snapshots
 from eva_reg.evaluation.choices import EvaluationVisibility
-from eva_reg.evaluation.models import Evaluation
-from eva_reg.evaluation.schemas import EvaluationSchema
-from eva_reg.evaluation.utils import restrict_to_permitted_evaluations
+from eva_reg.evaluation.models import Evaluation, contributed_to_by
 
 
 @login_required
 def filter_evaluations_to_download(request):
     user = request.user
-    qs = Evaluation.objects.all()
-    restricted_evaluations = restrict_to_permitted_evaluations(user, qs)
-    output_qs = Evaluation.objects.none()
+    visibilities = []
     if "civil_service_only" in request.GET:
-        civil_service_evals = restricted_evaluations.filter(visibility=EvaluationVisibility.CIVIL_SERVICE.value)
-        output_qs = output_qs | civil_service_evals
+        visibilities.append(EvaluationVisibility.CIVIL_SERVICE.value)
     if "public" in request.GET:
-        public_evals = restricted_evaluations.filter(visibility=EvaluationVisibility.PUBLIC.value)
-        output_qs = output_qs | public_evals
+        visibilities.append(EvaluationVisibility.PUBLIC.value)
+    query = Q(visibility__in=visibilities)
     if "my_evaluations" in request.GET:
-        user_evals = user.evaluations.all()
-        output_qs = output_qs | user_evals
-    return output_qs
+        query |= Q(contributed_to_by(user))
+    return Evaluation.objects.visible_to(user).filter(query)
 
 
 @login_required
 def download_json_view(request):
     evaluations_qs = filter_evaluations_to_download(request)
-    evaluation_schema = EvaluationSchema()
-    data = evaluation_schema.dumps(evaluations_qs, many=True)
     headers = {
         "Content-Type": "application/json",
         "Content-Disposition": "attachment; filename=evaluation-data.json",
     }
-    response = HttpResponse(data, headers=headers)
+    response = StreamingHttpResponse(exports.iter_json(evaluations_qs), headers=headers)
     return response
 
 
+@login_required
+def download_columnar_view(request, columnar_format):
+    evaluations_qs = filter_evaluations_to_download(request)
+    output_file = exports.write_columnar_zip(evaluations_qs, columnar_format, tempfile.TemporaryFile())
+    return FileResponse(
+        output_file,
+        as_attachment=True,
+        filename=f"evaluation-data-{columnar_format}.zip",
+        content_type="application/zip",
+    )
+
+
 @login_required
 def download_csv_view(request):
     evaluations_qs = filter_evaluations_to_download(request)
-    evaluation_schema = EvaluationSchema()
-    data = evaluation_schema.dump(evaluations_qs, many=True)
     headers = {
         "Content-Type": "text/csv",
         "Content-Disposition": "attachment; filename=evaluation-data.csv",
     }
-    response = HttpResponse(headers=headers)
-    # TODO - do we want only selected fields, and in what order?
-    fieldnames = []
-    if data:
-        fieldnames = list(data[0].keys())
-    writer = csv.DictWriter(response, fieldnames=fieldnames)
-    writer.writeheader()
-    for row in data:
-        writer.writerow(row)
+    response = StreamingHttpResponse(exports.iter_csv(evaluations_qs), headers=headers)
+    return response
+
+
+def get_snapshot_slices(request):
+    """
+    The snapshot slices the request is asking for, or None if it has to be generated live
+    (it includes the user's own evaluations, or a slice they can't see all of)
+    """
+    if "my_evaluations" in request.GET:
+        return None
+    slices = [slice_name for slice_name in snapshots.SNAPSHOT_SLICES if slice_name in request.GET]
+    if not slices:
+        return None
+    if "civil_service_only" in slices and request.user.is_external_user:
+        return None
+    return slices
+
+
+def accepts_gzip(request):
+    """
+    Whether the Accept-Encoding header allows gzip, which it doesn't if it's given a q-value of 0
+    """
+    qualities = {}
+    for coding in request.META.get("HTTP_ACCEPT_ENCODING", "").split(","):
+        name, *params = [part.strip() for part in coding.split(";")]
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name:
+            qualities[name.lower()] = quality
+    return qualities.get("gzip", qualities.get("x-gzip", qualities.get("*", 0.0))) > 0
+
+
+def download_snapshot_view(request, slices, snapshot_format):
+    """
+    Serve a prebuilt snapshot, gzipped if the client accepts it, or None if it hasn't been built or is out of date
+    """
+    filename = f"{snapshots.get_snapshot_name(slices)}.{snapshot_format}"
+    gzipped = accepts_gzip(request)
+    snapshot = snapshots.SnapshotStorage().get(filename, gzipped=gzipped, state=snapshots.get_slice_state(slices))
+    if not snapshot:
+        return None
+    path, etag = snapshot
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        content_type = {"json": "application/json", "csv": "text/csv"}[snapshot_format]
+        response = FileResponse(open(path, "rb"), content_type=content_type)
+        response["Content-Disposition"] = f"attachment; filename=evaluation-data.{snapshot_format}"
+        if gzipped:
+            response["Content-Encoding"] = "gzip"
+    response["ETag"] = etag
+    patch_vary_headers(response, ["Accept-Encoding"])
     return response
 
 
 @login_required
 def download_page_view(request):
-    if "json" in request.GET:
-        return download_json_view(request)
-    elif "csv" in request.GET:
-        return download_csv_view(request)
+    for snapshot_format, live_view in (("json", download_json_view), ("csv", download_csv_view)):
+        if snapshot_format in request.GET:
+            slices = get_snapshot_slices(request)
+            response = slices and download_snapshot_view(request, slices, snapshot_format)
+            return response or live_view(request)
+    for columnar_format in exports.COLUMNAR_FORMATS:
+        if columnar_format in request.GET:
+            return download_columnar_view(request, columnar_format)
     return render(request, "data-download.html", {"errors": {}, "data": {}})
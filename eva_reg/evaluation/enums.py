@@ -1,1375 +0,0 @@
-from . import utils
-
-org_tuples = (
-    ("academy-for-justice-commissioning", "Academy for Justice Commissioning"),
-    ("academy-for-social-justice", "Academy for Social Justice"),
-    ("academy-for-social-justice-commissioning", "Academy for Social Justice Commissioning"),
-    ("accelerated-access-review", "Accelerated Access Review (AAR)"),
-    ("accelerated-capability-environment", "Accelerated Capability Environment (ACE)"),
-    ("active-travel-england", "Active Travel England (ATE)"),
-    (
-        "administration-of-radioactive-substances-advisory-committee",
-        "Administration of Radioactive Substances Advisory Committee (ARSAC)",
-    ),
-    ("administrative-court", "Administrative Court"),
-    ("administrative-justice-and-tribunals-council", "Administrative Justice and Tribunals Council (AJTC)"),
-    (
-        "administrative-justice-and-tribunals-council-welsh-committee",
-        "Administrative Justice and Tribunals Council Welsh Committee",
-    ),
-    ("admiralty-court", "Admiralty Court"),
-    ("adult-learning-inspectorate", "Adult Learning Inspectorate"),
-    ("advanced-research-and-invention-agency", "Advanced Research and Invention Agency (ARIA)"),
-    ("advantage-west-midlands", "Advantage West Midlands"),
-    ("advisory-committee-on-animal-feedingstuffs", "Advisory Committee on Animal Feedingstuffs (ACAF)"),
-    ("advisory-committee-on-business-appointments", "Advisory Committee on Business Appointments (ACOBA)"),
-    ("advisory-committee-on-clinical-excellence-awards", "Advisory Committee on Clinical Excellence Awards (ACCEA)"),
-    ("advisory-committee-on-clinical-impact-awards", "Advisory Committee on Clinical Impact Awards (ACCIA)"),
-    ("advisory-committee-on-conscientious-objectors", "Advisory Committee on Conscientious Objectors (ACCO)"),
-    ("advisory-committee-on-novel-foods-and-processes", "Advisory Committee on Novel Foods and Processes (ACNFP)"),
-    ("advisory-committee-on-pesticides", "Advisory Committee on Pesticides (ACP)"),
-    ("advisory-committee-on-releases-to-the-environment", "Advisory Committee on Releases to the Environment (ACRE)"),
-    (
-        "advisory-committee-on-the-microbiological-safety-of-food",
-        "Advisory Committee on the Microbiological Safety of Food (ACMSF)",
-    ),
-    ("advisory-committees-on-justices-of-the-peace", "Advisory Committees on Justices of the Peace (ACJP)"),
-    ("advisory-council-on-the-misuse-of-drugs", "Advisory Council on the Misuse of Drugs (ACMD)"),
-    ("advisory-group-on-military-medicine", "Advisory Group on Military and Emergency Response Medicine (AGMERM)"),
-    ("advisory-panel-on-public-sector-information", "Advisory Panel on Public Sector Information (APPSI)"),
-    ("acas", "Advisory, Conciliation and Arbitration Service (Acas)"),
-    ("agri-food-and-biosciences-institute", "Agri-Food and Biosciences Institute (Northern Ireland)"),
-    (
-        "agricultural-dwelling-house-advisory-committees-x16",
-        "Agricultural Dwelling House Advisory Committees (x16) (ADHAC)",
-    ),
-    ("agricultural-wages-committee-x13", "Agricultural Wages Committee (AWC)"),
-    ("agriculture-and-horticulture-development-board", "Agriculture and Horticulture Development Board (AHDB)"),
-    ("air-accidents-investigation-branch", "Air Accidents Investigation Branch (AAIB)"),
-    ("airports-commission", "Airports Commission"),
-    ("alcohol-education-and-research-council", "Alcohol Education and Research Council"),
-    ("ancient-monuments-board-for-scotland", "Ancient Monuments Board for Scotland"),
-    ("animal-and-plant-health-agency", "Animal and Plant Health Agency (APHA)"),
-    ("animal-health", "Animal Health"),
-    ("animal-health-and-veterinary-laboratories-agency", "Animal Health and Veterinary Laboratories Agency (AHVLA)"),
-    ("animal-procedures-committee", "Animal Procedures Committee"),
-    ("animals-in-science-committee", "Animals in Science Committee (ASC)"),
-    ("appeals-service-agency", "Appeals Service Agency"),
-    ("architects-registration-board", "Architects Registration Board (ARB)"),
-    ("armagh-observatory-and-planetarium", "Armagh Observatory and Planetarium"),
-    ("armed-forces-covenant-fund-trust", "Armed Forces Covenant Fund Trust"),
-    ("armed-forces-personnel-administration-agency", "Armed Forces Personnel Administration Agency"),
-    ("armed-forces-pay-review-body", "Armed Forces' Pay Review Body (AFPRB)"),
-    ("army-base-repair-organisation", "Army Base Repair Organisation"),
-    ("arts-and-humanities-research-council", "Arts and Humanities Research Council (AHRC)"),
-    ("arts-council-england", "Arts Council England"),
-    ("arts-council-of-northern-ireland", "Arts Council of Northern Ireland (ACNI)"),
-    ("arts-council-of-wales", "Arts Council of Wales"),
-    ("ashington-education-action-zone", "Ashington Education Action Zone"),
-    ("asset-protection-agency", "Asset Protection Agency"),
-    ("assets-recovery-agency", "Assets Recovery Agency"),
-    ("atomic-weapons-establishment", "Atomic Weapons Establishment (AWE)"),
-    ("attorney-generals-office", "Attorney General's Office (AGO)"),
-    ("audit-commission", "Audit Commission (Audit Commission)"),
-    ("azelle-rodney-inquiry", "Azelle Rodney Inquiry"),
-    ("baha-mousa-inquiry", "Baha Mousa Inquiry"),
-    ("bank-of-england", "Bank of England"),
-    ("barker-review-of-land-use-planning", "Barker Review of Land Use Planning"),
-    ("barrow-education-action-zone", "Barrow Education Action Zone"),
-    ("bbc", "BBC (BBC)"),
-    ("bbc-world-service", "BBC World Service (BBCWS)"),
-    ("bedford-education-action-zone", "Bedford Education Action Zone"),
-    ("behavioural-insights-team", "Behavioural Insights Team (BIT)"),
-    ("better-regulation-delivery-office", "Better Regulation Delivery Office (BRDO)"),
-    ("big-lottery-fund", "Big Lottery Fund (BIG)"),
-    ("billy-wright-inquiry", "Billy Wright Inquiry"),
-    ("biometrics-and-forensics-ethics-group", "Biometrics and Forensics Ethics Group"),
-    ("biometrics-and-surveillance-camera-commissioner", "Biometrics and Surveillance Camera Commissioner (BSCC)"),
-    ("biometrics-commissioner", "Biometrics Commissioner"),
-    (
-        "biotechnology-biological-sciences-research-council",
-        "Biotechnology and Biological Sciences Research Council (BBSRC)",
-    ),
-    (
-        "birmingham-organising-committee-for-the-2022-commonwealth-games-ltd",
-        "Birmingham Organising Committee for the 2022 Commonwealth Games Ltd",
-    ),
-    ("bloody-sunday-inquiry", "Bloody Sunday Inquiry"),
-    ("board-of-banking-supervision", "Board of Banking Supervision"),
-    ("board-of-inland-revenue", "Board of Inland Revenue"),
-    ("board-of-trustees-of-the-royal-botanic-gardens-kew", "Board of Trustees of the Royal Botanic Gardens Kew"),
-    ("bolton-education-action-zone", "Bolton Education Action Zone"),
-    ("bona-vacantia", "Bona Vacantia (BVD)"),
-    ("border-force", "Border Force"),
-    ("boundary-commission-for-england", "Boundary Commission for England (BCE)"),
-    ("boundary-commission-for-northern-ireland", "Boundary Commission for Northern Ireland (BCNI)"),
-    ("boundary-commission-for-scotland", "Boundary Commission for Scotland (BCS)"),
-    ("boundary-commission-for-wales", "Boundary Commission for Wales (BCW)"),
-    ("bpdts-ltd", "BPDTS Ltd"),
-    ("brb-residuary-ltd", "BRB (Residuary) Ltd (BRBR)"),
-    ("bridgwater-education-action-zone", "Bridgwater Education Action Zone"),
-    ("bristol-education-action-zone", "Bristol Education Action Zone"),
-    ("british-business-bank", "British Business Bank (BBB)"),
-    ("british-cattle-movement-service", "British Cattle Movement Service (BCMS)"),
-    ("british-council", "British Council (British Council)"),
-    (
-        "british-educational-communications-and-technology-agency",
-        "British Educational Communications and Technology Agency (Becta)",
-    ),
-    ("british-film-institute", "British Film Institute (BFI)"),
-    ("british-forces-post-office", "British Forces Post Office"),
-    ("british-hallmarking-council", "British Hallmarking Council (BHC)"),
-    ("british-library", "British Library (BL)"),
-    ("british-museum", "British Museum (BM)"),
-    ("british-pharmacopoeia", "British Pharmacopoeia Commission"),
-    ("british-potato-council", "British Potato Council"),
-    ("british-transport-police-authority", "British Transport Police Authority (BTPA)"),
-    ("british-wool", "British Wool"),
-    ("broadcasting-standards-commission", "Broadcasting Standards Commission"),
-    ("investigation-into-the-role-of-jimmy-savile-at-broadmoor-hospital", "Broadmoor Hospital investigation"),
-    ("broads-authority", "Broads Authority"),
-    ("building-digital-uk", "Building Digital UK (BDUK)"),
-    ("building-regulations-advisory-committee", "Building Regulations Advisory Committee (BRAC)"),
-    ("building-research-establishment", "Building Research Establishment"),
-    ("business-development-service", "Business Development Service"),
-    ("buying-solutions", "Buying Solutions"),
-    ("cabinet-office", "Cabinet Office"),
-    ("cabinet-office-board", "Cabinet Office Board"),
-    ("children-and-family-court-advisory-and-support-service", "Cafcass (Cafcass)"),
-    ("camborne-pool-and-redruth-education-action-zone", "Camborne, Pool and Redruth Education Action Zone"),
-    ("capacitybuilders", "Capacitybuilders"),
-    ("capital-for-enterprise-ltd", "Capital for Enterprise Limited (CfEL)"),
-    ("care-quality-commission", "Care Quality Commission (CQC)"),
-    ("careers-wales", "Careers Wales"),
-    ("central-advisory-committee-on-compensation", "Central Advisory Committee on Compensation (CAC Compensation)"),
-    (
-        "central-advisory-committee-on-pensions-and-compensation",
-        "Central Advisory Committee on Pensions and Compensation  (CAC Pensions and Compensation)",
-    ),
-    ("central-arbitration-committee", "Central Arbitration Committee (CAC)"),
-    ("central-digital-and-data-office", "Central Digital and Data Office (CDDO)"),
-    ("central-office-of-information", "Central Office of Information"),
-    ("central-police-training-and-development-authority", "Central Police Training and Development Authority"),
-    ("central-science-laboratory", "Central Science Laboratory"),
-    ("centre-for-connected-and-autonomous-vehicles", "Centre for Connected and Autonomous Vehicles  (CCAV)"),
-    ("centre-for-data-ethics-and-innovation", "Centre for Data Ethics and Innovation (CDEI)"),
-    ("centre-for-defence-enterprise", "Centre for Defence Enterprise (CDE)"),
-    (
-        "centre-for-environment-fisheries-and-aquaculture-science",
-        "Centre for Environment, Fisheries and Aquaculture Science (Cefas)",
-    ),
-    (
-        "centre-for-the-protection-of-national-infrastructure",
-        "Centre for the Protection of National Infrastructure (CPNI)",
-    ),
-    ("certification-officer", "Certification Officer (Certification Officer)"),
-    ("cesg", "CESG (CESG)"),
-    ("chancery-division-of-the-high-court", "Chancery Division of the High Court"),
-    ("channel-4", "Channel 4 (C4)"),
-    ("chemical-and-biological-defence-establishment", "Chemical and Biological Defence Establishment"),
-    ("chevening-foundation", "Chevening Scholarship Programme  (Chevening)"),
-    ("chief-fire-and-rescue-adviser-unit", "Chief Fire and Rescue Adviser (CFRA)"),
-    ("child-maintenance-and-enforcement-commission", "Child Maintenance and Enforcement Commission"),
-    ("child-safeguarding-practice-review-panel", "Child Safeguarding Practice Review Panel"),
-    ("childrens-workforce-development-council", "Children's Workforce Development Council (CWDC)"),
-    ("churches-conservation-trust", "Churches Conservation Trust"),
-    ("commercial-circuit-court", "Circuit Commercial Court"),
-    ("civil-aviation-authority", "Civil Aviation Authority (CAA)"),
-    ("civil-justice-council", "Civil Justice Council (CJC)"),
-    ("civil-nuclear-constabulary", "Civil Nuclear Constabulary (CNC)"),
-    ("civil-nuclear-police-authority", "Civil Nuclear Police Authority (CNPA)"),
-    ("civil-procedure-rules-committee", "Civil Procedure Rule Committee (CPRC)"),
-    ("civil-service", "Civil Service (the Civil Service)"),
-    ("civil-service-board", "Civil Service Board"),
-    ("civil-service-commission", "Civil Service Commission (CSC)"),
-    ("civil-service-fast-stream", "Civil Service Fast Stream"),
-    ("civil-service-fast-track-apprenticeship", "Civil Service Fast Track Apprenticeship"),
-    ("civil-service-group", "Civil Service Group"),
-    ("civil-service-hr", "Civil Service HR (CSHR)"),
-    ("civil-service-reform", "Civil Service Reform (CSR)"),
-    ("civil-service-resourcing", "Civil Service Resourcing"),
-    ("clacton-and-harwich-education-action-zone", "Clacton and Harwich Education Action Zone"),
-    ("co2sense", "CO2Sense"),
-    ("the-coal-authority", "Coal Authority"),
-    ("college-of-policing", "College of Policing"),
-    ("commercial-court", "Commercial Court"),
-    (
-        "commission-for-architecture-and-the-built-environment-cabe",
-        "Commission for Architecture and the Built Environment (CABE)",
-    ),
-    ("commission-for-countering-extremism", "Commission for Countering Extremism"),
-    ("commission-for-health-improvement", "Commission for Health Improvement"),
-    (
-        "commission-for-patient-and-public-involvement-in-health",
-        "Commission for Patient and Public Involvement in Health",
-    ),
-    ("commission-for-racial-equality", "Commission for Racial Equality"),
-    ("commission-for-rural-communities", "Commission for Rural Communities"),
-    ("commission-for-social-care-inspection", "Commission for Social Care Inspection"),
-    ("commission-for-the-compact", "Commission for the Compact"),
-    ("commission-on-human-medicines", "Commission on Human Medicines (CHM)"),
-    ("commission-on-race-and-ethnic-disparities", "Commission on Race and Ethnic Disparities"),
-    ("commissioner-for-public-appointments", "Commissioner for Public Appointments"),
-    ("shale-commissioner", "Commissioner for Shale Gas"),
-    ("committee-on-climate-change", "Committee on Climate Change (CCC)"),
-    ("committee-on-fuel-poverty", "Committee on Fuel Poverty (CFP)"),
-    (
-        "committee-on-mutagenicity-of-chemicals-in-food-consumer-products-and-the-environment",
-        "Committee on Mutagenicity of Chemicals in Food, Consumer Products and the Environment (COM)",
-    ),
-    ("committee-on-radioactive-waste-management", "Committee on Radioactive Waste Management (CoRWM)"),
-    ("the-committee-on-standards-in-public-life", "Committee on Standards in Public Life (CSPL)"),
-    (
-        "committee-on-toxicity-of-chemicals-in-food-consumer-products-and-the-environment",
-        "Committee on Toxicity of Chemicals in Food, Consumer Products and the Environment (COT)",
-    ),
-    ("commonwealth-scholarship-commission-in-the-uk", "Commonwealth Scholarship Commission in the UK (CSC)"),
-    ("community-development-foundation", "Community Development Foundation"),
-    ("community-fund", "Community Fund"),
-    ("companies-house", "Companies House  (Companies House)"),
-    ("companies-list", "Companies List"),
-    ("company-names-tribunal", "Company Names Tribunal"),
-    ("compensation-agency", "Compensation Agency"),
-    ("competition-and-markets-authority", "Competition and Markets Authority (CMA)"),
-    ("competition-appeal-tribunal", "Competition Appeal Tribunal (CAT)"),
-    ("competition-commission", "Competition Commission (CC)"),
-    ("competition-service", "Competition Service (CS)"),
-    ("conflict-stability-and-security-fund", "Conflict, Stability and Security Fund (CSSF)"),
-    ("construction-industry-training-board", "Construction Industry Training Board (CITB)"),
-    ("consumer-council-for-postal-services", "Consumer Council for Postal Services"),
-    ("consumer-council-for-water", "Consumer Council for Water (CCWater)"),
-    ("consumer-focus", "Consumer Futures"),
-    ("cooksey-review", "Cooksey Review"),
-    ("copyright-tribunal", "Copyright Tribunal"),
-    ("corby-education-action-zone", "Corby Education Action Zone"),
-    ("corporate-officers-of-the-house-of-commons", "Corporate Officers of the House of Commons"),
-    ("corporate-officers-of-the-house-of-lords", "Corporate Officers of the House of Lords"),
-    ("council-for-catholic-maintained-schools", "Council for Catholic Maintained Schools"),
-    ("council-for-healthcare-regulatory-excellence", "Council for Healthcare Regulatory Excellence"),
-    ("council-for-science-and-technology", "Council for Science and Technology (CST)"),
-    (
-        "council-for-the-central-laboratory-of-the-research-councils",
-        "Council for the Central Laboratory of the Research Councils",
-    ),
-    ("council-on-tribunals", "Council on Tribunals"),
-    ("counter-fraud-and-security-management-service", "Counter Fraud and Security Management Service"),
-    ("countryside-agency", "Countryside Agency"),
-    ("court-of-appeal-civil-division", "Court of Appeal Civil Division"),
-    ("court-of-appeal-criminal-division", "Court of Appeal Criminal Division"),
-    ("court-of-judicature-of-northern-ireland", "Court of Judicature of Northern Ireland"),
-    ("court-of-protection", "Court of Protection (COP)"),
-    ("covent-garden-market-authority", "Covent Garden Market Authority (CGMA)"),
-    ("coventry-education-action-zone", "Coventry Education Action Zone"),
-    ("creative-scotland", "Creative Scotland"),
-    ("criminal-cases-review-commission", "Criminal Cases Review Commission (CCRC)"),
-    ("criminal-injuries-compensation-appeals-panel", "Criminal Injuries Compensation Appeals Panel"),
-    (
-        "criminal-injuries-compensation-appeals-panel-for-northern-ireland",
-        "Criminal Injuries Compensation Appeals Panel for Northern Ireland",
-    ),
-    ("criminal-injuries-compensation-authority", "Criminal Injuries Compensation Authority (CICA)"),
-    ("criminal-justice-inspection-northern-ireland", "Criminal Justice Inspection Northern Ireland"),
-    ("criminal-procedure-rule-committee", "Criminal Procedure Rule Committee"),
-    ("criminal-records-bureau", "Criminal Records Bureau"),
-    ("crossrail-international", "Crossrail International (CI)"),
-    ("crown-agents-holding-and-realisation-board", "Crown Agents Holding and Realisation Board"),
-    ("crown-commercial-service", "Crown Commercial Service (CCS)"),
-    ("crown-prosecution-service", "Crown Prosecution Service (CPS)"),
-    ("dartmoor-national-park-authority", "Dartmoor National Park Authority (DNPA)"),
-    ("deepcut-review", "Deepcut Review"),
-    ("defence-academy", "Defence Academy of the United Kingdom (DA)"),
-    ("defence-analytical-services-agency", "Defence Analytical Services Agency"),
-    ("defence-and-security-accelerator", "Defence and Security Accelerator (DASA)"),
-    ("defence-and-security-media-advisory-committee", "Defence and Security Media Advisory Committee (DSMA)"),
-    ("defence-aviation-repair-agency", "Defence Aviation Repair Agency"),
-    ("defence-bills-agency", "Defence Bills Agency"),
-    ("defence-communication-services-agency", "Defence Communication Services Agency"),
-    ("defence-electronics-and-components-agency", "Defence Electronics and Components Agency (DECA)"),
-    ("defence-equipment-and-support", "Defence Equipment and Support (DE&S)"),
-    ("defence-estates", "Defence Estates"),
-    ("defence-infrastructure-organisation", "Defence Infrastructure Organisation (DIO)"),
-    ("defence-intelligence-and-security-centre", "Defence Intelligence and Security Centre"),
-    ("defence-medical-education-and-training-agency", "Defence Medical Education and Training Agency"),
-    ("defence-nuclear-organisation", "Defence Nuclear Organisation (DNO)"),
-    ("defence-nuclear-safety-committee", "Defence Nuclear Safety Committee (DNSC)"),
-    ("defence-procurement-agency", "Defence Procurement Agency"),
-    ("defence-safety-authority", "Defence Safety Authority (DSA)"),
-    ("defence-science-and-technology-laboratory", "Defence Science and Technology Laboratory (Dstl)"),
-    ("defence-scientific-advisory-council", "Defence Scientific Advisory Council (DSAC)"),
-    ("defence-sixth-form-college", "Defence Sixth Form College (DSFC)"),
-    ("defence-storage-and-distribution-agency", "Defence Storage and Distribution Agency"),
-    ("defence-support-group", "Defence Support Group (DSG)"),
-    ("defence-transport-and-movements-agency", "Defence Transport and Movements Agency"),
-    ("defence-vetting-agency", "Defence Vetting Agency"),
-    ("defence-press-and-broadcasting-advisory-committee", "Defence, Press and Broadcasting Advisory Committee (DPBAC)"),
-    ("dental-practice-board", "Dental Practice Board"),
-    ("dental-vocational-training-authority", "Dental Vocational Training Authority"),
-    ("department-for-business-and-trade", "Department for Business and Trade"),
-    (
-        "department-for-business-energy-and-industrial-strategy",
-        "Department for Business, Energy & Industrial Strategy (BEIS)",
-    ),
-    (
-        "department-for-business-enterprise-and-regulatory-reform",
-        "Department for Business, Enterprise and Regulatory Reform",
-    ),
-    ("department-for-business-innovation-skills", "Department for Business, Innovation & Skills (BIS)"),
-    ("department-for-children-schools-and-families", "Department for Children, Schools and Families"),
-    ("department-for-communities-northern-ireland", "Department for Communities (Northern Ireland)"),
-    ("department-for-constitutional-affairs", "Department for Constitutional Affairs"),
-    ("department-for-culture-media-and-sport", "Department for Culture, Media and Sport"),
-    ("department-for-digital-culture-media-sport", "Department for Digital, Culture, Media & Sport (DCMS)"),
-    ("department-for-education", "Department for Education (DfE)"),
-    ("department-for-education-and-skills", "Department for Education and Skills"),
-    ("department-for-employment-and-learning", "Department for Employment and Learning"),
-    ("department-for-energy-security-and-net-zero", "Department for Energy Security and Net Zero (DESNZ)"),
-    ("department-for-environment-food-rural-affairs", "Department for Environment, Food & Rural Affairs (Defra)"),
-    ("department-for-exiting-the-european-union", "Department for Exiting the European Union (DExEU)"),
-    ("department-for-infrastructure-northern-ireland", "Department for Infrastructure (Northern Ireland)"),
-    ("department-for-innovation-universities-and-skills", "Department for Innovation, Universities and Skills"),
-    ("department-for-international-development", "Department for International Development (DFID)"),
-    ("department-for-international-trade", "Department for International Trade (DIT)"),
-    (
-        "department-for-international-trade-defence-and-security-organisation",
-        "Department for International Trade Defence & Security Organisation (DIT DSO)",
-    ),
-    (
-        "department-for-levelling-up-housing-and-communities",
-        "Department for Levelling Up, Housing and Communities  (DLUHC)",
-    ),
-    ("department-for-regional-development", "Department for Regional Development (Northern Ireland)"),
-    ("department-for-science-innovation-and-technology", "Department for Science, Innovation and Technology (DSIT)"),
-    ("department-for-social-development", "Department for Social Development"),
-    ("department-for-the-economy-northern-ireland", "Department for the Economy (Northern Ireland)"),
-    ("department-for-transport", "Department for Transport (DfT)"),
-    ("department-for-work-pensions", "Department for Work and Pensions (DWP)"),
-    ("department-of-agriculture-and-rural-development", "Department of Agriculture and Rural Development"),
-    (
-        "department-of-agriculture-environment-and-rural-affairs-northern-ireland",
-        "Department of Agriculture, Environment and Rural Affairs (Northern Ireland)",
-    ),
-    ("department-of-constitutional-affairs", "Department of Constitutional Affairs"),
-    ("department-of-culture-arts-and-leisure", "Department of Culture, Arts and Leisure"),
-    ("department-of-education", "Department of Education (Northern Ireland)"),
-    ("department-of-energy-climate-change", "Department of Energy & Climate Change (DECC)"),
-    (
-        "department-of-enterprise-trade-and-investment",
-        "Department of Enterprise, Trade and Investment (Northern Ireland)",
-    ),
-    ("department-of-finance-northern-ireland", "Department of Finance (Northern Ireland)"),
-    (
-        "department-of-finance-and-personnel-for-northern-ireland",
-        "Department of Finance and Personnel for Northern Ireland",
-    ),
-    ("department-of-health-northern-ireland", "Department of Health (Northern Ireland)"),
-    ("department-of-health-and-social-care", "Department of Health and Social Care (DHSC)"),
-    (
-        "department-of-health-social-services-and-public-safety",
-        "Department of Health, Social Services and Public Safety",
-    ),
-    ("department-of-inland-revenue", "Department of Inland Revenue"),
-    ("department-of-justice-northern-ireland", "Department of Justice (Northern Ireland)"),
-    ("department-of-national-heritage", "Department of National Heritage"),
-    ("department-of-social-security", "Department of Social Security"),
-    ("department-of-the-environment", "Department of the Environment (Northern Ireland)"),
-    (
-        "department-of-the-environment-transport-and-the-regions",
-        "Department of the Environment, Transport and the Regions",
-    ),
-    ("department-of-trade-and-industry", "Department of Trade and Industry"),
-    ("deputy-prime-ministers-office", "Deputy Prime Minister's Office (DPMO)"),
-    ("derby-north-east-education-action-zone", "Derby North East Education Action Zone"),
-    ("design-council", "Design Council"),
-    ("dft-olr-holdings-limited", "DfT OLR Holdings Limited (DOHL)"),
-    ("digital-data-and-technology-profession", "Digital, Data and Technology Profession"),
-    ("dingle-granby-toxteth-education-action-zone", "Dingle Granby Toxteth Education Action Zone"),
-    ("directly-operated-railways-limited", "Directly Operated Railways Limited (DOR)"),
-    ("disability-and-carers-service", "Disability and Carers Service"),
-    ("disability-rights-commission", "Disability Rights Commission"),
-    ("disability-unit", "Disability Unit"),
-    ("disabled-peoples-employment-corporation", "Disabled People’s Employment Corporation (GB) Ltd (DPEC)"),
-    ("disabled-persons-transport-advisory-committee", "Disabled Persons Transport Advisory Committee (DPTAC)"),
-    ("disclosure-and-barring-service", "Disclosure and Barring Service (DBS)"),
-    ("disposal-services-agency", "Disposal Services Agency"),
-    ("district-valuer-services-dvs", "District Valuer Services (DVS) (DVS)"),
-    ("dounreay", "Dounreay "),
-    ("downham-and-bellingham-education-action-zone", "Downham and Bellingham Education Action Zone"),
-    ("driver-and-vehicle-licensing-agency", "Driver and Vehicle Licensing Agency (DVLA)"),
-    ("driver-and-vehicle-standards-agency", "Driver and Vehicle Standards Agency (DVSA)"),
-    ("driver-and-vehicle-testing-agency", "Driver and Vehicle Testing Agency"),
-    ("driving-standards-agency", "Driving Standards Agency (DSA)"),
-    ("dudley-education-action-zone", "Dudley Education Action Zone"),
-    ("easington-and-seaham-education-action-zone", "Easington and Seaham Education Action Zone"),
-    ("east-cleveland-education-action-zone", "East Cleveland Education Action Zone"),
-    ("east-manchester-education-action-zone", "East Manchester Education Action Zone"),
-    ("east-midlands-development-agency-emda", "East Midlands Development Agency (emda)"),
-    ("east-of-england-development-agency", "East of England Development Agency"),
-    ("east-west-railway-company", "East West Railway Company Limited (EWRC)"),
-    ("eastern-health-and-social-services-board", "Eastern Health and Social Services Board"),
-    ("ebbsfleet-development-corporation", "Ebbsfleet Development Corporation"),
-    ("economic-and-social-research-council", "Economic and Social Research Council (ESRC)"),
-    ("education-and-skills-funding-agency", "Education and Skills Funding Agency (ESFA)"),
-    ("education-funding-agency", "Education Funding Agency (EFA)"),
-    ("efficiency-and-reform-group", "Efficiency and Reform Group (ERG)"),
-    ("eliasch-review", "Eliasch Review"),
-    ("ellesmere-port-education-action-zone", "Ellesmere Port Education Action Zone"),
-    ("employment-agency-standards-inspectorate", "Employment Agency Standards Inspectorate (EAS)"),
-    ("employment-appeal-tribunal", "Employment Appeal Tribunal"),
-    ("employment-tribunal", "Employment Tribunal"),
-    (
-        "engineering-and-physical-sciences-research-council",
-        "Engineering and Physical Sciences Research Council (EPSRC)",
-    ),
-    ("engineering-construction-industry-training-board", "Engineering Construction Industry Training Board (ECITB)"),
-    ("english-heritage", "English Heritage (EH)"),
-    ("english-institute-of-sport", "English Institute of Sport"),
-    ("english-nature", "English Nature"),
-    ("english-partnerships", "English Partnerships"),
-    ("english-sports-council", "English Sports Council"),
-    ("enterprise-ulster", "Enterprise Ulster"),
-    ("environment-agency", "Environment Agency (EA)"),
-    ("environment-and-heritage-service", "Environment and Heritage Service"),
-    ("equal-opportunities-commission", "Equal Opportunities Commission"),
-    ("equality-2025", "Equality 2025 (E2025)"),
-    ("equality-and-human-rights-commission", "Equality and Human Rights Commission (EHRC)"),
-    ("equality-commission-for-northern-ireland", "Equality Commission for Northern Ireland"),
-    ("the-equality-hub", "Equality Hub"),
-    ("equitable-life-inquiry", "Equitable Life Inquiry"),
-    ("estyn", "Estyn"),
-    ("evaluation-task-force", "Evaluation Task Force (ETF)"),
-    (
-        "examination-team-on-child-care-procedures-and-practice-in-north-wales",
-        "Examination team on child care procedures and practice in North Wales",
-    ),
-    ("exchequer-and-audit-department", "Exchequer and Audit Department"),
-    ("exmoor-national-park-authority", "Exmoor National Park Authority (Exmoor)"),
-    ("export-control-joint-unit", "Export Control Joint Unit (ECJU)"),
-    ("export-guarantees-advisory-council", "Export Guarantees Advisory Council (EGAC)"),
-    ("family-division-of-the-high-court", "Family Division of the High Court"),
-    ("family-health-services-appeal-authority", "Family Health Services Appeal Authority"),
-    ("family-justice-council", "Family Justice Council (FJC)"),
-    ("family-procedure-rule-committee", "Family Procedure Rule Committee (FPRC)"),
-    ("fcdo-services", "FCDO Services "),
-    ("fco-services", "FCO Services (FCO Services)"),
-    ("financial-conduct-authority", "Financial Conduct Authority (FCA)"),
-    ("financial-remedies-court", "Financial Remedies Court"),
-    ("financial-reporting-council", "Financial Reporting Council (FRC)"),
-    ("financial-services-organisation", "Financial Services Organisation"),
-    ("financial-services-trade-and-investment-board", "Financial Services Trade and Investment Board (FSTIB)"),
-    ("fire-authority-for-northern-ireland", "Fire Authority for Northern Ireland"),
-    ("fire-service-college", "Fire Service College (FSC)"),
-    ("firearms-consultative-committee", "Firearms Consultative Committee"),
-    ("firebuy", "Firebuy"),
-    ("first-tier-tribunal-asylum-support", "First-tier Tribunal (Asylum Support)"),
-    ("first-tier-tribunal-care-standards", "First-tier Tribunal (Care Standards)"),
-    ("first-tier-tribunal-criminal-injuries-compensation", "First-tier Tribunal (Criminal Injuries Compensation)"),
-    ("first-tier-tribunal-general-regulatory-chamber", "First-tier Tribunal (General Regulatory Chamber)"),
-    ("first-tier-tribunal-immigration-and-asylum", "First-tier Tribunal (Immigration and Asylum)"),
-    ("first-tier-tribunal-mental-health", "First-tier Tribunal (Mental Health)"),
-    ("first-tier-tribunal-property-chamber", "First-tier Tribunal (Property Chamber)"),
-    (
-        "first-tier-tribunal-social-security-and-child-support",
-        "First-tier Tribunal (Social Security and Child Support)",
-    ),
-    (
-        "first-tier-tribunal-special-educational-needs-and-disability",
-        "First-tier Tribunal (Special Educational Needs and Disability)",
-    ),
-    ("first-tier-tribunal-tax", "First-tier Tribunal (Tax)"),
-    (
-        "first-tier-tribunal-war-pensions-and-armed-forces-compensation",
-        "First-tier Tribunal (War Pensions and Armed Forces Compensation)",
-    ),
-    ("fisheries-conservancy-board-for-northern-ireland", "Fisheries Conservancy Board for Northern Ireland"),
-    ("fleet-air-arm-museum", "Fleet Air Arm Museum "),
-    (
-        "flood-and-coastal-erosion-risk-management-research-and-development-programme",
-        "Flood and Coastal Erosion Risk Management Research and Development Programme (FCERM R&D Programme)",
-    ),
-    ("flood-forecasting-centre", "Flood Forecasting Centre (FFC)"),
-    ("flood-re", "Flood Re"),
-    ("food-from-britain", "Food from Britain"),
-    ("food-safety-promotion-board", "Food Safety Promotion Board"),
-    ("food-standards-agency", "Food Standards Agency (FSA)"),
-    ("football-licensing-authority", "Football Licensing Authority"),
-    ("foreign-commonwealth-office", "Foreign & Commonwealth Office (FCO)"),
-    ("foreign-compensation-commission", "Foreign Compensation Commission (FCC)"),
-    ("foreign-commonwealth-development-office", "Foreign, Commonwealth & Development Office (FCDO)"),
-    ("forensic-science-northern-ireland", "Forensic Science Northern Ireland"),
-    ("forensic-science-regulator", "Forensic Science Regulator (FSR)"),
-    ("forensic-science-service", "Forensic Science Service"),
-    ("forest-research", "Forest Research"),
-    ("forest-service", "Forest Service"),
-    ("forestry-commission", "Forestry Commission (Forestry Commission)"),
-    ("forest-enterprise-england", "Forestry England"),
-    ("the-fuel-poverty-advisory-group", "Fuel Poverty Advisory Group (FPAG)"),
-    (
-        "further-and-higher-education-funding-councils-for-wales",
-        "Further and Higher Education Funding Councils for Wales",
-    ),
-    ("further-education-commissioner", "Further Education Commissioner"),
-    ("gambling-commission", "Gambling Commission"),
-    ("gaming-board-for-great-britain", "Gaming Board for Great Britain"),
-    ("gangmasters-and-labour-abuse-authority", "Gangmasters and Labour Abuse Authority (GLAA)"),
-    ("gangmasters-licensing-appeals", "Gangmasters Licensing Appeals"),
-    ("gangmasters-licensing-authority", "Gangmasters Licensing Authority (GLA)"),
-    ("gas-and-electricity-consumer-council-energywatch", "Gas and Electricity Consumer Council (Energywatch)"),
-    ("general-advisory-committee-on-science", "General Advisory Committee on Science (GACS)"),
-    ("general-consumer-council-for-northern-ireland", "General Consumer Council for Northern Ireland"),
-    ("general-social-care-council", "General Social Care Council"),
-    ("general-teaching-council-for-england", "General Teaching Council for England (GTCE)"),
-    ("geospatial-commission", "Geospatial Commission"),
-    ("gloucester-education-action-zone", "Gloucester Education Action Zone"),
-    ("gov-facility-services-limited", "Gov Facility Services Limited (GFSL)"),
-    ("government-actuarys-department", "Government Actuary's Department (GAD)"),
-    ("government-analysis-function", "Government Analysis Function"),
-    ("government-car-and-despatch-agency", "Government Car and Despatch Agency"),
-    ("government-chemist", "Government Chemist (Government Chemist)"),
-    ("government-commercial-function", "Government Commercial Function (GCF)"),
-    ("civil-service-government-communication-service", "Government Communication Service (GCS)"),
-    ("government-communications-headquarters", "Government Communications Headquarters (GCHQ)"),
-    ("civil-service-corporate-finance-profession-cfp", "Government Corporate Finance Profession (GCFP)"),
-    ("government-data-quality-hub", "Government Data Quality Hub (DQHub)"),
-    ("government-digital-service", "Government Digital Service (GDS)"),
-    ("civil-service-government-economic-service", "Government Economic Service (GES)"),
-    ("government-equalities-office", "Government Equalities Office (GEO)"),
-    ("government-estates-management", "Government Estates Management (GEM)"),
-    ("government-finance-function", "Government Finance Function (GFF)"),
-    ("civil-service-government-finance-profession", "Government Finance Profession"),
-    ("government-geography-profession", "Government Geography Profession"),
-    ("government-internal-audit-agency", "Government Internal Audit Agency (GIAA)"),
-    ("civil-service-government-it-profession", "Government IT Profession"),
-    (
-        "civil-service-government-knowledge-information-management-profession",
-        "Government Knowledge & Information Management Profession",
-    ),
-    ("government-legal-department", "Government Legal Department (GLD)"),
-    ("civil-service-government-legal-profession", "Government Legal Profession (GLP)"),
-    ("civil-service-government-legal-service", "Government Legal Service (GLS)"),
-    ("civil-service-government-occupational-psychology-profession", "Government Occupational Psychology Profession "),
-    ("government-office-for-science", "Government Office for Science (GO-Science)"),
-    ("government-office-for-technology-transfer", "Government Office for Technology Transfer (GOTT)"),
-    ("civil-service-government-operational-research-service", "Government Operational Research Service (GORS)"),
-    ("government-partnerships-international", "Government Partnerships International (GPI)"),
-    ("civil-service-government-planning-inspectors", "Government Planning Inspectors"),
-    ("civil-service-the-government-planning-profession", "Government Planning Profession"),
-    ("government-procurement-service", "Government Procurement Service (GPS)"),
-    ("government-property-agency", "Government Property Agency (GPA)"),
-    ("government-property-function", "Government Property Function (GPF)"),
-    ("civil-service-government-property-profession", "Government Property Profession"),
-    ("government-recruitment-service", "Government Recruitment Service (GRS)"),
-    ("civil-service-government-science-engineering", "Government Science & Engineering Profession (GSE Profession)"),
-    ("government-security-profession", "Government Security Profession"),
-    ("government-skills-and-curriculum-unit", "Government Skills and Curriculum Unit (GSCU)"),
-    ("civil-service-government-social-research-profession", "Government Social Research Profession"),
-    ("civil-service-government-statistical-service", "Government Statistical Service"),
-    ("civil-service-government-tax-profession", "Government Tax Profession"),
-    ("civil-service-government-veterinary-services", "Government Veterinary Services "),
-    ("gowers-review-of-intellectual-property", "Gowers Review of Intellectual Property"),
-    ("great-britain-china-centre", "Great Britain-China Centre (GBCC)"),
-    ("great-british-nuclear", "Great British Nuclear (GBN)"),
-    ("great-yarmouth-education-action-zone", "Great Yarmouth Education Action Zone"),
-    ("greenwich-education-action-zone", "Greenwich Education Action Zone"),
-    ("groceries-code-adjudicator", "Groceries Code Adjudicator (GCA)"),
-    ("hm-customs-and-excise", "H.M. Customs and Excise"),
-    ("hm-inspectorate-of-court-administration", "H.M. Inspectorate of Court Administration"),
-    ("hm-inspectorate-of-explosives-for-northern-ireland", "H.M. Inspectorate of Explosives for Northern Ireland"),
-    ("hackney-education-action-zone", "Hackney Education Action Zone"),
-    ("hamilton-oxford-education-action-zone", "Hamilton Oxford Education Action Zone"),
-    ("hastings-and-st-leonards-education-action-zone", "Hastings and St Leonards Education Action Zone"),
-    ("health-and-safety-executive", "Health and Safety Executive (HSE)"),
-    ("health-and-social-care-information-centre", "Health and Social Care Information Centre (HSCIC)"),
-    ("health-education-england", "Health Education England (HEE)"),
-    ("health-protection-agency", "Health Protection Agency"),
-    ("health-research-authority", "Health Research Authority (HRA)"),
-    ("healthcare-commission", "Healthcare Commission"),
-    ("healthcare-uk", "Healthcare UK (Healthcare UK)"),
-    ("hearing-aid-council", "Hearing Aid Council"),
-    ("heart-of-slough-education-action-zone", "Heart of Slough Education Action Zone"),
-    ("her-majestys-magistrates-courts-service-inspectorate", "Her Majesty's Magistrates Courts Service Inspectorate"),
-    ("heritage-lottery-fund", "Heritage Lottery Fund (administered by the NHMF) (HLF)"),
-    ("high-speed-two-limited", "High Speed Two (HS2) Limited (HS2 Ltd)"),
-    ("higher-education-funding-council-for-england", "Higher Education Funding Council for England (HEFCE)"),
-    ("higher-education-statistical-agency", "Higher Education Statistics Agency (HESA)"),
-    ("highways-agency", "Highways Agency (HA)"),
-    ("highways-england", "Highways England (Highways England)"),
-    ("hillsborough-independent-panel", "Hillsborough Independent Panel"),
-    ("historic-england", "Historic England (HE)"),
-    ("historic-royal-palaces", "Historic Royal Palaces (HRP)"),
-    ("hm-courts-and-tribunals-service", "HM Courts & Tribunals Service (HMCTS)"),
-    ("hm-court-service", "HM Courts Service"),
-    ("hm-crown-prosecution-service-inspectorate", "HM Crown Prosecution Service Inspectorate (HMCPSI)"),
-    ("hm-government-communications-centre", "HM Government Communications Centre (HMGCC)"),
-    ("hm-inspectorate-of-constabulary", "HM Inspectorate of Constabulary (HMIC)"),
-    (
-        "hm-inspectorate-of-constabulary-and-fire-rescue-services",
-        "HM Inspectorate of Constabulary and Fire & Rescue Services (HMICFRS)",
-    ),
-    ("hm-inspectorate-of-prisons", "HM Inspectorate of Prisons"),
-    ("hm-inspectorate-of-probation", "HM Inspectorate of Probation"),
-    ("land-registry", "HM Land Registry (HM Land Registry)"),
-    ("hm-nautical-almanac-office", "HM Nautical Almanac Office (HMNAO)"),
-    ("hm-passport-office", "HM Passport Office (HM Passport Office)"),
-    ("hm-prison-and-probation-service", "HM Prison and Probation Service (HMPPS)"),
-    ("hm-prison-service", "HM Prison Service (HMPS)"),
-    ("hm-revenue-customs", "HM Revenue & Customs (HMRC)"),
-    ("hm-treasury", "HM Treasury (HMT)"),
-    ("home-office", "Home Office (Home Office)"),
-    ("home-grown-cereals-authority", "Home-Grown Cereals Authority"),
-    ("homes-and-communities-agency", "Homes and Communities Agency (HCA)"),
-    ("homes-england", "Homes England (Homes England)"),
-    ("horniman-museum", "Horniman Public Museum and Public Park Trust (Horniman)"),
-    ("horserace-betting-levy-board", "Horserace Betting Levy Board (HBLB)"),
-    ("horticultural-development-council", "Horticultural Development Council"),
-    ("house-of-lords-appointments-commission", "House of Lords Appointments Commission (HOLAC)"),
-    ("housing-corporation", "Housing Corporation"),
-    ("housing-ombudsman", "Housing Ombudsman (HOS)"),
-    (
-        "hsc-business-services-organisation-northern-ireland",
-        "HSC Business Services Organisation (Northern Ireland) (BSO)",
-    ),
-    ("human-fertilisation-and-embryology-authority", "Human Fertilisation and Embryology Authority (HFEA)"),
-    ("civil-service-human-resources-profession", "Human Resources Profession"),
-    ("human-tissue-authority", "Human Tissue Authority (HTA)"),
-    ("hybu-cig-cymru-meat-promotion-wales", "Hybu Cig Cymru - Meat Promotion Wales"),
-    ("icl-inquiry", "ICL Inquiry"),
-    ("identity-and-passport-service", "Identity and Passport Service"),
-    ("immigration-enforcement", "Immigration Enforcement"),
-    ("imperial-war-museum", "Imperial War Museum (IWM)"),
-    ("independent-adviser-on-ministers-interests", "Independent Adviser on Ministers' Interests (IAMI)"),
-    ("independent-advisory-panel-on-deaths-in-custody", "Independent Advisory Panel on Deaths in Custody (IAPDC)"),
-    ("independent-anti-slavery-commissioner", "Independent Anti-slavery Commissioner (IASC)"),
-    ("independent-case-examiner", "Independent Case Examiner (ICE)"),
-    (
-        "independent-chief-inspector-of-borders-and-immigration",
-        "Independent Chief Inspector of Borders and Immigration  (ICIBI)",
-    ),
-    ("independent-commission-for-aid-impact", "Independent Commission for Aid Impact (ICAI)"),
-    ("independent-commission-on-civil-aviation-noise", "Independent Commission on Civil Aviation Noise (ICCAN)"),
-    ("independent-commission-on-freedom-of-information", "Independent Commission on Freedom of Information"),
-    ("independent-complaints-reviewer", "Independent Complaints Reviewer (ICR)"),
-    ("dormant-assets-commission", "Independent Dormant Assets Commission "),
-    ("independent-family-returns-panel", "Independent Family Returns Panel (IFRP)"),
-    ("independent-living-fund", "Independent Living Fund (ILF)"),
-    ("independent-medical-expert-group", "Independent Medical Expert Group (IMEG)"),
-    (
-        "independent-monitoring-authority-for-the-citizens-rights-agreements",
-        "Independent Monitoring Authority for the Citizens’ Rights Agreements (IMA)",
-    ),
-    (
-        "independent-monitoring-boards-of-prisons-immigration-removal-centres-and-short-term-holding-rooms",
-        "Independent Monitoring Boards (IMB)",
-    ),
-    ("independent-monitoring-commission", "Independent Monitoring Commission"),
-    ("independent-office-for-police-conduct", "Independent Office for Police Conduct (IOPC)"),
-    ("independent-parliamentary-standards-authority", "Independent Parliamentary Standards Authority  (IPSA)"),
-    ("independent-police-complaint-commission", "Independent Police Complaints Commission (IPCC)"),
-    ("independent-reconfiguration-panel", "Independent Reconfiguration Panel (IRP)"),
-    ("independent-review-mechanism", "Independent Review Mechanism (IRM)"),
-    (
-        "independent-review-of-police-officer-and-staff-remuneration-and-conditions",
-        "Independent Review of Police Officer and Staff Remuneration and Conditions",
-    ),
-    ("independent-review-of-the-uk-postal-services-sector", "Independent Review of the UK Postal Services Sector"),
-    (
-        "independent-reviewer-of-terrorism-legislation",
-        "Independent Reviewer of Terrorism Legislation (Independent Reviewer)",
-    ),
-    ("independent-safeguarding-authority", "Independent Safeguarding Authority"),
-    ("independent-television-commission", "Independent Television Commission"),
-    ("industrial-development-advisory-board", "Industrial Development Advisory Board (IDAB)"),
-    ("industrial-injuries-advisory-council", "Industrial Injuries Advisory Council (IIAC)"),
-    ("information-commissioner-s-office", "Information Commissioner's Office (ICO)"),
-    ("information-services-division-scotland", "Information Services Division (Scotland) (ISD Scotland)"),
-    ("infrastructure-and-projects-authority", "Infrastructure and Projects Authority (IPA)"),
-    ("infrastructure-planning-commission", "Infrastructure Planning Commission"),
-    ("infrastructure-uk", "Infrastructure UK (IUK)"),
-    ("innovate-uk", "Innovate UK (Innovate UK)"),
-    (
-        "inquiry-into-the-supervision-of-the-bank-of-credit-and-commerce-international",
-        "Inquiry into the supervision of the Bank of Credit and Commerce International",
-    ),
-    ("insolvency-list", "Insolvency List"),
-    ("insolvency-practitioners-tribunal", "Insolvency Practitioners Tribunal (IPT)"),
-    ("insolvency-rules-committee", "Insolvency Rules Committee (IRC)"),
-    ("institute-for-apprenticeships", "Institute for Apprenticeships  (IFA)"),
-    ("institute-for-apprenticeships-and-technical-education", "Institute for Apprenticeships and Technical Education"),
-    ("intellectual-property-enterprise-court", "Intellectual Property Enterprise Court"),
-    ("intellectual-property-office", "Intellectual Property Office (IPO)"),
-    ("civil-service-intelligence-analysis-profession", "Intelligence Analysis "),
-    ("intelligence-services-commissioner", "Intelligence Services Commissioner (ISC)"),
-    (
-        "interception-of-communications-commissioner",
-        "Interception of Communications Commissioner (Interception Commissioner\t)",
-    ),
-    ("civil-service-internal-audit-profession", "Internal Audit Profession"),
-    ("invest-northern-ireland", "Invest Northern Ireland (Invest NI)"),
-    ("investigatory-powers-commissioners-office", "Investigatory Powers Commissioner's Office (IPCO)"),
-    ("investigatory-powers-tribunal", "Investigatory Powers Tribunal (IPT)"),
-    ("investors-in-people-uk", "Investors in People UK"),
-    ("iraq-inquiry", "Iraq Inquiry"),
-    ("jhub-defence-innovation", "jHub Defence Innovation"),
-    ("joint-forces-command", "Joint Forces Command (JFC)"),
-    ("joint-nature-conservation-committee", "Joint Nature Conservation Committee (JNCC)"),
-    ("judicial-appointments-and-conduct-ombudsman", "Judicial Appointments and Conduct Ombudsman (JACO)"),
-    ("judicial-appointments-commission", "Judicial Appointments Commission (JAC)"),
-    ("judicial-office", "Judicial Office (JO)"),
-    ("kent-and-somerset-education-action-zone", "Kent and Somerset Education Action Zone"),
-    ("kerr-haslam-inquiry", "Kerr / Haslam Inquiry"),
-    ("kings-bench-division-of-the-high-court", "King's Bench Division of the High Court"),
-    ("queens-harbour-master", "King's Harbour Master (KHM)"),
-    ("kitts-green-and-shard-end-education-action-zone", "Kitts Green and Shard End Education Action Zone"),
-    ("labour-relations-agency", "Labour Relations Agency (Northern Ireland) (LRA)"),
-    ("lake-district-national-park-authority", "Lake District National Park Authority (LDNP)"),
-    ("lammy-review", "Lammy Review"),
-    ("land-registers-of-northern-ireland", "Land Registers of Northern Ireland"),
-    ("land-registration-rule-committee", "Land Registration Rule Committee (LRRC)"),
-    ("law-commission", "Law Commission"),
-    ("leadership-college-for-government", "Leadership College for Government (LCG)"),
-    ("learning-and-skills-council", "Learning and Skills Council"),
-    ("leasehold-advisory-service", "Leasehold Advisory Service (LEASE)"),
-    ("legal-aid-agency", "Legal Aid Agency (LAA)"),
-    ("legal-aid-board", "Legal Aid Board"),
-    ("legal-services-agency-northern-ireland", "Legal Services Agency (Northern Ireland)"),
-    ("legal-services-board", "Legal Services Board (LSB)"),
-    ("legal-services-commission", "Legal Services Commission"),
-    ("leigh-park-education-action-zone", "Leigh Park Education Action Zone"),
-    ("leitch-review-of-skills", "Leitch Review of Skills"),
-    ("leveson-inquiry", "Leveson Inquiry"),
-    ("lgbt-veterans-independent-review", "LGBT Veterans Independent Review"),
-    ("life-sciences-organisation", "Life Sciences Organisation (LSO)"),
-    ("life-sentence-review-commissioners", "Life Sentence Review Commissioners"),
-    ("livestock-and-meat-commission-for-northern-ireland", "Livestock and Meat Commission for Northern Ireland"),
-    ("local-better-regulation-office", "Local Better Regulation Office"),
-    ("local-government-ombudsman", "Local Government and Social Care Ombudsman (LGSCO)"),
-    ("located", "LocatED"),
-    ("london-and-continental-railways-ltd", "London and Continental Railways Limited (LCR)"),
-    ("london-thames-gateway-development-corporation", "London Thames Gateway Development Corporation (LTGDC)"),
-    ("lord-chancellors-department", "Lord Chancellor's Department"),
-    ("loughs-agency", "Loughs Agency"),
-    ("low-level-waste-repository-ltd", "Low Level Waste Repository Ltd  (LLWR)"),
-    ("low-pay-commission", "Low Pay Commission (LPC)"),
-    ("lyons-inquiry-into-local-government", "Lyons Inquiry into Local Government"),
-    ("macur-review", "Macur Review"),
-    ("magnox-ltd", "Magnox Ltd"),
-    ("marine-accident-investigation-branch", "Marine Accident Investigation Branch (MAIB)"),
-    ("marine-fisheries-agency", "Marine Fisheries Agency"),
-    ("marine-management-organisation", "Marine Management Organisation (MMO)"),
-    ("maritime-and-coastguard-agency", "Maritime and Coastguard Agency (MCA)"),
-    ("marshall-aid-commemoration-commission", "Marshall Aid Commemoration Commission (MACC)"),
-    ("meat-and-livestock-commission", "Meat and Livestock Commission"),
-    ("meat-hygiene-service", "Meat Hygiene Service"),
-    ("civil-service-medical-profession", "Medical Profession"),
-    ("medical-research-council", "Medical Research Council (MRC)"),
-    ("medical-supplies-agency", "Medical Supplies Agency"),
-    (
-        "medicines-and-healthcare-products-regulatory-agency",
-        "Medicines and Healthcare products Regulatory Agency (MHRA)",
-    ),
-    ("mental-health-act-commission", "Mental Health Act Commission"),
-    ("met-office", "Met Office"),
-    (
-        "mid-staffordshire-nhs-foundation-trust-public-inquiry-2010",
-        "Mid Staffordshire NHS Foundation Trust Public Inquiry 2010",
-    ),
-    (
-        "mid-staffordshire-nhs-foundation-trust-public-inquiry",
-        "Mid Staffordshire NHS Foundation Trust Public Inquiry 2013",
-    ),
-    ("migration-advisory-committee", "Migration Advisory Committee (MAC)"),
-    ("military-aviation-authority", "Military Aviation Authority (MAA)"),
-    ("military-engineering-experimental-establishment", "Military Engineering Experimental Establishment (MEXE)"),
-    ("milk-development-council", "Milk Development Council"),
-    ("millennium-commission", "Millennium Commission"),
-    ("ministry-of-defence", "Ministry of Defence (MOD)"),
-    ("ministry-of-defence-police-and-guarding-agency", "Ministry of Defence Police and Guarding Agency"),
-    (
-        "ministry-of-housing-communities-and-local-government",
-        "Ministry of Housing, Communities & Local Government (MHCLG)",
-    ),
-    ("ministry-of-justice", "Ministry of Justice (MOJ)"),
-    ("modernisation-and-reform", "Modernisation and Reform"),
-    ("single-financial-guidance-body", "Money and Pensions Service (MaPS)"),
-    ("monitor", "Monitor (Monitor)"),
-    ("monopolies-and-mergers-commission", "Monopolies and Mergers Commission"),
-    ("morecambe-bay-investigation", "Morecambe Bay Investigation"),
-    ("mull-of-kintyre-review", "Mull of Kintyre Review"),
-    ("geffrye-museum", "Museum of the Home"),
-    ("museums-libraries-and-archives-council", "Museums, Libraries and Archives Council"),
-    ("national-army-museum", "National Army Museum (NAM)"),
-    ("national-biological-standards-board", "National Biological Standards Board"),
-    ("national-blood-authority", "National Blood Authority"),
-    ("national-care-standards-commission", "National Care Standards Commission"),
-    ("national-citizen-service", "National Citizen Service (NCS)"),
-    ("national-college-for-school-leadership", "National College for School Leadership (NCSL)"),
-    ("national-college-for-teaching-and-leadership", "National College for Teaching and Leadership (NCTL)"),
-    ("national-counter-terrorism-security-office", "National Counter Terrorism Security Office (NaCTSO)"),
-    ("national-crime-agency", "National Crime Agency (NCA)"),
-    ("national-crime-agency-remuneration-review-body", "National Crime Agency Remuneration Review Body  (NCARRB)"),
-    ("national-crime-squad", "National Crime Squad"),
-    ("national-criminal-intelligence-service", "National Criminal Intelligence Service"),
-    ("national-cyber-force", "National Cyber Force (NCF)"),
-    ("national-cyber-security-centre", "National Cyber Security Centre (NCSC)"),
-    ("national-data-guardian", "National Data Guardian (NDG)"),
-    ("national-dna-database-ethics-group", "National DNA Database Ethics Group (NDNAD)"),
-    ("national-employer-advisory-board", "National Employer Advisory Board (NEAB)"),
-    ("national-employment-savings-trust", "National Employment Savings Trust (NEST) Corporation (NEST Corporation)"),
-    (
-        "national-endowment-for-science-technology-and-the-arts",
-        "National Endowment for Science, Technology and the Arts",
-    ),
-    ("national-forest-company", "National Forest Company (NFC)"),
-    ("national-fraud-authority", "National Fraud Authority (NFA)"),
-    ("national-gallery", "National Gallery"),
-    ("national-heritage-memorial-fund", "National Heritage Memorial Fund (NHMF)"),
-    ("national-highways", "National Highways"),
-    ("national-information-board", "National Information Board (NIB)"),
-    ("national-infrastructure-commission", "National Infrastructure Commission"),
-    ("national-institute-for-clinical-excellence", "National Institute for Health and Care Excellence (NICE)"),
-    ("national-leadership-centre", "National Leadership Centre (NLC)"),
-    ("national-lottery-heritage-fund", "National Lottery Heritage Fund"),
-    ("national-measurement-and-regulation-office", "National Measurement and Regulation Office (NMRO)"),
-    ("national-measurement-office", "National Measurement Office (NMO)"),
-    ("royal-naval-museum", "National Museum of the Royal Navy (RNM)"),
-    ("national-museums-and-galleries-of-northern-ireland", "National Museums and Galleries of Northern Ireland"),
-    ("national-museums-liverpool", "National Museums Liverpool (NML)"),
-    ("national-museums-of-scotland", "National Museums of Scotland"),
-    ("national-offender-management-service", "National Offender Management Service (NOMS)"),
-    ("national-patient-safety-agency", "National Patient Safety Agency"),
-    ("national-policing-improvement-agency", "National Policing Improvement Agency"),
-    ("national-portrait-gallery", "National Portrait Gallery (NPG)"),
-    ("national-radiological-protection-board", "National Radiological Protection Board"),
-    ("national-records-of-scotland", "National Records of Scotland (National Records of Scotland)"),
-    ("national-school-of-government", "National School of Government"),
-    ("national-security", "National security and intelligence"),
-    (
-        "national-security-technology-and-innovation-exchange",
-        "National Security Technology and Innovation Exchange (NSTIx)",
-    ),
-    ("national-treatment-agency-for-substance-misuse", "National Treatment Agency for Substance Misuse"),
-    ("national-weights-and-measures-laboratory", "National Weights and Measures Laboratory"),
-    ("natural-england", "Natural England (Natural England)"),
-    ("natural-environment-research-council", "Natural Environment Research Council (NERC)"),
-    ("natural-history-museum", "Natural History Museum (NHM)"),
-    ("natural-resources-institute", "Natural Resources Institute"),
-    ("natural-resources-wales", "Natural Resources Wales"),
-    ("nature-conservancy-council", "Nature Conservancy Council"),
-    ("network-rail", "Network Rail"),
-    ("new-forest-national-park-authority", "New Forest National Park Authority (NFNPA)"),
-    ("new-opportunities-fund", "New Opportunities Fund"),
-    ("nhs-appointments-commission", "NHS Appointments Commission"),
-    ("nhs-blood-and-transplant", "NHS Blood and Transplant (NHSBT)"),
-    ("nhs-business-services-authority", "NHS Business Services Authority (NHSBSA)"),
-    ("nhs-counter-fraud-authority", "NHS Counter Fraud Authority (NHSCFA)"),
-    ("nhs-digital", "NHS Digital"),
-    ("nhs-direct-national-health-service-trust", "NHS Direct National Health Service Trust"),
-    ("nhs-england", "NHS England"),
-    ("nhs-estates", "NHS Estates"),
-    ("nhs-improvement", "NHS Improvement"),
-    ("nhs-information-centre", "NHS Information Centre"),
-    ("nhs-institute-for-innovation-and-improvement", "NHS Institute for Innovation and Improvement"),
-    ("nhs-litigation-authority", "NHS Litigation Authority (NHSLA)"),
-    ("nhs-logistics-authority", "NHS Logistics Authority"),
-    ("nhs-pay-review-body", "NHS Pay Review Body (NHSPRB)"),
-    ("nhs-pensions-agency", "NHS Pensions Agency"),
-    ("nhs-professionals", "NHS Professionals"),
-    ("nhs-purchasing-and-supply-agency", "NHS Purchasing and Supply Agency"),
-    ("nhs-resolution", "NHS Resolution"),
-    ("nhs-trust-development-authority", "NHS Trust Development Authority (NHS TDA)"),
-    ("nhs-wales-informatics-service", "NHS Wales Informatics Service"),
-    ("nimrod-review", "Nimrod Review"),
-    (
-        "north-east-derbyshire-coalfields-education-action-zone",
-        "North East Derbyshire Coalfields Education Action Zone",
-    ),
-    ("north-east-education-and-library-board", "North East Education and Library Board"),
-    ("north-gillingham-education-action-zone", "North Gillingham Education Action Zone"),
-    ("north-islington-education-action-zone", "North Islington Education Action Zone"),
-    ("north-sea-transition-authority", "North Sea Transition Authority (NSTA)"),
-    ("north-stockton-education-action-zone", "North Stockton Education Action Zone"),
-    ("north-west-development-agency", "North West Development Agency"),
-    ("north-west-shropshire-education-action-zone", "North West Shropshire Education Action Zone"),
-    ("north-york-moors-national-park", "North York Moors National Park Authority (NYMNP)"),
-    ("northern-health-and-social-services-board", "Northern Health and Social Services Board"),
-    ("northern-ireland-audit-office", "Northern Ireland Audit Office"),
-    ("northern-ireland-authority-for-energy-regulation", "Northern Ireland Authority for Energy Regulation"),
-    ("northern-ireland-cancer-registry", "Northern Ireland Cancer Registry (NICR)"),
-    ("northern-ireland-child-support-agency", "Northern Ireland Child Support Agency"),
-    (
-        "northern-ireland-commissioner-for-children-and-young-people",
-        "Northern Ireland Commissioner for Children and Young People",
-    ),
-    (
-        "northern-ireland-council-for-the-curriculum-examinations-and-assessment",
-        "Northern Ireland Council for the Curriculum, Examinations and Assessment (CCEA)",
-    ),
-    ("northern-ireland-court-service", "Northern Ireland Courts and Tribunals Service (NICTS)"),
-    ("northern-ireland-executive", "Northern Ireland Executive "),
-    (
-        "northern-ireland-health-and-social-services-estates-agency",
-        "Northern Ireland Health and Social Services Estates Agency",
-    ),
-    ("northern-ireland-housing-executive", "Northern Ireland Housing Executive (NIHE)"),
-    ("northern-ireland-human-rights-commission", "Northern Ireland Human Rights Commission (NIHRC)"),
-    ("northern-ireland-judicial-appointments-commission", "Northern Ireland Judicial Appointments Commission"),
-    ("northern-ireland-judicial-appointments-ombudsman", "Northern Ireland Judicial Appointments Ombudsman"),
-    ("northern-ireland-law-commission", "Northern Ireland Law Commission"),
-    ("northern-ireland-legal-services-commission", "Northern Ireland Legal Services Commission"),
-    (
-        "northern-ireland-local-government-officers-superannuation-committee",
-        "Northern Ireland Local Government Officers' Superannuation Committee",
-    ),
-    ("northern-ireland-office", "Northern Ireland Office (NIO)"),
-    ("northern-ireland-ombudsman", "Northern Ireland Ombudsman"),
-    ("northern-ireland-police-fund", "Northern Ireland Police Fund"),
-    ("northern-ireland-policing-board", "Northern Ireland Policing Board"),
-    ("northern-ireland-practice-and-education-council", "Northern Ireland Practice and Education Council"),
-    ("northern-ireland-prison-service", "Northern Ireland Prison Service"),
-    ("northern-ireland-social-care-council", "Northern Ireland Social Care Council"),
-    ("northern-ireland-social-security-agency", "Northern Ireland Social Security Agency"),
-    ("northern-ireland-statistics-and-research-agency", "Northern Ireland Statistics and Research Agency (NISRA)"),
-    ("northern-ireland-tourist-board", "Northern Ireland Tourist Board"),
-    ("northern-lighthouse-board", "Northern Lighthouse Board (NLB)"),
-    ("northumberland-national-park-authority", "Northumberland National Park Authority"),
-    ("northwest-business-link", "Northwest Business Link"),
-    ("northwest-regional-development-agency", "Northwest Regional Development Agency"),
-    ("ns-i", "NS&I (NS&I)"),
-    ("nuclear-decommissioning-authority", "Nuclear Decommissioning Authority (NDA)"),
-    ("nuclear-liabilities-financing-assurance-board", "Nuclear Liabilities Financing Assurance Board (NLFAB)"),
-    ("nuclear-research-advisory-council", "Nuclear Research Advisory Council (NRAC)"),
-    ("nuclear-waste-services", "Nuclear Waste Services"),
-    ("oak-national-academy", "Oak National Academy"),
-    ("ofcom", "Ofcom (Ofcom)"),
-    ("office-for-artificial-intelligence", "Office for Artificial Intelligence"),
-    ("office-for-budget-responsibility", "Office for Budget Responsibility (OBR)"),
-    ("office-for-civil-society", "Office for Civil Society (OCS)"),
-    ("office-for-communications-data-authorisations", "Office for Communications Data Authorisations (OCDA)"),
-    ("office-for-criminal-justice-reform", "Office for Criminal Justice Reform"),
-    ("office-for-disability-issues", "Office for Disability Issues (ODI)"),
-    ("office-for-environmental-protection", "Office for Environmental Protection (OEP)"),
-    ("office-for-fair-access", "Office for Fair Access (OFFA)"),
-    ("office-for-health-improvement-and-disparities", "Office for Health Improvement and Disparities (OHID)"),
-    ("office-for-investment", "Office for Investment (OfI)"),
-    ("office-for-life-sciences", "Office for Life Sciences (OLS)"),
-    ("office-for-low-emission-vehicles", "Office for Low Emission Vehicles (OLEV)"),
-    ("office-for-national-statistics", "Office for National Statistics (ONS)"),
-    ("office-for-nuclear-regulation", "Office for Nuclear Regulation (ONR)"),
-    ("office-for-place", "Office for Place (OFP)"),
-    ("office-for-product-safety-and-standards", "Office for Product Safety and Standards"),
-    ("office-for-students", "Office for Students (OfS)"),
-    ("office-for-tenants-and-social-landlords", "Office for Tenants and Social Landlords"),
-    ("office-for-the-internal-market", "Office for the Internal Market (OIM)"),
-    ("office-for-veterans-affairs", "Office for Veterans' Affairs (OVA)"),
-    ("office-for-zero-emission-vehicles", "Office for Zero Emission Vehicles (OZEV)"),
-    ("office-of-fair-trading", "Office of Fair Trading (OFT)"),
-    ("office-of-financial-sanctions-implementation", "Office of Financial Sanctions Implementation (OFSI)"),
-    ("office-of-hm-paymaster-general", "Office of HM Paymaster General"),
-    ("office-of-manpower-economics", "Office of Manpower Economics (OME)"),
-    ("office-of-rail-and-road", "Office of Rail and Road (ORR)"),
-    ("office-of-rail-regulation", "Office of Rail Regulation (ORR)"),
-    ("office-of-surveillance-commissioners", "Office of Surveillance Commissioners (OSC)"),
-    ("office-of-tax-simplification", "Office of Tax Simplification (OTS)"),
-    ("office-of-telecommunications", "Office of Telecommunications"),
-    ("office-of-the-advocate-general-for-scotland", "Office of the Advocate General for Scotland (OAG)"),
-    (
-        "office-of-the-chief-electoral-officer-for-northern-ireland",
-        "Office of the Chief Electoral Officer for Northern Ireland",
-    ),
-    ("office-of-the-children-s-commissioner", "Office of the Children's Commissioner"),
-    (
-        "office-of-the-commissioner-for-protection-against-unlawful-industrial-action",
-        "Office of the Commissioner for Protection Against Unlawful Industrial Action",
-    ),
-    (
-        "office-of-the-commissioner-for-the-rights-of-trade-union-members",
-        "Office of the Commissioner for the Rights of Trade Union Members",
-    ),
-    ("office-of-the-data-protection-registrar", "Office of the Data Protection Registrar"),
-    (
-        "office-of-the-first-minister-and-deputy-first-minister",
-        "Office of the First Minister and Deputy First Minister",
-    ),
-    ("office-of-the-health-professions-adjudicator", "Office of the Health Professions Adjudicator"),
-    ("office-of-the-identity-commissioner", "Office of the Identity Commissioner"),
-    ("office-of-the-immigration-services-commissioner", "Office of the Immigration Services Commissioner (OISC)"),
-    ("office-of-the-lay-observer", "Office of the Lay Observer"),
-    ("the-office-of-the-leader-of-the-house-of-commons", "Office of the Leader of the House of Commons (OLHC)"),
-    ("office-of-the-leader-of-the-house-of-lords", "Office of the Leader of the House of Lords (OLHL)"),
-    ("office-of-the-legal-services-complaints-commissioner", "Office of the Legal Services Complaints Commissioner"),
-    ("office-of-the-legal-services-ombudsman", "Office of the Legal Services Ombudsman"),
-    ("office-of-the-oversight-commissioner", "Office of the Oversight Commissioner"),
-    ("office-of-the-parliamentary-counsel", "Office of the Parliamentary Counsel (OPC)"),
-    ("office-of-the-police-ombudsman-for-northern-ireland", "Office of the Police Ombudsman for Northern Ireland"),
-    ("office-of-the-public-guardian", "Office of the Public Guardian (OPG)"),
-    ("office-of-the-registrar-of-consultant-lobbyists", "Office of the Registrar of Consultant Lobbyists (ORCL)"),
-    (
-        "office-of-the-regulator-of-community-interest-companies",
-        "Office of the Regulator of Community Interest Companies (CIC Regulator)",
-    ),
-    ("office-of-the-schools-adjudicator", "Office of the Schools Adjudicator (OSA)"),
-    ("office-of-the-secretary-of-state-for-scotland", "Office of the Secretary of State for Scotland"),
-    (
-        "office-of-the-secretary-of-state-for-wales",
-        "Office of the Secretary of State for Wales (UK Government in Wales)",
-    ),
-    ("official-solicitor-and-public-trustee", "Official Solicitor and Public Trustee (OSPT)"),
-    (
-        "offshore-petroleum-regulator-for-environment-and-decommissioning",
-        "Offshore Petroleum Regulator for Environment and Decommissioning (OPRED)",
-    ),
-    ("ofgem", "Ofgem"),
-    ("ofqual", "Ofqual (Ofqual)"),
-    ("ofsted", "Ofsted (Ofsted)"),
-    ("oftel", "Oftel"),
-    ("ogcbuyingsolutions", "OGCbuyingsolutions"),
-    ("oil-and-gas-authority", "Oil and Gas Authority (OGA)"),
-    ("olympic-delivery-authority", "Olympic Delivery Authority (ODA)"),
-    ("one-north-east", "One North East"),
-    ("open-innovation-team", "Open Innovation Team (OIT)"),
-    ("open-public-services", "Open Public Services (OPS)"),
-    ("civil-service-operational-delivery-profession", "Operational Delivery Profession"),
-    ("ordnance-survey", "Ordnance Survey (OS)"),
-    ("ordnance-survey-of-northern-ireland", "Ordnance Survey of Northern Ireland"),
-    ("parades-commission-for-northern-ireland", "Parades Commission for Northern Ireland (PCNI)"),
-    ("parliamentary-contributory-pension-fund", "Parliamentary Contributory Pension Fund"),
-    ("parole-board", "Parole Board (Parole Board)"),
-    ("parole-commissioners-for-northern-ireland", "Parole Commissioners for Northern Ireland"),
-    ("particle-physics-and-astronomy-research-council", "Particle Physics and Astronomy Research Council"),
-    ("passenger-focus", "Passenger Focus (PF)"),
-    ("patents-court", "Patents Court"),
-    ("patrick-finucane-review", "Patrick Finucane Review"),
-    ("payment-systems-regulator", "Payment Systems Regulator (PSR)"),
-    ("peak-district-national-park", "Peak District National Park Authority (PDNP)"),
-    ("pension-protection-fund", "Pension Protection Fund (PPF)"),
-    ("pension-service", "Pension Service"),
-    ("pension-disability-and-carers-service", "Pension, Disability and Carers Service"),
-    ("people-pay-and-pensions-agency", "People, Pay and Pensions Agency"),
-    ("personal-accounts-delivery-authority", "Personal Accounts Delivery Authority"),
-    ("pesticides-safety-directorate", "Pesticides Safety Directorate"),
-    ("peterlee-education-action-zone", "Peterlee Education Action Zone"),
-    ("phoenix-sports", "Phoenix Sports"),
-    ("phone-paid-services-authority", "Phone-paid Services Authority"),
-    ("planning-court", "Planning Court"),
-    ("planning-inspectorate", "Planning Inspectorate (The Planning Inspectorate)"),
-    ("planning-service", "Planning Service"),
-    ("plant-varieties-and-seeds-tribunal", "Plant Varieties and Seeds Tribunal (PVST)"),
-    ("plymouth-education-action-zone", "Plymouth Education Action Zone"),
-    ("police-advisory-board-for-england-and-wales", "Police Advisory Board for England and Wales (PAB)"),
-    ("police-arbitration-tribunal", "Police Arbitration Tribunal (PAT)"),
-    ("police-complaints-authority", "Police Complaints Authority"),
-    ("police-discipline-appeals-tribunal", "Police Discipline Appeals Tribunal (Police Discipline)"),
-    ("police-information-technology-organisation", "Police Information Technology Organisation"),
-    ("police-negotiating-board", "Police Negotiating Board (PNB)"),
-    ("police-remuneration-review-body", "Police Remuneration Review Body (PRRB)"),
-    ("police-service-of-northern-ireland", "Police Service of Northern Ireland (PSNI)"),
-    ("civil-service-policy-profession", "Policy Profession"),
-    ("polytechnics-and-colleges-funding-council", "Polytechnics and Colleges Funding Council"),
-    ("porton-biopharma-limited", "Porton Biopharma Limited (PBL)"),
-    ("postal-services-commission", "Postal Services Commission"),
-    ("postgraduate-medical-education-and-training-board", "Postgraduate Medical Education and Training Board"),
-    ("prescription-pricing-authority", "Prescription Pricing Authority"),
-    ("preventing-sexual-violence-in-conflict-initiative", "Preventing Sexual Violence in Conflict Initiative (PSVI)"),
-    ("prime-ministers-office-10-downing-street", "Prime Minister's Office, 10 Downing Street (Number 10)"),
-    ("prison-services-pay-review-body", "Prison Service Pay Review Body (PSPRB)"),
-    ("prisons-and-probation-ombudsman", "Prisons and Probation Ombudsman (PPO)"),
-    ("privy-council-office", "Privy Council Office (PCO)"),
-    ("probation-board-for-northern-ireland", "Probation Board for Northern Ireland (PBNI)"),
-    ("probation-service", "Probation Service"),
-    ("civil-service-procurement-profession", "Procurement profession"),
-    ("professional-oversight-board", "Professional Oversight Board"),
-    (
-        "professional-standards-authority-for-health-and-social-care",
-        "Professional Standards Authority for Health and Social Care",
-    ),
-    ("civil-service-project-delivery-profession", "Project Delivery Profession"),
-    ("public-accounts-commission", "Public Accounts Commission"),
-    ("public-health-agency-northern-ireland", "Public Health Agency (Northern Ireland)"),
-    ("public-health-england", "Public Health England (PHE)"),
-    ("public-health-laboratory-service-board", "Public Health Laboratory Service Board"),
-    ("public-health-wales", "Public Health Wales (PHW)"),
-    ("public-lending-right-office", "Public Lending Right Office"),
-    ("public-prosecution-service-for-northern-ireland", "Public Prosecution Service for Northern Ireland"),
-    ("public-sector-fraud-authority", "Public Sector Fraud Authority (PSFA)"),
-    ("public-services-ombudsman-for-wales", "Public Services Ombudsman for Wales"),
-    ("pubs-code-adjudicator", "Pubs Code Adjudicator (PCA)"),
-    ("qualifications-and-curriculum-authority", "Qualifications and Curriculum Authority (QCA)"),
-    ("qualifications-and-curriculum-development-agency", "Qualifications and Curriculum Development Agency (QCDA)"),
-    ("queen-elizabeth-ii-conference-centre", "Queen Elizabeth II Conference Centre (QEIICC)"),
-    ("race-disparity-unit", "Race Disparity Unit"),
-    ("radioactive-waste-management", "Radioactive Waste Management (RWM)"),
-    ("rail-accident-investigation-branch", "Rail Accident Investigation Branch (RAIB)"),
-    ("rail-safety-and-standards-board", "Rail Safety and Standards Board (RSSB)"),
-    ("railway-heritage-committee", "Railway Heritage Committee (RHC)"),
-    ("reclaim-fund-ltd", "Reclaim Fund Ltd (RFL)"),
-    ("redfern-inquiry", "Redfern Inquiry"),
-    ("regeneration-investment-organisation", "Regeneration Investment Organisation"),
-    ("regional-department-for-education-dfe-directors", "Regional Department for Education (DfE) Directors "),
-    ("regional-schools-commissioners", "Regional Schools Commissioners"),
-    ("regulator-of-social-housing", "Regulator of Social Housing (RSH)"),
-    ("regulatory-delivery", "Regulatory Delivery"),
-    ("regulatory-policy-committee", "Regulatory Policy Committee (RPC)"),
-    ("remploy-ltd", "Remploy Ltd (Remploy)"),
-    ("remploy-pension-scheme-trustees-ltd", "Remploy Pension Scheme Trustees Ltd "),
-    ("renewable-fuels-agency", "Renewable Fuels Agency"),
-    ("rent-service", "Rent Service"),
-    ("research-collaboration-advice-team", "Research Collaboration Advice Team (RCAT)"),
-    ("reserve-forces-appeal-tribunal", "Reserve Forces Appeal Tribunal"),
-    ("reserve-forces-and-cadets-associations", "Reserve Forces' and Cadets' Associations (RFCA)"),
-    ("revenue-and-customs-prosecutions-office", "Revenue and Customs Prosecutions Office"),
-    ("review-board-for-government-contracts", "Review Board for Government Contracts (RBGC)"),
-    ("review-body-for-nursing-and-other-health-professions", "Review Body for Nursing and Other Health Professions"),
-    ("review-body-on-doctors-and-dentists-remuneration", "Review Body on Doctors' and Dentists' Remuneration (DDRB)"),
-    ("rivers-agency", "Rivers Agency"),
-    ("roads-service", "Roads Service"),
-    ("rosemary-nelson-inquiry", "Rosemary Nelson Inquiry"),
-    ("royal-air-force-museum", "Royal Air Force Museum (RAFM)"),
-    ("royal-armouries-museum", "Royal Armouries Museum (RA)"),
-    ("royal-commission-on-criminal-justice", "Royal Commission on Criminal Justice"),
-    ("royal-commission-on-environmental-pollution", "Royal Commission on Environmental Pollution"),
-    ("royal-liverpool-childrens-inquiry", "Royal Liverpool Childrens Inquiry"),
-    ("royal-mail", "Royal Mail"),
-    ("royal-marines-museum", "Royal Marines Museum (RMM)"),
-    ("royal-mint", "Royal Mint (RM)"),
-    ("royal-mint-advisory-committee", "Royal Mint Advisory Committee (RMAC)"),
-    ("royal-museums-greenwich", "Royal Museums Greenwich (RMG)"),
-    ("royal-navy-submarine-museum", "Royal Navy Submarine Museum (RNSM)"),
-    ("royal-parks", "Royal Parks (Royal Parks)"),
-    ("royal-trustees-office", "Royal Trustees' Office"),
-    (
-        "rural-development-programme-for-england-network",
-        "Rural Development Programme for England Network (RDPE Network)",
-    ),
-    ("rural-payments-agency", "Rural Payments Agency (RPA)"),
-    ("s4c", "S4C (S4C)"),
-    ("salix-finance-ltd", "Salix Finance Ltd"),
-    ("school-food-trust", "School Food Trust (SFT)"),
-    ("school-teachers-review-body", "School Teachers' Review Body (STRB)"),
-    ("schools-commissioners-group", "Schools Commissioners Group"),
-    ("science-advisory-council", "Science Advisory Council (SAC)"),
-    ("science-and-technology-facilities-council", "Science and Technology Facilities Council (STFC)"),
-    ("science-museum-group", "Science Museum Group"),
-    (
-        "science-advisory-committee-on-the-medical-implications-of-less-lethal-weapons",
-        "Scientific Advisory Committee on the Medical Implications of Less-Lethal Weapons (SACMILL)",
-    ),
-    ("scientific-advisory-group-for-emergencies", "Scientific Advisory Group for Emergencies (SAGE)"),
-    ("scottish-arts-council", "Scottish Arts Council"),
-    ("scottish-hospital-trust", "Scottish Hospital Trust"),
-    ("scottish-law-commission", "Scottish Law Commission"),
-    ("scottish-office", "Scottish Office"),
-    ("scottish-screen", "Scottish Screen"),
-    ("scottish-sports-council", "Scottish Sports Council"),
-    ("seafish", "Seafish (Seafish)"),
-    ("secret-intelligence-service", "Secret Intelligence Service (SIS)"),
-    ("security-industry-authority", "Security Industry Authority (SIA)"),
-    ("security-vetting-appeals-panel", "Security Vetting Appeals Panel (SVAP)"),
-    ("sellafield-ltd", "Sellafield Ltd"),
-    ("senior-courts-costs-office", "Senior Courts Costs Office"),
-    ("review-body-on-senior-salaries", "Senior Salaries Review Body (SSRB)"),
-    ("sentence-review-commissioners", "Sentence Review Commissioners"),
-    ("the-sentencing-council-for-england-and-wales", "Sentencing Council for England and Wales (SC)"),
-    ("serious-fraud-office", "Serious Fraud Office (SFO)"),
-    ("serious-organised-crime-agency", "Serious Organised Crime Agency (SOCA)"),
-    ("service-children-s-education", "Service Children's Education (SCE)"),
-    ("service-complaints-commissioner", "Service Complaints Commissioner (SCC)"),
-    ("service-complaints-ombudsman", "Service Complaints Ombudsman "),
-    ("service-personnel-and-veterans-agency", "Service Personnel and Veterans Agency (SPVA)"),
-    ("service-prosecuting-authority", "Service Prosecuting Authority (SPA)"),
-    ("sheffield-forgemasters-international-ltd", "Sheffield Forgemasters International Ltd"),
-    ("shipman-inquiry", "Shipman Inquiry"),
-    ("single-source-regulations-office", "Single Source Regulations Office (SSRO)"),
-    ("sir-john-soane-s-museum", "Sir John Soane's Museum (Soane's)"),
-    ("sitpro", "SITPRO"),
-    ("skills-funding-agency", "Skills Funding Agency (SFA)"),
-    ("small-business-commissioner", "Small Business Commissioner (SBC)"),
-    ("social-mobility-and-child-poverty-commission", "Social Mobility and Child Poverty Commission (SMCP Commission)"),
-    ("social-mobility-commission", "Social Mobility Commission (SMC)"),
-    ("social-science-research-committee", "Social Science Research Committee (SSRC)"),
-    ("social-security-advisory-committee", "Social Security Advisory Committee (SSAC)"),
-    ("social-security-agency", "Social Security Agency"),
-    ("social-work-england", "Social Work England"),
-    ("south-bradford-education-action-zone", "South Bradford Education Action Zone"),
-    ("south-downs-national-park-authority", "South Downs National Park Authority (SDNP)"),
-    ("south-east-england-development-agency", "South East England Development Agency"),
-    ("south-east-england-virtual-education-action-zone", "South East England Virtual Education Action Zone"),
-    ("south-east-sheffield-education-action-zone", "South East Sheffield Education Action Zone"),
-    ("south-eastern-education-and-library-board", "South Eastern Education and Library Board"),
-    ("south-west-of-england-regional-development-agency", "South West of England Regional Development Agency"),
-    ("southend-education-action-zone", "Southend Education Action Zone"),
-    ("southern-health-and-social-services-board", "Southern Health and Social Services Board"),
-    ("special-eu-programmes-body", "Special EU Programmes Body"),
-    ("speke-garston-education-action-zone", "Speke Garston Education Action Zone"),
-    ("sport-england", "Sport England (SE)"),
-    ("sports-council-for-northern-ireland", "Sport Northern Ireland (Sports Council for Northern Ireland) (SportNI)"),
-    ("sports-council-for-wales", "Sports Council for Wales"),
-    ("sports-grounds-safety-authority", "Sports Grounds Safety Authority (SGSA)"),
-    ("stabilisation-unit", "Stabilisation Unit (SU)"),
-    ("staff-commission-for-education-and-library-boards", "Staff Commission for Education and Library Boards"),
-    ("standards-and-testing-agency", "Standards and Testing Agency (STA)"),
-    ("standards-board-for-england", "Standards Board for England"),
-    ("state-veterinary-service", "State Veterinary Service"),
-    ("statistics-commission", "Statistics Commission"),
-    ("stoke-education-action-zone", "Stoke Education Action Zone"),
-    ("strategic-command", "Strategic Command (UKStratCom)"),
-    ("strategic-rail-authority", "Strategic Rail Authority"),
-    ("student-loans-company", "Student Loans Company (SLC)"),
-    ("submarine-delivery-agency", "Submarine Delivery Agency (SDA)"),
-    ("subsidy-advice-unit", "Subsidy Advice Unit (SAU)"),
-    ("sunderland-education-action-zone", "Sunderland Education Action Zone"),
-    ("supreme-court-of-the-united-kingdom", "Supreme Court of the United Kingdom (SCUK)"),
-    ("surveillance-camera-commissioner", "Surveillance Camera Commissioner (SCC)"),
-    ("sutherland-inquiry", "Sutherland Inquiry"),
-    ("tate", "Tate (Tate)"),
-    ("teaching-regulation-agency", "Teaching Regulation Agency (TRA)"),
-    ("technical-advisory-board", "Technical Advisory Board (TAB)"),
-    ("technology-and-construction-court", "Technology and Construction Court"),
-    ("technology-strategy-board", "Technology Strategy Board"),
-    ("telford-and-wrekin-education-action-zone", "Telford and Wrekin Education Action Zone"),
-    ("tenant-services-authority", "Tenant Services Authority"),
-    ("the-adjudicator-s-office", "The Adjudicator’s Office"),
-    (
-        "the-advisory-council-on-national-records-and-archives",
-        "The Advisory Council on National Records and Archives (ACNRA)",
-    ),
-    ("the-business-and-property-courts", "The Business and Property Courts"),
-    ("the-business-list", "The Business List"),
-    ("charity-commission", "The Charity Commission (Charity Commission)"),
-    ("the-competition-list", "The Competition List"),
-    ("the-crown-estate", "The Crown Estate"),
-    ("the-electoral-commission", "The Electoral Commission"),
-    ("the-executive-office-northern-ireland", "The Executive Office (Northern Ireland)"),
-    ("the-financial-list", "The Financial List"),
-    ("the-food-and-environment-research-agency", "The Food and Environment Research Agency (Fera)"),
-    ("insolvency-service", "The Insolvency Service (the Insolvency Service)"),
-    ("the-intellectual-property-list", "The Intellectual Property List"),
-    ("jeffrey-review", "The Jeffrey Review"),
-    ("the-legal-ombudsman", "The Legal Ombudsman"),
-    ("mckay-commission", "The McKay Commission (TMC)"),
-    ("the-national-archives", "The National Archives"),
-    ("the-national-lottery-community-fund", "The National Lottery Community Fund"),
-    ("oil-and-pipelines-agency", "The Oil and Pipelines Agency (OPA)"),
-    (
-        "the-parliamentary-and-health-service-ombudsman",
-        "The Parliamentary and Health Service Ombudsman  (The Ombudsman)",
-    ),
-    ("pension-protection-fund-ombudsman", "The Pension Protection Fund Ombudsman (PPFO)"),
-    ("the-pensions-advisory-service", "The Pensions Advisory Service (TPAS)"),
-    ("pensions-ombudsman", "The Pensions Ombudsman (PO)"),
-    ("the-pensions-regulator", "The Pensions Regulator (TPR)"),
-    ("the-property-trusts-and-probate-list", "The Property, Trusts and Probate List"),
-    ("the-revenue-list", "The Revenue List"),
-    (
-        "the-reviewing-committee-on-the-export-of-works-of-art-and-objects-of-cultural-interest",
-        "The Reviewing Committee on the Export of Works of Art and Objects of Cultural Interest (RCEWA)",
-    ),
-    ("the-scottish-government", "The Scottish Government (The Scottish Government)"),
-    ("the-security-service-mi5", "The Security Service (MI5)"),
-    ("the-shareholder-executive", "The Shareholder Executive (ShEx)"),
-    ("the-theatres-trust", "The Theatres Trust (TTT)"),
-    ("the-water-services-regulation-authority", "The Water Services Regulation Authority  (Ofwat)"),
-    ("third-party-campaigning-review", "Third Party Campaigning Review (Third Party Campaigning Review)"),
-    ("thurrock-thames-gateway-development-corporation", "Thurrock Thames Gateway Development Corporation"),
-    ("trade-and-agriculture-commission", "Trade and Agriculture Commission (TAC)"),
-    ("trade-remedies-authority", "Trade Remedies Authority"),
-    ("trade-remedies-investigations-directorate", "Trade Remedies Investigations Directorate (TRID)"),
-    ("traffic-commissioners", "Traffic Commissioners for Great Britain (TC)"),
-    ("training-and-development-agency-for-schools", "Training and Development Agency for Schools (TDA)"),
-    ("transport-focus", "Transport Focus"),
-    ("treasure-valuation-committee", "Treasure Valuation Committee (TVC)"),
-    ("treasury-solicitor-s-department", "Treasury Solicitor’s Department (TSol)"),
-    ("tribunal-procedure-committee", "Tribunal Procedure Committee (TPC)"),
-    ("trinity-house", "Trinity House (TLS)"),
-    ("trust-ports", "Trust ports (TP)"),
-    ("uk-anti-doping", "UK Anti-Doping (UKAD)"),
-    ("uk-asset-resolution-limited", "UK Asset Resolution Limited (UKAR)"),
-    ("uk-atomic-energy-authority", "UK Atomic Energy Authority (UKAEA)"),
-    ("uk-border-agency", "UK Border Agency (UKBA)"),
-    ("uk-co-ordinating-body", "UK Co-ordinating Body (UKCB)"),
-    ("uk-commission-for-employment-and-skills", "UK Commission for Employment and Skills (UKCES)"),
-    ("uk-commission-on-covid-commemoration", "UK Commission on Covid Commemoration"),
-    ("uk-council-for-internet-safety", "UK Council for Internet Safety (UKCIS)"),
-    ("uk-debt-management-office", "UK Debt Management Office (DMO)"),
-    ("uk-defence-and-security-exports", "UK Defence and Security Exports (UKDSE)"),
-    ("uk-export-finance", "UK Export Finance (UKEF)"),
-    ("uk-film-council", "UK Film Council"),
-    ("uk-financial-investments-limited", "UK Financial Investments Limited (UKFI)"),
-    ("uk-government-decontamination-service", "UK Government Decontamination Service"),
-    ("uk-government-investments", "UK Government Investments (UKGI)"),
-    ("uk-green-investment-bank", "UK Green Investment Bank (GIB)"),
-    ("uk-health-security-agency", "UK Health Security Agency (UKHSA)"),
-    ("uk-holocaust-memorial-foundation", "UK Holocaust Memorial Foundation (UKHMF)"),
-    ("uk-hydrographic-office", "UK Hydrographic Office (UKHO)"),
-    ("uk-national-authority-for-counter-eavesdropping", "UK National Authority for Counter-Eavesdropping (UK NACE)"),
-    ("uk-national-contact-point", "UK National Contact Point (UK NCP)"),
-    ("uk-national-screening-committee", "UK National Screening Committee (UK NSC)"),
-    ("uk-passport-service", "UK Passport Service"),
-    ("uk-research-and-innovation", "UK Research and Innovation (UKRI)"),
-    ("uk-space-agency", "UK Space Agency"),
-    ("uk-sport", "UK Sport (UKSP)"),
-    ("uk-statistics-authority", "UK Statistics Authority (Statistics)"),
-    ("uk-trade-investment", "UK Trade & Investment (UKTI)"),
-    ("uk-transplant", "UK Transplant"),
-    ("uk-visas-and-immigration", "UK Visas and Immigration (UKVI)"),
-    ("ukti-education", "UKTI Education (UKTI Education)"),
-    ("ukti-life-sciences-organisation", "UKTI Life Sciences Organisation (UKTI LSO)"),
-    ("united-kingdom-blood-transfusion-services", "United Kingdom Blood Transfusion Services"),
-    ("united-kingdom-reserve-forces-association", "United Kingdom Reserve Forces Association (UKRFA)"),
-    ("united-kingdom-security-vetting", "United Kingdom Security Vetting (UKSV)"),
-    ("upper-tribunal-administrative-appeals-chamber", "Upper Tribunal (Administrative Appeals Chamber)"),
-    ("upper-tribunal-immigration-and-asylum-chamber", "Upper Tribunal (Immigration and Asylum Chamber)"),
-    ("upper-tribunal-lands-chamber", "Upper Tribunal (Lands Chamber)"),
-    ("upper-tribunal-tax-and-chancery-chamber", "Upper Tribunal (Tax and Chancery Chamber)"),
-    ("valuation-and-lands-agency", "Valuation and Lands Agency"),
-    ("valuation-office-agency", "Valuation Office Agency (VOA)"),
-    ("valuation-tribunal-for-england", "Valuation Tribunal for England  (VTE)"),
-    ("valuation-tribunal-service-for-england-valuation-tribunal-service", "Valuation Tribunal Service (VTS)"),
-    ("varney-review", "Varney Review"),
-    ("vehicle-and-operator-services-agency", "Vehicle and Operator Services Agency (VOSA)"),
-    ("vehicle-certification-agency", "Vehicle Certification Agency (VCA)"),
-    ("veterans-advisory-and-pensions-committees-x13", "Veterans Advisory and Pensions Committees (VAPC)"),
-    ("veterans-uk", "Veterans UK (Veterans UK )"),
-    ("veterinary-laboratories-agency", "Veterinary Laboratories Agency"),
-    ("veterinary-medicines-directorate", "Veterinary Medicines Directorate (VMD)"),
-    ("veterinary-products-committee", "Veterinary Products Committee (VPC)"),
-    ("veterinary-residues-committee", "Veterinary Residues Committee (VRC)"),
-    ("victim-s-advisory-panel", "Victims' Advisory Panel (VAP)"),
-    ("victims-commissioner", "Victims' Commissioner"),
-    ("victoria-and-albert-museum", "Victoria and Albert Museum (VAM)"),
-    ("victoria-climbi_-inquiry", "Victoria Climbié Inquiry"),
-    ("visitbritain", "VisitBritain (VB)"),
-    ("visitengland", "VisitEngland (VE)"),
-    ("wakefield-education-action-zone", "Wakefield Education Action Zone"),
-    ("wales-audit-office", "Wales Audit Office"),
-    ("wallace-collection", "Wallace Collection"),
-    ("warship-support-agency", "Warship Support Agency"),
-    ("water-service-northern-ireland", "Water Service (Northern Ireland)"),
-    ("waterways-ireland", "Waterways Ireland"),
-    ("wave-hub", "Wave Hub"),
-    ("wednesbury-education-action-zone", "Wednesbury Education Action Zone"),
-    ("welsh-development-agency", "Welsh Development Agency"),
-    ("welsh-government", "Welsh Government"),
-    ("welsh-language-commissioner", "Welsh Language Commissioner"),
-    ("welsh-office", "Welsh Office"),
-    ("the-west-northamptonshire-development-corporation", "West Northamptonshire Development Corporation (WNDC)"),
-    ("western-education-and-library-board", "Western Education and Library Board"),
-    ("western-health-and-social-services-board", "Western Health and Social Services Board"),
-    ("westminster-education-action-zone", "Westminster Education Action Zone"),
-    ("westminster-foundation-for-democracy", "Westminster Foundation for Democracy"),
-    ("wilton-park", "Wilton Park (Wilton Park)"),
-    ("windrush-commemoration-committee", "Windrush Commemoration Committee"),
-    (
-        "withernsea-and-southern-holderness-education-action-zone",
-        "Withernsea and Southern Holderness Education Action Zone",
-    ),
-    ("wolverhampton-education-action-zone", "Wolverhampton Education Action Zone"),
-    ("working-ventures-uk", "Working Ventures UK"),
-    ("wythenshawe-education-action-zone", "Wythenshawe Education Action Zone"),
-    ("yorkshire-dales-national-park-authority", "Yorkshire Dales National Park Authority (YDNP)"),
-    ("yorkshire-forward", "Yorkshire Forward"),
-    ("young-peoples-learning-agency", "Young People's Learning Agency (YPLA)"),
-    ("youth-custody-service", "Youth Custody Service (YCS)"),
-    ("youth-justice-agency-of-northern-ireland", "Youth Justice Agency of Northern Ireland"),
-    ("youth-justice-board-for-england-and-wales", "Youth Justice Board for England and Wales (YJB)"),
-    ("zahid-mubarek-inquiry", "Zahid Mubarek Inquiry"),
-)
-Organisation = utils.Choices("Organisation", org_tuples)
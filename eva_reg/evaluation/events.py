@@ -0,0 +1,100 @@
+"""
+Where the audit events recorded by @register_event are written.
+
+The synchronous sink saves each event as it happens. The buffered sink collects the events of a transaction and
+writes them with one bulk_create when it commits, so facade calls don't each pay for an INSERT. Events from a
+rolled back transaction or savepoint are dropped, as they would be by the synchronous sink.
+"""
+
+import datetime
+import functools
+import logging
+import threading
+
+from django.conf import settings
+from django.db import DatabaseError, connection, transaction
+from django.utils import timezone
+
+from . import models
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PRUNE_BATCH_SIZE = 10000
+
+_pending = threading.local()
+
+
+def _get_committed_events():
+    if not hasattr(_pending, "committed_events"):
+        _pending.committed_events = []
+    return _pending.committed_events
+
+
+class SynchronousEventSink:
+    def record(self, name, data):
+        models.Event(name=name, data=data).save()
+
+
+class BufferedEventSink:
+    """
+    Each event recorded in a transaction gets its own commit callback, which Django drops if the transaction or
+    savepoint it was recorded in is rolled back. The callbacks collect the committed events, and the latest event's
+    callback writes them all. If the latest event was rolled back, the others are written with the next commit
+    (or the next event recorded outside a transaction) instead.
+    """
+
+    def record(self, name, data):
+        event = models.Event(name=name, data=data)
+        if not connection.in_atomic_block:
+            _get_committed_events().append(event)
+            self.flush()
+            return
+
+        _pending.latest_event = event
+        transaction.on_commit(functools.partial(self._commit, event))
+
+    def _commit(self, event):
+        _get_committed_events().append(event)
+        if event is getattr(_pending, "latest_event", None):
+            self.flush()
+
+    def flush(self):
+        """
+        Write the committed events. The changes they record have already been committed, so a failure is logged
+        rather than raised.
+        """
+        committed_events = _get_committed_events()
+        events = list(committed_events)
+        committed_events.clear()
+        _pending.latest_event = None
+        try:
+            models.Event.objects.bulk_create(events)
+        except DatabaseError:
+            logger.exception("Couldn't write %s events", len(events))
+
+
+EVENT_SINKS = {
+    "synchronous": SynchronousEventSink,
+    "buffered": BufferedEventSink,
+}
+
+
+def get_event_sink():
+    return EVENT_SINKS[settings.EVENT_SINK]()
+
+
+def prune_events(days, batch_size=DEFAULT_PRUNE_BATCH_SIZE):
+    """
+    Delete events older than days, oldest first, in batches so no one transaction holds locks for long.
+    Returns the number deleted.
+    """
+    cutoff = timezone.now() - datetime.timedelta(days=days)
+    old_events = models.Event.objects.filter(created_at__lt=cutoff).order_by("id")
+    total_deleted = 0
+    while True:
+        with transaction.atomic():
+            event_ids = list(old_events.values_list("id", flat=True)[:batch_size])
+            if not event_ids:
+                return total_deleted
+            deleted, _ = models.Event.objects.filter(id__in=event_ids).delete()
+        total_deleted += deleted
@@ -0,0 +1,203 @@
+import csv
+import json
+import pathlib
+import tempfile
+import uuid
+import zipfile
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import JSONField, prefetch_related_objects
+
+from .models import Evaluation
+from .schemas import EVALUATION_SCHEMA_PREFETCH, EvaluationSchema
+
+EXPORT_CHUNK_SIZE = 200
+
+
+def iter_evaluation_chunks(qs, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Read the queryset through a server-side cursor, yielding lists of evaluations with their
+    related objects prefetched, so only one chunk is held in memory at a time
+    """
+    chunk = []
+    for evaluation in qs.iterator(chunk_size=chunk_size):
+        chunk.append(evaluation)
+        if len(chunk) == chunk_size:
+            prefetch_related_objects(chunk, *EVALUATION_SCHEMA_PREFETCH)
+            yield chunk
+            chunk = []
+    if chunk:
+        prefetch_related_objects(chunk, *EVALUATION_SCHEMA_PREFETCH)
+        yield chunk
+
+
+def iter_dumped_evaluations(qs, chunk_size=EXPORT_CHUNK_SIZE):
+    evaluation_schema = EvaluationSchema()
+    for chunk in iter_evaluation_chunks(qs, chunk_size):
+        yield from evaluation_schema.dump(chunk, many=True)
+
+
+class Echo:
+    """
+    File-like object that returns what is written, so csv.writer can produce lines for a streaming response
+    """
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(qs, chunk_size=EXPORT_CHUNK_SIZE):
+    rows = iter_dumped_evaluations(qs, chunk_size)
+    first_row = next(rows, None)
+    # TODO - do we want only selected fields, and in what order?
+    fieldnames = list(first_row.keys()) if first_row else []
+    writer = csv.DictWriter(Echo(), fieldnames=fieldnames)
+    yield writer.writeheader()
+    if first_row is None:
+        return
+    yield writer.writerow(first_row)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def iter_json(qs, chunk_size=EXPORT_CHUNK_SIZE):
+    yield "["
+    for index, row in enumerate(iter_dumped_evaluations(qs, chunk_size)):
+        separator = ", " if index else ""
+        yield f"{separator}{json.dumps(row)}"
+    yield "]"
+
+
+# Columnar exports write one table per model, with related objects linked by evaluation_id
+
+COLUMNAR_EXCLUDED_FIELDS = {"search_text", "search_vector"}
+
+ARROW_TYPES = {
+    "BooleanField": pa.bool_(),
+    "CharField": pa.string(),
+    "DateField": pa.date32(),
+    "DateTimeField": pa.timestamp("us", tz="UTC"),
+    "FloatField": pa.float64(),
+    "ForeignKey": pa.string(),
+    "PositiveIntegerField": pa.int64(),
+    "TextField": pa.string(),
+    "UUIDField": pa.string(),
+}
+
+# Only email is included in other exports, so that's all that is written for users
+USERS_SCHEMA = pa.schema([("evaluation_id", pa.string()), ("email", pa.string())])
+
+
+def is_list_field(field):
+    return isinstance(field, JSONField) and field.default is list
+
+
+def get_columnar_fields(model):
+    return [field for field in model._meta.concrete_fields if field.name not in COLUMNAR_EXCLUDED_FIELDS]
+
+
+def get_arrow_type(field):
+    if is_list_field(field):
+        return pa.list_(pa.string())
+    if isinstance(field, JSONField):
+        return pa.string()
+    return ARROW_TYPES[field.get_internal_type()]
+
+
+def get_arrow_schema(model):
+    return pa.schema([(field.attname, get_arrow_type(field)) for field in get_columnar_fields(model)])
+
+
+def to_arrow_value(field, value):
+    if value is None:
+        return None
+    if is_list_field(field):
+        return [str(item) for item in value]
+    if isinstance(field, JSONField):
+        return json.dumps(value, cls=DjangoJSONEncoder)
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def make_row(obj, fields):
+    return {field.attname: to_arrow_value(field, field.value_from_object(obj)) for field in fields}
+
+
+def get_related_tables():
+    """
+    Table name -> model for every related object included in the export, except users
+    """
+    return {
+        related_name: Evaluation._meta.get_field(related_name).related_model
+        for related_name in EVALUATION_SCHEMA_PREFETCH
+        if related_name != "users"
+    }
+
+
+def iter_record_batches(qs, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yield a dict of table name -> pyarrow.RecordBatch for each chunk of evaluations
+    """
+    evaluation_fields = get_columnar_fields(Evaluation)
+    related_tables = get_related_tables()
+    related_fields = {name: get_columnar_fields(model) for name, model in related_tables.items()}
+    for chunk in iter_evaluation_chunks(qs, chunk_size):
+        batches = {
+            "evaluations": pa.RecordBatch.from_pylist(
+                [make_row(evaluation, evaluation_fields) for evaluation in chunk], schema=get_arrow_schema(Evaluation)
+            ),
+            "users": pa.RecordBatch.from_pylist(
+                [
+                    {"evaluation_id": str(evaluation.id), "email": user.email}
+                    for evaluation in chunk
+                    for user in evaluation.users.all()
+                ],
+                schema=USERS_SCHEMA,
+            ),
+        }
+        for name, model in related_tables.items():
+            rows = [
+                make_row(related_object, related_fields[name])
+                for evaluation in chunk
+                for related_object in getattr(evaluation, name).all()
+            ]
+            batches[name] = pa.RecordBatch.from_pylist(rows, schema=get_arrow_schema(model))
+        yield batches
+
+
+def get_table_schemas():
+    schemas = {"evaluations": get_arrow_schema(Evaluation), "users": USERS_SCHEMA}
+    schemas.update({name: get_arrow_schema(model) for name, model in get_related_tables().items()})
+    return schemas
+
+
+COLUMNAR_FORMATS = {
+    "parquet": pq.ParquetWriter,
+    "arrow": pa.ipc.new_file,
+}
+
+
+def write_columnar_zip(qs, columnar_format, output_file, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Write a zip of Parquet or Arrow IPC files, one per table, to output_file.
+    Each chunk of evaluations is appended to the tables as it is read, so the whole export isn't held in memory.
+    """
+    make_writer = COLUMNAR_FORMATS[columnar_format]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = {name: pathlib.Path(temp_dir) / f"{name}.{columnar_format}" for name in get_table_schemas()}
+        writers = {name: make_writer(str(paths[name]), schema) for name, schema in get_table_schemas().items()}
+        try:
+            for batches in iter_record_batches(qs, chunk_size):
+                for name, batch in batches.items():
+                    writers[name].write_table(pa.Table.from_batches([batch]))
+        finally:
+            for writer in writers.values():
+                writer.close()
+        with zipfile.ZipFile(output_file, "w", compression=zipfile.ZIP_DEFLATED) as zip_file:
+            for path in paths.values():
+                zip_file.write(path, arcname=path.name)
+    output_file.seek(0)
+    return output_file
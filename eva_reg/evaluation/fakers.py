@@ -7,7 +7,7 @@ import random
 
 import faker
 
-from . import choices, enums, models
+from . import choices, models
 from .pages import get_default_page_statuses
 
 fake = faker.Faker()
@@ -57,7 +57,7 @@ def generate_organisations():
     num_organisations = random.randint(0, 4)
     set_organisations = set()
     for i in range(num_organisations):
-        set_organisations.add(random.choice(enums.Organisation.values))
+        set_organisations.add(random.choice(models.get_organisations().values))
     return list(set_organisations)
 
 
@@ -1,6 +1,6 @@
 import marshmallow
 
-from . import models, schemas
+from . import loader, models, schemas
 from .utils import Entity, Facade, register_event, with_schema
 
 
@@ -10,6 +10,7 @@ class CreateEvaluationSchema(marshmallow.Schema):
 
 class GetEvaluationSchema(marshmallow.Schema):
     evaluation_id = marshmallow.fields.UUID()
+    fields = marshmallow.fields.List(marshmallow.fields.Str(), allow_none=True)
 
 
 class UpdateEvaluationSchema(marshmallow.Schema):
@@ -25,6 +26,13 @@ class UpdateEvaluationVisibilitySchema(marshmallow.Schema):
     status = marshmallow.fields.Str()
 
 
+class UpdatePageStatusResponseSchema(marshmallow.Schema):
+    evaluation_id = marshmallow.fields.UUID()
+    page_name = marshmallow.fields.Str()
+    status = marshmallow.fields.Str()
+    updated = marshmallow.fields.Boolean()
+
+
 class AddUserToEvaluationSchema(marshmallow.Schema):
     user_id = marshmallow.fields.UUID()  # User making request
     evaluation_id = marshmallow.fields.UUID()
@@ -54,10 +62,19 @@ class Evaluation(Entity):
         evaluation.save()
         return evaluation
 
-    @with_schema(load=GetEvaluationSchema, dump=schemas.EvaluationSchema)
-    def get(self, evaluation_id):
-        evaluation = models.Evaluation.objects.get(id=evaluation_id)
-        return evaluation
+    @with_schema(load=GetEvaluationSchema, dump=schemas.EvaluationSchema, only_argument="fields")
+    def get(self, evaluation_id, fields=None):
+        """
+        Pass fields to load and dump only those fields, e.g. for a page that only shows the title
+        """
+        if not fields:
+            return loader.get_evaluation(evaluation_id, prefetch=schemas.EVALUATION_SCHEMA_PREFETCH)
+        model_field_names = {field.name for field in models.Evaluation._meta.concrete_fields}
+        return loader.get_evaluation(
+            evaluation_id,
+            prefetch=[name for name in fields if name in schemas.EVALUATION_SCHEMA_PREFETCH],
+            only=[name for name in fields if name in model_field_names],
+        )
 
     @with_schema(load=UpdateEvaluationSchema(partial=True), dump=schemas.EvaluationSchema)
     @register_event("Evaluation updated")
@@ -68,12 +85,14 @@ class Evaluation(Entity):
         evaluation.save()
         return evaluation
 
-    @with_schema(load=UpdateEvaluationVisibilitySchema, dump=schemas.EvaluationSchema)
+    @with_schema(load=UpdateEvaluationVisibilitySchema, dump=UpdatePageStatusResponseSchema)
     def update_page_status(self, user_id, evaluation_id, page_name, status):
-        evaluation = models.Evaluation.objects.get(id=evaluation_id, users__id=user_id)
-        evaluation.update_evaluation_page_status(page_name, status)
-        evaluation.save()
-        return evaluation
+        updated = models.set_page_status(evaluation_id, page_name, status, user_id=user_id)
+        evaluation = loader.get_loaded_evaluation(evaluation_id)
+        if updated and evaluation:
+            evaluation.page_statuses = {**evaluation.page_statuses, page_name: status}
+        output = {"evaluation_id": evaluation_id, "page_name": page_name, "status": status, "updated": updated}
+        return output
 
     @with_schema(load=AddUserToEvaluationSchema, dump=AddUserToEvaluationResponseSchema)
     @register_event("User added to evaluation")
@@ -83,6 +102,7 @@ class Evaluation(Entity):
             email=user_to_add_data["email"], defaults=user_to_add_data
         )
         evaluation.users.add(user_added)
+        loader.forget(evaluation_id)
         output = {"evaluation_id": evaluation_id, "user_added_id": user_added.id, "is_new_user": is_new_user}
         return output
 
@@ -92,6 +112,7 @@ class Evaluation(Entity):
         evaluation = models.Evaluation.objects.get(id=evaluation_id)
         user_to_remove = models.User.objects.get(id=user_to_remove_id)
         evaluation.users.remove(user_to_remove)
+        loader.forget(evaluation_id)
         return evaluation.users.all()
 
 
@@ -0,0 +1,80 @@
+"""
+Request-scoped identity map for evaluations.
+
+The permission decorators, the facade and the templates all need the evaluation a request is about.
+Within a request (see evaluation_loader_middleware) they share one instance per evaluation, loaded with its users
+and any other related collections the callers ask for. Outside a request, e.g. in commands and tests,
+every call loads the evaluation afresh.
+
+Saving an evaluation, or any of its related objects, forgets the loaded instance so later callers see the change.
+"""
+
+import contextvars
+
+from django.db.models import prefetch_related_objects
+
+from . import models
+
+_loaded = contextvars.ContextVar("loaded_evaluations", default=None)
+
+
+class LoadedEvaluation:
+    def __init__(self, evaluation, prefetched):
+        self.evaluation = evaluation
+        self.prefetched = set(prefetched)
+
+
+def get_evaluation(evaluation_id, prefetch=(), only=None):
+    """
+    Return the evaluation with its users and the related collections in prefetch already loaded,
+    raising Evaluation.DoesNotExist if there isn't one.
+
+    Callers that will only read some fields can pass them as only. If the evaluation hasn't been loaded yet
+    in this request, just those fields (and the prefetch collections, without users) are loaded, and the
+    partly loaded evaluation isn't kept for other callers.
+    """
+    loaded_evaluations = _loaded.get()
+    key = str(evaluation_id)
+    loaded = loaded_evaluations.get(key) if loaded_evaluations is not None else None
+    if only is not None and loaded is None:
+        return models.Evaluation.objects.only(*only).prefetch_related(*prefetch).get(pk=evaluation_id)
+
+    prefetch = ("users",) + tuple(prefetch)
+    if loaded_evaluations is None:
+        return models.Evaluation.objects.prefetch_related(*prefetch).get(pk=evaluation_id)
+    if loaded is None:
+        evaluation = models.Evaluation.objects.prefetch_related(*prefetch).get(pk=evaluation_id)
+        loaded_evaluations[key] = LoadedEvaluation(evaluation, prefetch)
+        return evaluation
+
+    missing = [related_name for related_name in prefetch if related_name not in loaded.prefetched]
+    if missing:
+        prefetch_related_objects([loaded.evaluation], *missing)
+        loaded.prefetched.update(missing)
+    return loaded.evaluation
+
+
+def get_loaded_evaluation(evaluation_id):
+    """
+    The evaluation if it has already been loaded in this request, otherwise None
+    """
+    loaded_evaluations = _loaded.get() or {}
+    loaded = loaded_evaluations.get(str(evaluation_id))
+    return loaded and loaded.evaluation
+
+
+def forget(evaluation_id):
+    loaded_evaluations = _loaded.get()
+    if loaded_evaluations:
+        loaded_evaluations.pop(str(evaluation_id), None)
+
+
+def evaluation_loader_middleware(get_response):
+    def middleware(request):
+        token = _loaded.set({})
+        try:
+            return get_response(request)
+        finally:
+            _loaded.reset(token)
+
+    return middleware
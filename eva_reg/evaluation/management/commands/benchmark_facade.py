@@ -0,0 +1,55 @@
+import concurrent.futures
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+
+from eva_reg.evaluation import interface, models, schemas, utils
+
+
+@utils.with_schema(load=interface.GetEvaluationSchema, dump=schemas.EvaluationSchema, only_argument="fields")
+def get_in_memory_evaluation(evaluation_id, fields=None):
+    return models.Evaluation(id=evaluation_id, title="Benchmark evaluation", evaluation_type=["IMPACT"])
+
+
+def call_facade(calls, fields):
+    evaluation_id = str(uuid.uuid4())
+    for _ in range(calls):
+        get_in_memory_evaluation(evaluation_id, fields=fields)
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the overhead of a with_schema facade call (argument binding, schema load and dump) "
+        "without touching the database, from several threads at once"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("-t", "--threads", type=int, default=8, help="Threads to call from, waitress uses 8")
+        parser.add_argument("-n", "--calls", type=int, default=2000, help="Calls per thread")
+        parser.add_argument(
+            "-f",
+            "--fields",
+            nargs="+",
+            default=["id", "title", "page_statuses", "evaluation_type"],
+            help="Evaluation fields to dump, related object fields would query the database",
+        )
+
+    def handle(self, *args, **kwargs):
+        threads = kwargs["threads"]
+        calls = kwargs["calls"]
+        fields = kwargs["fields"]
+
+        call_facade(1, fields)  # Warm up
+        start = time.perf_counter()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+            futures = [executor.submit(call_facade, calls, fields) for _ in range(threads)]
+            for future in futures:
+                future.result()
+        elapsed = time.perf_counter() - start
+
+        total_calls = threads * calls
+        print(  # noqa: T201
+            f"{total_calls} calls from {threads} threads in {elapsed:.2f}s: "
+            f"{total_calls / elapsed:.0f} calls/s, {elapsed / total_calls * 1e6:.1f}us per call"
+        )
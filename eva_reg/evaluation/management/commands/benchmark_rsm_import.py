@@ -0,0 +1,154 @@
+import contextlib
+import csv
+import io
+import pathlib
+import random
+import resource
+import tempfile
+import time
+
+import openpyxl
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from . import upload_rsm_data
+
+derived_headers = (
+    "Process",
+    "Impact",
+    "Economic",
+    "Other evaluation type (please state)",
+    "Time point of intesest (Month)",
+    "Time point of intesest (Year)",
+)
+
+
+def get_header_entries():
+    header_entries = {}
+    for field_headers in (
+        upload_rsm_data.evaluation_headers,
+        upload_rsm_data.outcome_measure_headers,
+        upload_rsm_data.other_measure_headers,
+        upload_rsm_data.intervention_headers,
+        upload_rsm_data.evaluation_cost_headers,
+        upload_rsm_data.processes_and_standards_headers,
+        *upload_rsm_data.links_headers,
+    ):
+        header_entries.update(field_headers)
+    return header_entries
+
+
+def make_value(rng, header, header_entry):
+    data_type = header_entry["data_type"]
+    if data_type == "str":
+        return f"{header} {rng.randrange(1000)}"
+    if data_type == "int":
+        return str(rng.randrange(1, 1000))
+    return rng.choice(list(data_type)).label
+
+
+def make_rsm_rows(number_of_rows, rows_per_evaluation, rng):
+    """
+    Rows in the RSM layout, headers first, each evaluation has rows_per_evaluation rows split across two reports
+    """
+    header_entries = get_header_entries()
+    yield ["Evaluation ID", "Report ID", *header_entries, *derived_headers]
+    for i in range(number_of_rows):
+        evaluation_id = i // rows_per_evaluation + 1
+        report_id = evaluation_id * 10 + i % 2
+        row = [str(evaluation_id), str(report_id)]
+        row += [make_value(rng, header, header_entry) for header, header_entry in header_entries.items()]
+        row += [rng.choice(("Y", "N")), rng.choice(("Y", "N")), rng.choice(("Y", "N")), "N", "Feb", "2014"]
+        yield row
+
+
+def change_rows(rows, changed_every):
+    """
+    Changes the first value of one report of every changed_every-th evaluation, as if it had been corrected
+    """
+    yield next(rows)
+    for row in rows:
+        if int(row[0]) % changed_every == 0 and int(row[1]) % 2:
+            row = [*row[:2], f"{row[2]} (changed)", *row[3:]]
+        yield row
+
+
+def write_rsm_file(path, rows):
+    if path.suffix == ".xlsx":
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet = workbook.create_sheet()
+        for row in rows:
+            sheet.append(row)
+        workbook.save(path)
+    else:
+        with path.open("w", newline="") as rsm_file:
+            csv.writer(rsm_file).writerows(rows)
+
+
+class QueryCounter:
+    """
+    Counts queries without keeping them, as capturing them would keep the SQL of every bulk insert in memory
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class Command(BaseCommand):
+    help = (
+        "Time importing a synthetic RSM file with upload_rsm_data. "
+        "The evaluations are created in a transaction that is rolled back afterwards"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("-r", "--rows", type=int, default=10000, help="Rows in the file")
+        parser.add_argument("-p", "--rows-per-evaluation", type=int, default=5, help="Rows for each evaluation")
+        parser.add_argument("-x", "--xlsx", action="store_true", help="Import an xlsx file rather than a CSV")
+        parser.add_argument("-w", "--workers", type=int, default=1, help="Processes to transform the evaluations with")
+        parser.add_argument(
+            "-u",
+            "--update",
+            type=int,
+            default=0,
+            help="Then time re-importing the file with --update, after changing every Nth evaluation",
+        )
+
+    def handle(self, *args, **kwargs):
+        rng = random.Random(0)
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory) / ("rsm.xlsx" if kwargs["xlsx"] else "rsm.csv")
+            write_rsm_file(path, make_rsm_rows(kwargs["rows"], kwargs["rows_per_evaluation"], rng))
+
+            with transaction.atomic():
+                query_counter = QueryCounter()
+                with connection.execute_wrapper(query_counter), contextlib.redirect_stdout(io.StringIO()):
+                    start = time.perf_counter()
+                    imported = upload_rsm_data.import_evaluations_from_file(path, kwargs["workers"])
+                    elapsed = time.perf_counter() - start
+
+                if kwargs["update"]:
+                    rng = random.Random(0)
+                    rows = make_rsm_rows(kwargs["rows"], kwargs["rows_per_evaluation"], rng)
+                    write_rsm_file(path, change_rows(rows, kwargs["update"]))
+                    update_query_counter = QueryCounter()
+                    with connection.execute_wrapper(update_query_counter), contextlib.redirect_stdout(io.StringIO()):
+                        start = time.perf_counter()
+                        updated = upload_rsm_data.import_evaluations_from_file(path, kwargs["workers"], update=True)
+                        update_elapsed = time.perf_counter() - start
+                transaction.set_rollback(True)
+
+        # Kilobytes on Linux, generating the file streams so this is the peak during the import
+        peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(  # noqa: T201
+            f"Imported {imported} evaluations from {kwargs['rows']} rows in {elapsed:.2f}s with {query_counter.count} queries: "
+            f"{elapsed / imported * 1000:.1f}ms per evaluation, peak memory {peak_memory:.0f}MB"
+        )
+        if kwargs["update"]:
+            print(  # noqa: T201
+                f"Re-imported with --update in {update_elapsed:.2f}s with {update_query_counter.count} queries, "
+                f"{updated} of {imported} evaluations changed"
+            )
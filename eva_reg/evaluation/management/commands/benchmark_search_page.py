@@ -0,0 +1,58 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import RequestFactory
+
+from eva_reg.evaluation import choices, models, views
+
+
+class Command(BaseCommand):
+    help = (
+        "Time rendering the search page when every result is tagged with many organisations. "
+        "The evaluations and user are created in a transaction that is rolled back afterwards"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("-e", "--evaluations", type=int, default=20, help="Evaluations to create, a page is 20")
+        parser.add_argument("-o", "--organisations", type=int, default=100, help="Organisations per evaluation")
+        parser.add_argument("-n", "--renders", type=int, default=50, help="Times to render the page")
+
+    def handle(self, *args, **kwargs):
+        rng = random.Random(0)
+        with transaction.atomic():
+            user = models.User(email="benchmark-search-page@example.com")
+            user.save()
+            evaluations = [
+                models.Evaluation(
+                    title=f"Benchmark evaluation {i}",
+                    visibility=choices.EvaluationVisibility.PUBLIC.value,
+                    organisations=rng.sample(models.get_organisations().values, kwargs["organisations"]),
+                )
+                for i in range(kwargs["evaluations"])
+            ]
+            for evaluation in evaluations:
+                evaluation.save()
+
+            request = RequestFactory().get("/search/")
+            request.user = user
+            views.EvaluationSearchView(request)  # Warm up
+            start = time.perf_counter()
+            for _ in range(kwargs["renders"]):
+                views.EvaluationSearchView(request)
+            elapsed = time.perf_counter() - start
+            transaction.set_rollback(True)
+
+        # The search text includes the display name of every organisation, so this times the choice lookups alone
+        start = time.perf_counter()
+        for evaluation in evaluations:
+            evaluation.get_own_search_text()
+        search_text_elapsed = time.perf_counter() - start
+
+        renders = kwargs["renders"]
+        print(f"{renders} renders in {elapsed:.2f}s: {elapsed / renders * 1000:.1f}ms per render")  # noqa: T201
+        print(  # noqa: T201
+            f"Search text for {len(evaluations)} evaluations in {search_text_elapsed * 1000:.1f}ms: "
+            f"{search_text_elapsed / len(evaluations) * 1000:.2f}ms per evaluation"
+        )
@@ -0,0 +1,28 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from eva_reg.evaluation import snapshots
+
+
+class Command(BaseCommand):
+    help = "Write the public and civil service data downloads to the database, to be served by the data download page"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--watch", action="store_true", help="Keep running, rebuilding snapshots when they are out of date"
+        )
+        parser.add_argument("-s", "--sleep", type=float, default=60.0, help="Seconds between checks with --watch")
+
+    def handle(self, *args, **kwargs):
+        storage = snapshots.SnapshotStorage()
+        if not kwargs["watch"]:
+            filenames = snapshots.build_snapshots(storage)
+            print(f"Wrote {len(filenames)} snapshots")  # noqa: T201
+            return
+
+        while True:
+            filenames = snapshots.build_snapshots(storage, stale_only=True)
+            if filenames:
+                print(f"Rebuilt {', '.join(filenames)}")  # noqa: T201
+            time.sleep(kwargs["sleep"])
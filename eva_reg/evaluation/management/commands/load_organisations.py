@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from eva_reg.evaluation import models, organisations
+
+
+class Command(BaseCommand):
+    help = "Add or rename organisations from data/organisations.json, see scripts/scrape_organisations.py"
+
+    def add_arguments(self, parser):
+        parser.add_argument("-f", "--filename", type=str, help="File to load (default data/organisations.json)")
+
+    def handle(self, *args, **kwargs):
+        created, updated = organisations.load_organisations(
+            models.Organisation, kwargs["filename"] or organisations.DATA_PATH
+        )
+        linked = organisations.link_evaluations(models.Evaluation, created)
+        models.forget_organisations()
+        print(  # noqa: T201
+            f"Created {len(created)} and renamed {len(updated)} organisations, and added {linked} links from evaluations "
+            f"to the new ones. Web servers show the changes within {models.ORGANISATIONS_CACHE_SECONDS} seconds"
+        )
@@ -0,0 +1,20 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from eva_reg.evaluation import events
+
+
+class Command(BaseCommand):
+    help = "Delete audit events older than the retention period, keeping the events table small"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-d", "--days", type=int, default=settings.EVENT_RETENTION_DAYS, help="Keep events from the last N days"
+        )
+        parser.add_argument(
+            "-b", "--batch-size", type=int, default=events.DEFAULT_PRUNE_BATCH_SIZE, help="Events per delete"
+        )
+
+    def handle(self, *args, **kwargs):
+        deleted = events.prune_events(kwargs["days"], kwargs["batch_size"])
+        print(f"Deleted {deleted} events")  # noqa: T201
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from eva_reg.evaluation import models, search_index
+
+
+class Command(BaseCommand):
+    help = "Recreate the search fragments for every evaluation and queue them for reindexing"
+
+    def handle(self, *args, **kwargs):
+        for evaluation in models.Evaluation.objects.iterator(chunk_size=100):
+            with transaction.atomic():
+                search_index.rebuild_fragments(evaluation)
+                search_index.enqueue([evaluation.id])
+        print(f"Queued {models.Evaluation.objects.count()} evaluations for reindexing")  # noqa: T201
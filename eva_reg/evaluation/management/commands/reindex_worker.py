@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from eva_reg.evaluation import search_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the search text of evaluations queued for reindexing"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-b", "--batch-size", type=int, default=search_index.DEFAULT_BATCH_SIZE, help="Evaluations per batch"
+        )
+        parser.add_argument("-s", "--sleep", type=float, default=2.0, help="Seconds to wait when the queue is empty")
+        parser.add_argument("--once", action="store_true", help="Drain the queue then exit")
+
+    def handle(self, *args, **kwargs):
+        batch_size = kwargs["batch_size"]
+
+        if kwargs["once"]:
+            processed = search_index.process_queue(batch_size)
+            print(f"Reindexed {processed} evaluations")  # noqa: T201
+            return
+
+        while True:
+            processed = search_index.process_batch(batch_size)
+            if processed:
+                print(f"Reindexed {processed} evaluations")  # noqa: T201
+            else:
+                time.sleep(kwargs["sleep"])
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from eva_reg.evaluation import models
+
+
+class Command(BaseCommand):
+    help = "Recompute the stored search vector for every evaluation"
+
+    def handle(self, *args, **kwargs):
+        number_updated = models.Evaluation.objects.update(search_vector=models.get_search_vector())
+        print(f"Updated search vectors for {number_updated} evaluations")  # noqa: T201
@@ -1,21 +1,39 @@
+import collections
+import concurrent.futures
+import contextlib
 import csv
+import hashlib
+import itertools
+import json
+import operator
 import os
 import pathlib
 import sys
 from collections import defaultdict
 from datetime import datetime
 
+import django
 import httpx
 import openpyxl
 from django.conf import settings
 from django.core.exceptions import FieldDoesNotExist, ValidationError
-from django.core.management.base import BaseCommand
-from django.db import DataError
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DatabaseError, transaction
+from django.db.models import CharField
 
-from eva_reg.evaluation import choices, models
+from eva_reg.evaluation import choices, models, search_index
 
 DATA_DIR = settings.BASE_DIR / "temp-data"
 CHUNK_SIZE = 16 * 1024
+# Evaluations built in memory before they are written, and rows per INSERT
+IMPORT_BATCH_SIZE = 100
+BULK_CREATE_BATCH_SIZE = 1000
+# Evaluations sent to each worker process that haven't been written yet
+IN_FLIGHT_PER_WORKER = 4
+# Part of every hash of the imported rows, change it when the transformation changes so that
+# upload_rsm_data --update applies the new transformation to rows that haven't changed
+TRANSFORM_VERSION = 1
 
 
 # Ensure all data matching maps are in lower case for lower matches
@@ -896,16 +914,50 @@ all_headers = (
     + list(key for key in processes_and_standards_headers.keys())
 )
 
+# The evaluation fields that are set from the file, which upload_rsm_data --update copies onto existing evaluations
+imported_evaluation_fields = [entry["field_name"] for entry in evaluation_headers.values()]
+imported_evaluation_fields += [
+    f"{field_name}_other"
+    for field_name in imported_evaluation_fields
+    if hasattr(models.Evaluation, f"{field_name}_other")
+]
+imported_evaluation_fields += [
+    "issue_description_option",
+    "ethics_option",
+    "grants_option",
+    "evaluation_type",
+    "evaluation_type_other",
+    "sample_size_details",
+]
+
+# The related objects that build_evaluation creates
+imported_related_models = (
+    models.Intervention,
+    models.LinkOtherService,
+    models.OutcomeMeasure,
+    models.OtherMeasure,
+    models.EvaluationCost,
+    models.ProcessStandard,
+)
+
 
 class Command(BaseCommand):
     help = "Populate Evaluation Registry with data from RSM"
 
     def add_arguments(self, parser):
         parser.add_argument("-u", "--url", type=str, help="URL of data to upload")
+        parser.add_argument(
+            "-w", "--workers", type=int, default=1, help="Processes to transform the evaluations with (default 1)"
+        )
+        parser.add_argument(
+            "--update",
+            action="store_true",
+            help="Update evaluations that have already been imported if their rows have changed",
+        )
 
     def handle(self, *args, **kwargs):
         url = kwargs["url"]
-        import_and_upload_evaluations(url)
+        import_and_upload_evaluations(url, kwargs["workers"], kwargs["update"])
 
 
 def is_valid_month(string):
@@ -947,226 +999,219 @@ def save_url_to_data_dir(url):
     return filepath
 
 
-def get_sheet_headers(filename):
+def get_headers(header_row):
+    return [header for header in header_row if header != ""]
+
+
+@contextlib.contextmanager
+def open_sheet(filename):
     """
-    Gets the headers from the given file
+    Opens a CSV or xlsx file to be read once from start to end, without loading all of it into memory
     Args:
         filename: The given filename to read from
 
-    Returns:
-        A list of headers from the given CSV
+    Yields:
+        The list of headers from the first row, and an iterator over the rest of the rows as lists of strings
     """
     file_extension = os.path.splitext(filename)[1]
     if file_extension.endswith(".csv"):
-        with open(filename, "r") as file:
+        with open(filename, "r", newline="") as file:
             reader = csv.reader(file)
-            headers = next(reader)
-            headers = [header for header in headers if header != ""]
+            yield get_headers(next(reader, [])), reader
     elif file_extension.endswith(".xlsx"):
-        workbook = openpyxl.load_workbook(filename)
-        sheet = workbook.active
-        headers = []
-
-        for row in sheet.iter_rows(values_only=True, min_row=1, max_row=1):
-            headers = [header for header in row if header != ""]
-
-        workbook.close()
+        workbook = openpyxl.load_workbook(filename, read_only=True)
+        try:
+            sheet_rows = workbook.active.iter_rows(values_only=True)
+            headers = get_headers(next(sheet_rows, ()))
+            yield headers, ([str(cell) if cell is not None else "" for cell in row] for row in sheet_rows)
+        finally:
+            workbook.close()
     else:
         print("The uploaded file must be a CSV or an xlsx file")  # noqa: T201
         sys.exit(1)
-    return headers
 
 
-def get_evaluation_ids(data, headers):
+def get_column_indexes(headers):
     """
-    Gets the unique and sorted id's of evaluations in the data
+    Maps each header to its column, so columns don't have to be searched for in the headers for every row
     Args:
-        data: The data to get the id's from
-        headers: The list of headers to find the Evaluation ID in
+        headers: The list of headers from the file
 
     Returns:
-        A sorted list of unique id's relating to evaluations
+        A dictionary of header to column index, using the first column if a header is repeated
     """
-    unique_ids = set()
-    column_index = headers.index("Evaluation ID")
-    for row in data:
-        id_value = row[column_index]
-        if id_value:
-            unique_ids.add(id_value)
-    return sorted(unique_ids)
+    column_indexes = {}
+    for index, header in enumerate(headers):
+        column_indexes.setdefault(header, index)
+    return column_indexes
 
 
-def get_evaluation_report_ids(data, headers):
+def group_rows_by_report(rows, column_indexes):
     """
-    Gets the unique and sorted id's of reports in a given evaluation
+    Groups the rows of one evaluation by their Report ID
     Args:
-        data: The data to get the id's from
-        headers: The list of headers to find the Report ID in
+        rows: The rows that relate to the evaluation record
+        column_indexes: The header to column map from get_column_indexes
 
     Returns:
-        A sorted list of unique id's relating to reports of an evaluation
+        A dictionary of report_id to rows, rows without a Report ID are under ""
     """
-    unique_ids = set()
-    column_index = headers.index("Report ID")
-    for row in data:
-        id_value = row[column_index]
-        if id_value:
-            unique_ids.add(id_value)
-    return sorted(unique_ids)
+    report_id_index = column_indexes["Report ID"]
+    report_rows = defaultdict(list)
+    for row in rows:
+        report_rows[row[report_id_index]].append(row)
+    return dict(report_rows)
 
 
-def get_data_rows(filename):
+def group_rows(rows, column_indexes):
     """
-    Takes in a filename and returns the rows of that CSV
+    Groups the rows from the file by Evaluation ID and then by Report ID, one evaluation at a time, so only the
+    rows of one evaluation are held in memory. The rows for each evaluation must be next to each other in the file
     Args:
-        filename: The filename to take rows from
+        rows: An iterator over the rows from the file, e.g. from open_sheet
+        column_indexes: The header to column map from get_column_indexes
 
-    Returns:
-        A list of rows that contain all the data of the given CSV
+    Yields:
+        (evaluation_id, {report_id: rows}) for each evaluation, rows without an Evaluation ID are left out
     """
-    data = []
-    file_extension = os.path.splitext(filename)[1]
-    if file_extension.endswith(".csv"):
-        with open(filename, "r") as file:
-            reader = csv.reader(file)
-            _ = next(reader)
-            for row in reader:
-                data.append(row)
-    elif file_extension.endswith(".xlsx"):
-        workbook = openpyxl.load_workbook(filename)
-        sheet = workbook.active
-        for row in sheet.iter_rows(values_only=True, min_row=2):
-            row_with_empty_strings = [str(cell) if cell is not None else "" for cell in row]
-            data.append(row_with_empty_strings)
+    evaluation_id_index = column_indexes["Evaluation ID"]
+    rows_with_ids = (row for row in rows if row[evaluation_id_index])
+    seen_evaluation_ids = set()
+    for evaluation_id, rows_for_id in itertools.groupby(rows_with_ids, key=operator.itemgetter(evaluation_id_index)):
+        if evaluation_id in seen_evaluation_ids:
+            raise_rows_not_grouped(evaluation_id)
+        seen_evaluation_ids.add(evaluation_id)
+        yield evaluation_id, group_rows_by_report(rows_for_id, column_indexes)
+
+
+def raise_rows_not_grouped(evaluation_id):
+    raise CommandError(
+        f"The rows for evaluation {evaluation_id} are not next to each other. Sort the file by Evaluation ID and upload it again"
+    )
 
-        workbook.close()
-    else:
-        print("The uploaded file must be a CSV or an xlsx file")  # noqa: T201
-        sys.exit(1)
-    return data
 
+def check_rows_are_grouped(filename):
+    """
+    Reads just the Evaluation IDs in the file, to check the rows for each evaluation are next to each other as
+    group_rows needs, before anything is written
+    Args:
+        filename: The CSV or xlsx file to check
 
-def get_evaluation_rows_for_id(unique_id, rows, headers):
+    Raises:
+        CommandError: If the rows for an evaluation are split up
     """
-    Gets the rows of data that relate to the given evaluation_id
+    with open_sheet(filename) as (headers, rows):
+        evaluation_id_index = get_column_indexes(headers)["Evaluation ID"]
+        seen_evaluation_ids = set()
+        previous_evaluation_id = None
+        for row in rows:
+            evaluation_id = row[evaluation_id_index]
+            if not evaluation_id or evaluation_id == previous_evaluation_id:
+                continue
+            if evaluation_id in seen_evaluation_ids:
+                raise_rows_not_grouped(evaluation_id)
+            seen_evaluation_ids.add(evaluation_id)
+            previous_evaluation_id = evaluation_id
+
+
+def get_evaluation_report_ids(report_rows):
+    """
+    Gets the unique and sorted id's of reports in a given evaluation
     Args:
-        unique_id: The evaluation to get rows for
-        rows: All rows to take from
-        headers: A list of headers to find the evaluation_id in
+        report_rows: The evaluation's rows grouped by report, from group_rows_by_report
 
     Returns:
-        A list of rows that match the given evaluation_id
+        A sorted list of unique id's relating to reports of an evaluation
     """
-    column_index = headers.index("Evaluation ID")
-    matching_rows = [row for row in rows if row[column_index] == unique_id]
-    return matching_rows
+    return sorted(report_id for report_id in report_rows if report_id)
 
 
-def get_values_from_rows_for_header(rows, header, headers, report_id=None):
+def get_values_from_rows_for_header(rows, header, column_indexes):
     """
-    Gets all the values related to the given header, if a report_id is provided then only rows for that report are given. This is used to related items such as interventions
+    Gets all the values related to the given header. Related items such as interventions pass just the rows for
+    their report
     Args:
-        rows: The rows that relate to the evaluation record
+        rows: The rows that relate to the evaluation record, or to one of its reports
         header: The required header
-        headers: The headers from the CSV
-        report_id: (optional) The report_id to get rows for
+        column_indexes: The header to column map from get_column_indexes
 
     Returns:
         A list of allowed values for this header
     """
-    if report_id:
-        report_id_index = headers.index("Report ID")
-        values_of_header_rows = [row[headers.index(header)] for row in rows if row[report_id_index] == report_id]
-    else:
-        values_of_header_rows = [row[headers.index(header)] for row in rows]
+    column_index = column_indexes[header]
 
     # Remove empty, unwanted and duplicate values
-    allowed_values = []
-    for value in values_of_header_rows:
-        contains_disallowed = False
-        for disallowed in disallowed_row_values:
-            if disallowed in value.lower() or value.lower().strip().rstrip(".") == "" or value is None:
-                contains_disallowed = True
-                break
-        if not contains_disallowed:
-            allowed_values.append(value)
-
-    allowed_values = [
-        allowed_value for allowed_value in allowed_values if allowed_value not in exact_disallowed_row_values
-    ]
-    return list(set(allowed_values))
+    allowed_values = set()
+    for row in rows:
+        value = row[column_index]
+        lower_value = value.lower()
+        if lower_value.strip().rstrip(".") == "" or value in exact_disallowed_row_values:
+            continue
+        if any(disallowed in lower_value for disallowed in disallowed_row_values):
+            continue
+        allowed_values.add(value)
+    return list(allowed_values)
 
 
 def handle_simple_field(model, header_entry, values_of_header_rows):
     """
     Handles the setting of a simple field based on the field type taken from the header entry, either str or int, as well as the resolution method, either combine or single
     Args:
-        model: The model to save changes to
+        model: The model to set the field on, it is saved later by create_evaluations
         header_entry: The header entry that contains the information for this field
         values_of_header_rows: The values of the rows for this record
+
+    Returns:
+        Whether the field was set
     """
-    if values_of_header_rows:
-        if header_entry["resolution_method"] == "combine":
-            if header_entry["data_type"] == "str":
-                value = ". ".join(s.strip().rstrip(".") for s in values_of_header_rows) + "."
-            else:
-                value = sum(float(v) for v in values_of_header_rows if v.isdigit())
-        elif header_entry["resolution_method"] == "single":
-            if header_entry["data_type"] == "str":
-                value = max(set(values_of_header_rows), key=values_of_header_rows.count)
-            else:
-                all_float_values = [float(v) for v in values_of_header_rows if v.isdigit()]
-                value = max(all_float_values) if all_float_values else 0
+    if not values_of_header_rows:
+        return False
+    if header_entry["resolution_method"] == "combine":
+        if header_entry["data_type"] == "str":
+            value = ". ".join(s.strip().rstrip(".") for s in values_of_header_rows) + "."
         else:
-            value = "" if header_entry["data_type"] == "str" else 0
-
-        try:
-            setattr(model, header_entry["field_name"], value)
-            model.save()
-        except (ValueError, DataError):
-            print(  # noqa: T201
-                f"Could not assign value to {header_entry['field_name']}. This is likely because the value is too long for the field."
-            )
-            max_length = model._meta.get_field(header_entry["field_name"]).max_length
-            setattr(model, header_entry["field_name"], value[: max_length - 3] + "[…]")
-            model.save()
-        except ValidationError:
-            print(  # noqa: T201
-                f"Could not assign value {value} to {header_entry['field_name']}. This is likely because the value is the wrong type."
-            )
-            pass
+            value = sum(float(v) for v in values_of_header_rows if v.isdigit())
+    elif header_entry["resolution_method"] == "single":
+        if header_entry["data_type"] == "str":
+            value = max(set(values_of_header_rows), key=values_of_header_rows.count)
+        else:
+            all_float_values = [float(v) for v in values_of_header_rows if v.isdigit()]
+            value = max(all_float_values) if all_float_values else 0
+    else:
+        value = "" if header_entry["data_type"] == "str" else 0
+    setattr(model, header_entry["field_name"], value)
+    return True
 
 
-def handle_derived_evaluation_fields(evaluation, rows, headers):
+def handle_derived_evaluation_fields(evaluation, rows, column_indexes):
     """
     Handles fields that need to be calculated or are derived from multiple columns such as evaluation type
     Args:
-        evaluation: The evaluation to save changes to
+        evaluation: The evaluation to set the fields on
         rows: The rows that contain the data for the evaluation
-        headers: The headers from the file, used to ascertain which column in each row contains the relevant data
+        column_indexes: The header to column map from get_column_indexes, used to find the relevant data in each row
     """
     issue_description_row_values = get_values_from_rows_for_header(
-        rows, derived_fields["issue_description_option"], headers
+        rows, derived_fields["issue_description_option"], column_indexes
     )
     if issue_description_row_values:
         setattr(evaluation, "issue_description_option", "YES")
     else:
         setattr(evaluation, "issue_description_option", "NO")
-        evaluation.save()
 
-    ethics_row_values = get_values_from_rows_for_header(rows, derived_fields["ethics_option"], headers)
+    ethics_row_values = get_values_from_rows_for_header(rows, derived_fields["ethics_option"], column_indexes)
     if ethics_row_values:
         setattr(evaluation, "ethics_option", "YES")
     else:
         setattr(evaluation, "ethics_option", "NO")
-        evaluation.save()
 
     # "grants_option", Evaluation optional page, not there in CSV
     setattr(evaluation, "grants_option", "NO")
-    evaluation.save()
 
     evaluation_types = []
-    process_evaluation_row_values = get_values_from_rows_for_header(rows, derived_fields["process_evaluation"], headers)
+    process_evaluation_row_values = get_values_from_rows_for_header(
+        rows, derived_fields["process_evaluation"], column_indexes
+    )
     process_evaluation_row_values_yes = sum(
         1 for row_value in process_evaluation_row_values if row_value.lower() in positive_row_values
     )
@@ -1176,7 +1221,9 @@ def handle_derived_evaluation_fields(evaluation, rows, headers):
     if process_evaluation_row_values_no < process_evaluation_row_values_yes:
         evaluation_types.append(choices.EvaluationTypeOptions.PROCESS.value)
 
-    impact_evaluation_row_values = get_values_from_rows_for_header(rows, derived_fields["impact_evaluation"], headers)
+    impact_evaluation_row_values = get_values_from_rows_for_header(
+        rows, derived_fields["impact_evaluation"], column_indexes
+    )
     impact_evaluation_row_values_yes = sum(
         1 for row_value in impact_evaluation_row_values if row_value.lower() in positive_row_values
     )
@@ -1187,7 +1234,7 @@ def handle_derived_evaluation_fields(evaluation, rows, headers):
         evaluation_types.append(choices.EvaluationTypeOptions.IMPACT.value)
 
     economic_evaluation_row_values = get_values_from_rows_for_header(
-        rows, derived_fields["economic_evaluation"], headers
+        rows, derived_fields["economic_evaluation"], column_indexes
     )
     economic_evaluation_row_values_yes = sum(
         1 for row_value in economic_evaluation_row_values if row_value.lower() in positive_row_values
@@ -1198,7 +1245,9 @@ def handle_derived_evaluation_fields(evaluation, rows, headers):
     if economic_evaluation_row_values_no < economic_evaluation_row_values_yes:
         evaluation_types.append(choices.EvaluationTypeOptions.ECONOMIC.value)
 
-    other_evaluation_row_values = get_values_from_rows_for_header(rows, derived_fields["other_evaluation"], headers)
+    other_evaluation_row_values = get_values_from_rows_for_header(
+        rows, derived_fields["other_evaluation"], column_indexes
+    )
     other_evaluation_row_values_yes = sum(
         1 for row_value in other_evaluation_row_values if row_value.lower() in positive_row_values
     )
@@ -1217,290 +1266,597 @@ def handle_derived_evaluation_fields(evaluation, rows, headers):
         else:
             setattr(evaluation, "evaluation_type_other", "No information provided.")
     setattr(evaluation, "evaluation_type", evaluation_types)
-    evaluation.save()
 
     # Set sample_size_details to any values that don't match options of sample_size
-    sample_size_values = get_values_from_rows_for_header(rows, derived_fields["sample_size_details"], headers)
+    sample_size_values = get_values_from_rows_for_header(rows, derived_fields["sample_size_details"], column_indexes)
     sample_size_values_text = [sample_size for sample_size in sample_size_values if not sample_size.isdigit()]
     sample_size_details = ". ".join(s.strip().rstrip(".") for s in sample_size_values_text)
     if sample_size_details:
         setattr(evaluation, "sample_size_details", sample_size_details + ".")
-    evaluation.save()
 
 
 def handle_single_choice_field(model, header_entry, values_of_header_rows):
     """
     Handles the selecting of a single choice field based on either choices or from choice maps declared at the top of this script
     Args:
-        model: The model to save changes to
+        model: The model to set the field on, it is saved later by create_evaluations
         header_entry: The header entry that contains the information for this field
         values_of_header_rows: The values of the rows for this record
+
+    Returns:
+        Whether the field was set
     """
-    if values_of_header_rows:
-        most_chosen_choice = max(set(values_of_header_rows), key=values_of_header_rows.count)
-        most_chosen_choice = most_chosen_choice.rstrip(".")
-        item_choices = header_entry["data_type"]
-        selected_choice = [choice.name for choice in item_choices if choice.label.lower() == most_chosen_choice.lower()]
-        if selected_choice:
-            value = selected_choice[0]
-            setattr(model, header_entry["field_name"], value)
-            model.save()
-        else:
-            choices_support_other = supports_other[item_choices] or False
-            if choices_support_other:
-                value = "OTHER"
-                setattr(model, header_entry["field_name"], value)
-                model.save()
-                try:
-                    other_value = ". ".join(s.strip().rstrip(".") for s in values_of_header_rows) + "."
-                    setattr(model, f"{header_entry['field_name']}_other", other_value)
-                    model.save()
-                except (ValueError, DataError):
-                    other_value = ". ".join(s.strip().rstrip(".") for s in values_of_header_rows) + "."
-                    print(  # noqa: T201
-                        f"Could not assign value to {header_entry['field_name']}_other. This is likely because the value is too long for the field. The value has been trimmed to fit."
-                    )
-                    max_length = model._meta.get_field(f"{header_entry['field_name']}_other").max_length
-                    setattr(model, f"{header_entry['field_name']}_other", other_value[: max_length - 3] + "[…]")
-                    model.save()
-                except ValidationError:
-                    print(  # noqa: T201
-                        f"Could not assign to {header_entry['field_name']}_other. This is likely because the value is the wrong type."
-                    )
-                    pass
+    if not values_of_header_rows:
+        return False
+    most_chosen_choice = max(set(values_of_header_rows), key=values_of_header_rows.count)
+    most_chosen_choice = most_chosen_choice.rstrip(".")
+    item_choices = header_entry["data_type"]
+    selected_choice = [choice.name for choice in item_choices if choice.label.lower() == most_chosen_choice.lower()]
+    if selected_choice:
+        setattr(model, header_entry["field_name"], selected_choice[0])
+        return True
+    if supports_other[item_choices]:
+        setattr(model, header_entry["field_name"], "OTHER")
+        other_value = ". ".join(s.strip().rstrip(".") for s in values_of_header_rows) + "."
+        setattr(model, f"{header_entry['field_name']}_other", other_value)
+        return True
+    return False
 
 
 def handle_multiple_choice_field(model, header_entry, values_of_header_rows):
     """
     Handles the selecting of a multiple choice field based on either choices or from choice maps declared at the top of this script
     Args:
-        model: The model to save changes to
+        model: The model to set the field on, it is saved later by create_evaluations
         header_entry: The header entry that contains the information for this field
         values_of_header_rows: The values of the rows for this record
+
+    Returns:
+        Whether the field was set
     """
-    if values_of_header_rows:
-        item_choices = header_entry["data_type"]
-        lower_values_of_header_rows = [row_value.lower().strip().rstrip(".") for row_value in values_of_header_rows]
-        present_choices = [
-            choice.name for choice in item_choices if choice.label.lower() in lower_values_of_header_rows
-        ]
-        not_present_choices = [
-            lower_value_of_header_rows
-            for lower_value_of_header_rows in lower_values_of_header_rows
-            if lower_value_of_header_rows not in [item_choice.label for item_choice in item_choices]
-        ]
-        if present_choices:
-            setattr(model, header_entry["field_name"], present_choices)
-            model.save()
+    if not values_of_header_rows:
+        return False
+    item_choices = header_entry["data_type"]
+    lower_values_of_header_rows = [row_value.lower().strip().rstrip(".") for row_value in values_of_header_rows]
+    present_choices = [choice.name for choice in item_choices if choice.label.lower() in lower_values_of_header_rows]
+    not_present_choices = [
+        lower_value_of_header_rows
+        for lower_value_of_header_rows in lower_values_of_header_rows
+        if lower_value_of_header_rows not in [item_choice.label for item_choice in item_choices]
+    ]
+    assigned = False
+    if present_choices:
+        setattr(model, header_entry["field_name"], present_choices)
+        assigned = True
 
-        choices_support_other = supports_other[item_choices] or False
-        if choices_support_other:
-            try:
-                model._meta.get_field(f"{header_entry['field_name']}_other")
-                if not_present_choices:
-                    if "OTHER" not in present_choices:
-                        present_choices.append("OTHER")
-                        setattr(model, header_entry["field_name"], present_choices)
-                        model.save()
-                    try:
-                        other_value = ". ".join(s.strip().rstrip(".") for s in not_present_choices) + "."
-                        setattr(model, f"{header_entry['field_name']}_other", other_value)
-                        model.save()
-                    except (ValueError, DataError):
-                        other_value = ". ".join(s.strip().rstrip(".") for s in not_present_choices) + "."
-                        print(  # noqa: T201
-                            f"Could not assign value to {header_entry['field_name']}_other. This is likely because the value is too long for the field. The value has been trimmed to fit."
-                        )
-                        max_length = model._meta.get_field(f"{header_entry['field_name']}_other").max_length
-                        setattr(model, f"{header_entry['field_name']}_other", other_value[: max_length - 3] + "[…]")
-                        model.save()
-                    except ValidationError:
-                        print(  # noqa: T201
-                            f"Could not assign to {header_entry['field_name']}_other. This is likely because the value is the wrong type."
-                        )
-                        pass
-            except FieldDoesNotExist:
-                pass
+    if supports_other[item_choices] and not_present_choices:
+        try:
+            model._meta.get_field(f"{header_entry['field_name']}_other")
+        except FieldDoesNotExist:
+            return assigned
+        if "OTHER" not in present_choices:
+            present_choices.append("OTHER")
+            setattr(model, header_entry["field_name"], present_choices)
+        other_value = ". ".join(s.strip().rstrip(".") for s in not_present_choices) + "."
+        setattr(model, f"{header_entry['field_name']}_other", other_value)
+        assigned = True
+    return assigned
 
 
-def transform_and_create_from_rows(unique_row_id, rows, headers):
+def handle_fields(model, field_headers, rows, column_indexes):
     """
-    Handles each evaluation record by creating each relevant object individually and handling each column through the use of handle_simple_field, handle_single_choice_field and handle_multiple_choice_field
+    Sets each field of the model that has a column in the file
     Args:
-        unique_row_id: The ID from the CSV of the evaluation data to prevent duplicates
-        rows: The rows of data to handle for this evaluation
-        headers: The headers from the files first row, used to match column data with headers
+        model: The model to set the fields on
+        field_headers: The header entries for the model, e.g. intervention_headers
+        rows: The rows of data for this evaluation, or for one of its reports
+        column_indexes: The header to column map from get_column_indexes
+
+    Returns:
+        Whether any field was set
     """
-    evaluation = models.Evaluation.objects.create()
-    evaluation.visibility = "PUBLIC"
-    evaluation.rsm_id = unique_row_id
-    evaluation.save()
-
-    evaluation_report_ids = get_evaluation_report_ids(rows, headers)
-
-    # Evaluation headers
-    for header in headers:
-        if header in evaluation_headers:
-            header_entry = evaluation_headers[header]
-            values_of_header_rows = get_values_from_rows_for_header(rows, header, headers)
+    assigned = False
+    for header in column_indexes:
+        if header in field_headers:
+            header_entry = field_headers[header]
+            values_of_header_rows = get_values_from_rows_for_header(rows, header, column_indexes)
             if header_entry["data_type"] in (
                 "str",
                 "int",
             ):
-                handle_simple_field(evaluation, header_entry, values_of_header_rows)
+                assigned = handle_simple_field(model, header_entry, values_of_header_rows) or assigned
             elif header_entry["resolution_method"] == "choice":
-                handle_single_choice_field(evaluation, header_entry, values_of_header_rows)
+                assigned = handle_single_choice_field(model, header_entry, values_of_header_rows) or assigned
             elif header_entry["resolution_method"] == "multiple_choice":
-                handle_multiple_choice_field(evaluation, header_entry, values_of_header_rows)
+                assigned = handle_multiple_choice_field(model, header_entry, values_of_header_rows) or assigned
+    return assigned
+
+
+def handle_timepoint(outcome_measure, rows, column_indexes):
+    """
+    Sets the outcome measure's timepoint from the most common month and year of interest for the report
+
+    Returns:
+        Whether the timepoint was set
+    """
+    value_of_months = get_values_from_rows_for_header(rows, "Time point of intesest (Month)", column_indexes)
+    value_of_months = [value for value in value_of_months if is_valid_month(value)]
+    value_of_years = get_values_from_rows_for_header(rows, "Time point of intesest (Year)", column_indexes)
+    value_of_years = [value for value in value_of_years if is_valid_year(value)]
+    if value_of_months and value_of_years:
+        most_chosen_month = max(set(value_of_months), key=value_of_months.count)
+        most_chosen_year = max(set(value_of_years), key=value_of_years.count)
+        outcome_measure.timepoint = datetime.strptime(f"{most_chosen_month} {most_chosen_year}", "%b %Y")
+        return True
+    return False
+
+
+def validate_fields(model):
+    """
+    Trims values that are too long for their fields, and resets values of the wrong type, so the model can be
+    inserted in bulk without the database rejecting the batch
+    """
+    for field in model._meta.concrete_fields:
+        if field.primary_key or field.is_relation:
+            continue
+        value = getattr(model, field.attname)
+        if isinstance(field, CharField) and isinstance(value, str) and len(value) > field.max_length:
+            print(  # noqa: T201
+                f"Could not assign value to {field.name}. This is likely because the value is too long for the field. The value has been trimmed to fit."
+            )
+            setattr(model, field.attname, value[: field.max_length - 3] + "[…]")
+            continue
+        try:
+            field.get_prep_value(value)
+        except (TypeError, ValueError, ValidationError):
+            print(  # noqa: T201
+                f"Could not assign value {value} to {field.name}. This is likely because the value is the wrong type."
+            )
+            setattr(model, field.attname, field.get_default())
+
+
+def build_evaluation(unique_row_id, report_rows, column_indexes):
+    """
+    Builds an evaluation and its related objects in memory from the rows for one evaluation, without saving anything
+    Args:
+        unique_row_id: The ID from the CSV of the evaluation data to prevent duplicates
+        report_rows: The rows of data for this evaluation grouped by report, from group_rows
+        column_indexes: The header to column map from get_column_indexes
 
-    # Intervention headers
+    Returns:
+        The unsaved evaluation and a dictionary of report_id to the unsaved related objects from that report, to be
+        passed to create_evaluations
+    """
+    rows = [row for rows_for_report in report_rows.values() for row in rows_for_report]
+    evaluation = models.Evaluation(visibility="PUBLIC", rsm_id=unique_row_id)
+    handle_fields(evaluation, evaluation_headers, rows, column_indexes)
+    handle_derived_evaluation_fields(evaluation, rows, column_indexes)
+
+    # Related objects are only created for reports that have a value for at least one of their fields
+    evaluation_report_ids = get_evaluation_report_ids(report_rows)
+    report_objects = {evaluation_report_id: [] for evaluation_report_id in evaluation_report_ids}
     for evaluation_report_id in evaluation_report_ids:
-        intervention = models.Intervention()
-        intervention.evaluation = evaluation
-        for header in headers:
-            if header in intervention_headers:
-                header_entry = intervention_headers[header]
-                values_of_header_rows = get_values_from_rows_for_header(rows, header, headers, evaluation_report_id)
-                if header_entry["data_type"] in (
-                    "str",
-                    "int",
-                ):
-                    handle_simple_field(intervention, header_entry, values_of_header_rows)
-                elif header_entry["resolution_method"] == "choice":
-                    handle_single_choice_field(intervention, header_entry, values_of_header_rows)
-                elif header_entry["resolution_method"] == "multiple_choice":
-                    handle_multiple_choice_field(intervention, header_entry, values_of_header_rows)
+        intervention = models.Intervention(evaluation=evaluation)
+        if handle_fields(intervention, intervention_headers, report_rows[evaluation_report_id], column_indexes):
+            report_objects[evaluation_report_id].append(intervention)
 
-    # Links headers
     for evaluation_report_id in evaluation_report_ids:
-        link = models.LinkOtherService()
-        link.evaluation = evaluation
-        for header in headers:
-            # Looping link entries because two fields in links are being set by one csv field
-            for entry in links_headers:
-                if header in entry:
-                    header_entry = entry[header]
-                    values_of_header_rows = get_values_from_rows_for_header(rows, header, headers, evaluation_report_id)
-                    if header_entry["data_type"] in (
-                        "str",
-                        "int",
-                    ):
-                        handle_simple_field(link, header_entry, values_of_header_rows)
-                    elif header_entry["resolution_method"] == "choice":
-                        handle_single_choice_field(link, header_entry, values_of_header_rows)
-                    elif header_entry["resolution_method"] == "multiple_choice":
-                        handle_multiple_choice_field(link, header_entry, values_of_header_rows)
-
-    # Outcome measures headers
+        link = models.LinkOtherService(evaluation=evaluation)
+        # Looping link entries because two fields in links are being set by one csv field
+        assigned = [
+            handle_fields(link, entry, report_rows[evaluation_report_id], column_indexes) for entry in links_headers
+        ]
+        if any(assigned):
+            report_objects[evaluation_report_id].append(link)
+
     for evaluation_report_id in evaluation_report_ids:
-        outcome_measure = models.OutcomeMeasure()
-        outcome_measure.evaluation = evaluation
-        for header in headers:
-            if header in outcome_measure_headers:
-                header_entry = outcome_measure_headers[header]
-                values_of_header_rows = get_values_from_rows_for_header(rows, header, headers, evaluation_report_id)
-                if header_entry["data_type"] in (
-                    "str",
-                    "int",
-                ):
-                    handle_simple_field(outcome_measure, header_entry, values_of_header_rows)
-                elif header_entry["resolution_method"] == "choice":
-                    handle_single_choice_field(outcome_measure, header_entry, values_of_header_rows)
-                elif header_entry["resolution_method"] == "multiple_choice":
-                    handle_multiple_choice_field(outcome_measure, header_entry, values_of_header_rows)
-        # Handle timepoint of interest
-        value_of_months = get_values_from_rows_for_header(
-            rows, "Time point of intesest (Month)", headers, evaluation_report_id
-        )
-        value_of_months = [value for value in value_of_months if is_valid_month(value)]
-        value_of_years = get_values_from_rows_for_header(
-            rows, "Time point of intesest (Year)", headers, evaluation_report_id
-        )
-        value_of_years = [value for value in value_of_years if is_valid_year(value)]
-        if value_of_months and value_of_years:
-            most_chosen_month = max(set(value_of_months), key=value_of_months.count)
-            most_chosen_year = max(set(value_of_years), key=value_of_years.count)
-            outcome_measure.timepoint = datetime.strptime(f"{most_chosen_month} {most_chosen_year}", "%b %Y")
-            outcome_measure.save()
-
-    # Other measures headers
+        outcome_measure = models.OutcomeMeasure(evaluation=evaluation)
+        rows_for_report = report_rows[evaluation_report_id]
+        assigned = handle_fields(outcome_measure, outcome_measure_headers, rows_for_report, column_indexes)
+        assigned = handle_timepoint(outcome_measure, rows_for_report, column_indexes) or assigned
+        if assigned:
+            report_objects[evaluation_report_id].append(outcome_measure)
+
     for evaluation_report_id in evaluation_report_ids:
-        other_measure = models.OtherMeasure()
-        other_measure.evaluation = evaluation
-        for header in headers:
-            if header in other_measure_headers:
-                header_entry = other_measure_headers[header]
-                values_of_header_rows = get_values_from_rows_for_header(rows, header, headers, evaluation_report_id)
-                if header_entry["data_type"] in (
-                    "str",
-                    "int",
-                ):
-                    handle_simple_field(other_measure, header_entry, values_of_header_rows)
-                elif header_entry["resolution_method"] == "choice":
-                    handle_single_choice_field(other_measure, header_entry, values_of_header_rows)
-                elif header_entry["resolution_method"] == "multiple_choice":
-                    handle_multiple_choice_field(other_measure, header_entry, values_of_header_rows)
+        other_measure = models.OtherMeasure(evaluation=evaluation)
+        if handle_fields(other_measure, other_measure_headers, report_rows[evaluation_report_id], column_indexes):
+            report_objects[evaluation_report_id].append(other_measure)
 
-    # Costs headers
     for evaluation_report_id in evaluation_report_ids:
-        cost = models.EvaluationCost()
-        cost.evaluation = evaluation
-        for header in headers:
-            if header in evaluation_cost_headers:
-                header_entry = evaluation_cost_headers[header]
-                values_of_header_rows = get_values_from_rows_for_header(rows, header, headers, evaluation_report_id)
-                if header_entry["data_type"] in (
-                    "str",
-                    "int",
-                ):
-                    handle_simple_field(cost, header_entry, values_of_header_rows)
-                elif header_entry["resolution_method"] == "choice":
-                    handle_single_choice_field(cost, header_entry, values_of_header_rows)
-                elif header_entry["resolution_method"] == "multiple_choice":
-                    handle_multiple_choice_field(cost, header_entry, values_of_header_rows)
+        cost = models.EvaluationCost(evaluation=evaluation)
+        if handle_fields(cost, evaluation_cost_headers, report_rows[evaluation_report_id], column_indexes):
+            report_objects[evaluation_report_id].append(cost)
 
-    # Processes and standards headers
     for evaluation_report_id in evaluation_report_ids:
-        process_standard = models.ProcessStandard()
-        process_standard.evaluation = evaluation
-        for header in headers:
-            if header in processes_and_standards_headers:
-                header_entry = processes_and_standards_headers[header]
-                values_of_header_rows = get_values_from_rows_for_header(rows, header, headers, evaluation_report_id)
-                if header_entry["data_type"] in (
-                    "str",
-                    "int",
-                ):
-                    handle_simple_field(process_standard, header_entry, values_of_header_rows)
-                elif header_entry["resolution_method"] == "choice":
-                    handle_single_choice_field(process_standard, header_entry, values_of_header_rows)
-                elif header_entry["resolution_method"] == "multiple_choice":
-                    handle_multiple_choice_field(process_standard, header_entry, values_of_header_rows)
+        process_standard = models.ProcessStandard(evaluation=evaluation)
+        rows_for_report = report_rows[evaluation_report_id]
+        if handle_fields(process_standard, processes_and_standards_headers, rows_for_report, column_indexes):
+            report_objects[evaluation_report_id].append(process_standard)
+
+    validate_fields(evaluation)
+    for related_object in get_related_objects(report_objects):
+        validate_fields(related_object)
+    return evaluation, report_objects
+
+
+def get_related_objects(report_objects):
+    return [related_object for related_objects in report_objects.values() for related_object in related_objects]
+
+
+def get_headers_hash(headers):
+    """
+    A hash of the headers, and of the version of the transformation, that is included in every report hash
+    """
+    return hashlib.sha256(json.dumps([TRANSFORM_VERSION, headers]).encode()).hexdigest()
+
+
+def get_report_hashes(report_rows, headers_hash):
+    """
+    Hashes the rows of each report, to tell whether they have changed since they were imported
+    Args:
+        report_rows: The rows of data for an evaluation grouped by report, from group_rows
+        headers_hash: The hash of the file's headers from get_headers_hash
+
+    Returns:
+        A dictionary of report_id to the hash of its rows
+    """
+    return {
+        report_id: hashlib.sha256(json.dumps([headers_hash, rows], default=str).encode()).hexdigest()
+        for report_id, rows in report_rows.items()
+    }
+
+
+def get_content_hash(report_hashes):
+    return hashlib.sha256(json.dumps(sorted(report_hashes.items())).encode()).hexdigest()
+
 
-    # Derived evaluation headers
-    handle_derived_evaluation_fields(evaluation, rows, headers)
+def make_rsm_import_reports(report_objects, report_hashes):
+    return {
+        report_id: {
+            "hash": report_hash,
+            "objects": [
+                [type(related_object).__name__, related_object.id]
+                for related_object in report_objects.get(report_id, [])
+            ],
+        }
+        for report_id, report_hash in report_hashes.items()
+    }
 
+
+def create_evaluations(built_evaluations):
+    """
+    Inserts evaluations from build_evaluation, with their related objects, organisation links and search text,
+    using one bulk insert per table in a single transaction. Saving each model would rebuild the evaluation's
+    search text after every change, so the search text is computed here once per evaluation instead.
+    The hashes of the rows each evaluation was built from are stored with it as an RsmImport.
+    Args:
+        built_evaluations: A list of (evaluation, report_objects, report_hashes), from build_evaluation and
+            get_report_hashes
+    """
+    evaluations = []
+    related_objects_by_model = defaultdict(list)
+    fragments = []
+    rsm_imports = []
+    for evaluation, report_objects, report_hashes in built_evaluations:
+        related_objects = get_related_objects(report_objects)
+        rsm_imports.append(
+            models.RsmImport(
+                evaluation=evaluation,
+                content_hash=get_content_hash(report_hashes),
+                reports=make_rsm_import_reports(report_objects, report_hashes),
+            )
+        )
+        evaluation_fragments = search_index.make_fragments(evaluation.id, related_objects)
+        evaluation.search_text = evaluation.make_search_text(fragment.text for fragment in evaluation_fragments)
+        evaluations.append(evaluation)
+        fragments.extend(evaluation_fragments)
+        for related_object in related_objects:
+            related_objects_by_model[type(related_object)].append(related_object)
+
+    organisation_slugs = set(models.Organisation.objects.values_list("slug", flat=True))
+    organisation_link_model = models.Evaluation.linked_organisations.through
+    organisation_links = [
+        organisation_link_model(evaluation_id=evaluation.id, organisation_id=slug)
+        for evaluation in evaluations
+        for slug in set(evaluation.organisations) & organisation_slugs
+    ]
+
+    with transaction.atomic():
+        models.Evaluation.objects.bulk_create(evaluations, batch_size=BULK_CREATE_BATCH_SIZE)
+        for model, model_objects in related_objects_by_model.items():
+            model.objects.bulk_create(model_objects, batch_size=BULK_CREATE_BATCH_SIZE)
+        organisation_link_model.objects.bulk_create(organisation_links, batch_size=BULK_CREATE_BATCH_SIZE)
+        models.SearchFragment.objects.bulk_create(fragments, batch_size=BULK_CREATE_BATCH_SIZE)
+        models.RsmImport.objects.bulk_create(rsm_imports, batch_size=BULK_CREATE_BATCH_SIZE)
+        models.Evaluation.objects.filter(id__in=[evaluation.id for evaluation in evaluations]).update(
+            search_vector=models.get_search_vector()
+        )
+
+
+def transform_and_create_from_rows(unique_row_id, rows, headers):
+    """
+    Builds and saves a single evaluation record, see build_evaluation and create_evaluations
+    Args:
+        unique_row_id: The ID from the CSV of the evaluation data to prevent duplicates
+        rows: The rows of data to handle for this evaluation
+        headers: The headers from the files first row, used to match column data with headers
+    """
+    column_indexes = get_column_indexes(headers)
+    report_rows = group_rows_by_report(rows, column_indexes)
+    evaluation, report_objects = build_evaluation(unique_row_id, report_rows, column_indexes)
+    create_evaluations([(evaluation, report_objects, get_report_hashes(report_rows, get_headers_hash(headers)))])
     print(f"Evaluation uploaded. ID: {evaluation.id}")  # noqa: T201
 
 
-def import_and_upload_evaluations(url):
-    filename = save_url_to_data_dir(url)
-    headers = get_sheet_headers(filename)
-    rows = get_data_rows(filename)
+def to_plain_data(model):
+    return type(model).__name__, {field.attname: getattr(model, field.attname) for field in model._meta.concrete_fields}
+
+
+def from_plain_data(plain_data):
+    model_name, values = plain_data
+    return getattr(models, model_name)(**values)
+
+
+def transform_evaluation(unique_row_id, report_rows, column_indexes):
+    """
+    Builds an evaluation with build_evaluation, returning it and its related objects as (model name, field values)
+    pairs so only plain values are sent back from worker processes. Doesn't use the database.
+    """
+    evaluation, report_objects = build_evaluation(unique_row_id, report_rows, column_indexes)
+    return to_plain_data(evaluation), {
+        report_id: [to_plain_data(related_object) for related_object in related_objects]
+        for report_id, related_objects in report_objects.items()
+    }
+
+
+def from_transformed_evaluation(plain_data):
+    evaluation_data, report_objects_data = plain_data
+    evaluation = from_plain_data(evaluation_data)
+    report_objects = {
+        report_id: [from_plain_data(related_object_data) for related_object_data in related_objects_data]
+        for report_id, related_objects_data in report_objects_data.items()
+    }
+    return evaluation, report_objects
+
+
+def transform_evaluations(evaluation_groups, column_indexes, workers=1):
+    """
+    Transforms evaluations with transform_evaluation, in a pool of worker processes if there is more than one worker.
+    At most IN_FLIGHT_PER_WORKER evaluations per worker are read from the file ahead of the ones being written.
+    Args:
+        evaluation_groups: (evaluation_id, {report_id: rows}) pairs from group_rows
+        column_indexes: The header to column map from get_column_indexes
+        workers: The number of worker processes
+
+    Yields:
+        (evaluation_id, plain data or None, exception or None) for each evaluation, in the order they are in the file
+    """
+    # Errors are returned rather than raised, so one evaluation that can't be transformed doesn't stop the upload
+    if workers <= 1:
+        for unique_row_id, report_rows in evaluation_groups:
+            try:
+                yield unique_row_id, transform_evaluation(unique_row_id, report_rows, column_indexes), None
+            except Exception as error:  # noqa: B902
+                yield unique_row_id, None, error
+        return
+
+    def get_result(unique_row_id, future):
+        try:
+            return unique_row_id, future.result(), None
+        except Exception as error:  # noqa: B902
+            return unique_row_id, None, error
 
-    existing_evaluation_ids = [str(int(item.rsm_id)) for item in models.Evaluation.objects.filter(rsm_id__isnull=False)]
-    print(f"{len(existing_evaluation_ids)} already imported records found")  # noqa: T201
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as executor:
+        in_flight = collections.deque()
+        for unique_row_id, report_rows in evaluation_groups:
+            future = executor.submit(transform_evaluation, unique_row_id, report_rows, column_indexes)
+            in_flight.append((unique_row_id, future))
+            if len(in_flight) >= workers * IN_FLIGHT_PER_WORKER:
+                yield get_result(*in_flight.popleft())
+        while in_flight:
+            yield get_result(*in_flight.popleft())
 
-    unique_row_ids = get_evaluation_ids(rows, headers)
-    print(f"{len(unique_row_ids)} records found in the uploaded document")  # noqa: T201
 
-    unique_and_non_duplicate_row_ids = [
-        unique_row_id for unique_row_id in unique_row_ids if unique_row_id not in existing_evaluation_ids
+def report_failure(unique_row_id, error):
+    print(f"Could not upload evaluation {unique_row_id}: {error!r}")  # noqa: T201
+
+
+def write_evaluations(built_evaluations):
+    """
+    Inserts a batch of evaluations in one transaction. If that fails, each evaluation is inserted in its own
+    transaction, so one that the database rejects is reported without losing the rest of the batch.
+
+    Returns:
+        The number of evaluations inserted
+    """
+    if not built_evaluations:
+        return 0
+    try:
+        create_evaluations(built_evaluations)
+        created_evaluations = built_evaluations
+    except DatabaseError:
+        created_evaluations = []
+        for built_evaluation in built_evaluations:
+            try:
+                create_evaluations([built_evaluation])
+                created_evaluations.append(built_evaluation)
+            except DatabaseError as error:
+                report_failure(built_evaluation[0].rsm_id, error)
+    for evaluation, _, _ in created_evaluations:
+        print(f"Evaluation uploaded. ID: {evaluation.id}")  # noqa: T201
+    return len(created_evaluations)
+
+
+def get_match_key(related_object):
+    """
+    What an existing related object is matched to one built from the rows on, when it isn't known which were imported:
+    its name, or if it hasn't got one the values of all of its imported fields
+    """
+    model = type(related_object)
+    if related_object.get_name():
+        return model, related_object.get_name()
+    values = [
+        json.dumps(field.to_python(getattr(related_object, field.attname)), sort_keys=True, cls=DjangoJSONEncoder)
+        for field in model._meta.concrete_fields
+        if field.attname not in ("id", "evaluation_id", "created_at", "modified_at")
     ]
+    return model, None, tuple(values)
+
+
+def update_evaluation(evaluation_id, evaluation, report_objects, report_hashes):
+    """
+    Applies the changes in an evaluation's rows to the evaluation that was imported from them before, in one
+    transaction. The imported fields are copied onto the existing evaluation if they have changed, and the related
+    objects of each report whose rows have changed (or that is no longer in the file) are replaced.
+    For evaluations imported before their hashes were stored, only the related objects that match one built from
+    the rows (see get_match_key) are replaced, others may have been added through the submission pages.
+    Args:
+        evaluation_id: The ID of the existing evaluation
+        evaluation, report_objects: The evaluation built from the rows, from build_evaluation
+        report_hashes: The hashes of the rows, from get_report_hashes
+    """
+    with transaction.atomic():
+        existing_evaluation = models.Evaluation.objects.select_for_update().get(id=evaluation_id)
+        changed_fields = [
+            field_name
+            for field_name in imported_evaluation_fields
+            if getattr(existing_evaluation, field_name) != getattr(evaluation, field_name)
+        ]
+        for field_name in changed_fields:
+            setattr(existing_evaluation, field_name, getattr(evaluation, field_name))
+
+        rsm_import = models.RsmImport.objects.filter(evaluation_id=evaluation_id).first()
+        if rsm_import:
+            previous_reports = rsm_import.reports
+            changed_report_ids = {
+                report_id
+                for report_id in set(previous_reports) | set(report_hashes)
+                if previous_reports.get(report_id, {}).get("hash") != report_hashes.get(report_id)
+            }
+            for report_id in changed_report_ids & set(previous_reports):
+                for model_name, objects in itertools.groupby(
+                    sorted(previous_reports[report_id]["objects"]), key=operator.itemgetter(0)
+                ):
+                    getattr(models, model_name).objects.filter(id__in=[object_id for _, object_id in objects]).delete()
+        else:
+            rsm_import = models.RsmImport(evaluation_id=evaluation_id)
+            previous_reports = {}
+            changed_report_ids = set(report_hashes)
+            built_keys = {get_match_key(related_object) for related_object in get_related_objects(report_objects)}
+            for model in imported_related_models:
+                imported_ids = [
+                    existing_object.id
+                    for existing_object in model.objects.filter(evaluation_id=evaluation_id)
+                    if get_match_key(existing_object) in built_keys
+                ]
+                model.objects.filter(id__in=imported_ids).delete()
+
+        # Unchanged reports keep their related objects, and the ids of the objects they were imported as
+        reports = make_rsm_import_reports(report_objects, report_hashes)
+        for report_id in set(report_hashes) - changed_report_ids:
+            reports[report_id] = previous_reports[report_id]
+        related_objects = [
+            related_object for report_id in changed_report_ids for related_object in report_objects.get(report_id, [])
+        ]
+        related_objects_by_model = defaultdict(list)
+        for related_object in related_objects:
+            related_object.evaluation_id = evaluation_id
+            related_objects_by_model[type(related_object)].append(related_object)
+        for model, model_objects in related_objects_by_model.items():
+            model.objects.bulk_create(model_objects, batch_size=BULK_CREATE_BATCH_SIZE)
+        models.SearchFragment.objects.bulk_create(
+            search_index.make_fragments(evaluation_id, related_objects), batch_size=BULK_CREATE_BATCH_SIZE
+        )
+
+        if changed_fields:
+            existing_evaluation.save()
+        elif related_objects:
+            search_index.touch_evaluation(evaluation_id)
+            search_index.mark_dirty(evaluation_id)
+        rsm_import.content_hash = get_content_hash(report_hashes)
+        rsm_import.reports = reports
+        rsm_import.save()
+
+
+def import_evaluations_from_file(filename, workers=1, update=False):
+    """
+    Imports the evaluations in the file that haven't already been imported, reading the file one evaluation at a
+    time and inserting them IMPORT_BATCH_SIZE evaluations at a time. Evaluations that can't be imported are reported
+    and skipped.
+    With update, evaluations that have already been imported are updated instead, if their rows have changed since,
+    see update_evaluation. Evaluations whose rows haven't changed are skipped without being transformed.
+    Args:
+        filename: The CSV or xlsx file to import
+        workers: The number of processes to transform the evaluations with, see transform_evaluations
+        update: Whether to update evaluations that have already been imported
+
+    Returns:
+        The number of evaluations imported or updated
+
+    Raises:
+        CommandError: If the rows for an evaluation aren't next to each other, see check_rows_are_grouped
+    """
+    check_rows_are_grouped(filename)
+    existing_evaluations = {
+        str(int(rsm_id)): (evaluation_id, content_hash)
+        for rsm_id, evaluation_id, content_hash in models.Evaluation.objects.filter(rsm_id__isnull=False).values_list(
+            "rsm_id", "id", "rsm_import__content_hash"
+        )
+    }
+    print(f"{len(existing_evaluations)} already imported records found")  # noqa: T201
+
+    counts = collections.Counter()
+    report_hashes_by_id = {}
+
+    def get_new_evaluation_groups(rows, column_indexes, headers_hash):
+        for unique_row_id, report_rows in group_rows(rows, column_indexes):
+            counts["found"] += 1
+            report_hashes = get_report_hashes(report_rows, headers_hash)
+            if unique_row_id in existing_evaluations:
+                if not update:
+                    counts["duplicates"] += 1
+                    continue
+                if existing_evaluations[unique_row_id][1] == get_content_hash(report_hashes):
+                    counts["unchanged"] += 1
+                    continue
+            report_hashes_by_id[unique_row_id] = report_hashes
+            yield unique_row_id, report_rows
+
+    built_evaluations = []
+    with open_sheet(filename) as (headers, rows):
+        column_indexes = get_column_indexes(headers)
+        new_evaluation_groups = get_new_evaluation_groups(rows, column_indexes, get_headers_hash(headers))
+        for unique_row_id, plain_data, error in transform_evaluations(new_evaluation_groups, column_indexes, workers):
+            report_hashes = report_hashes_by_id.pop(unique_row_id)
+            if error:
+                report_failure(unique_row_id, error)
+                continue
+            evaluation, report_objects = from_transformed_evaluation(plain_data)
+            if unique_row_id in existing_evaluations:
+                try:
+                    update_evaluation(existing_evaluations[unique_row_id][0], evaluation, report_objects, report_hashes)
+                    counts["updated"] += 1
+                    print(f"Evaluation updated. ID: {existing_evaluations[unique_row_id][0]}")  # noqa: T201
+                except DatabaseError as error:
+                    report_failure(unique_row_id, error)
+                continue
+            built_evaluations.append((evaluation, report_objects, report_hashes))
+            if len(built_evaluations) == IMPORT_BATCH_SIZE:
+                counts["imported"] += write_evaluations(built_evaluations)
+                built_evaluations = []
+    counts["imported"] += write_evaluations(built_evaluations)
+
+    number_not_imported = (
+        counts["found"] - counts["duplicates"] - counts["unchanged"] - counts["updated"] - counts["imported"]
+    )
     print(  # noqa: T201
-        f"{len(unique_row_ids) - len(unique_and_non_duplicate_row_ids)} duplicates found. {len(unique_and_non_duplicate_row_ids)} new records to be imported"
+        f"{counts['found']} records found in the uploaded document. {counts['duplicates']} duplicates found. {counts['imported']} new records imported. {number_not_imported} could not be imported"
     )
+    if update:
+        print(f"{counts['updated']} records updated. {counts['unchanged']} records unchanged")  # noqa: T201
+    return counts["imported"] + counts["updated"]
+
 
-    for unique_row_id in unique_and_non_duplicate_row_ids:
-        rows_for_id = get_evaluation_rows_for_id(unique_row_id, rows, headers)
-        transform_and_create_from_rows(unique_row_id, rows_for_id, headers)
+def import_and_upload_evaluations(url, workers=1, update=False):
+    filename = save_url_to_data_dir(url)
+    import_evaluations_from_file(filename, workers, update)
@@ -7,7 +7,7 @@ import pathlib
 
 import pandas as pd
 
-from eva_reg.evaluation import choices, enums, models
+from eva_reg.evaluation import choices, models
 
 DATA_DIR = pathlib.Path("eva_reg", "data")
 INFO_NOT_IDENTIFIED = "Information not identified within the report"
@@ -141,7 +141,6 @@ PROCESSES_STANDARDS_MAPPING = {
 }
 
 # TODO - check these
-EXISTING_ORGANISATION_MAPPING = {v: k for k, v in dict(enums.org_tuples).items()}
 OTHER_ORGANISATION_MAPPING = {
     "Department for Transport": "department-for-transport",
     "Closed organisation: Ministry of Housing, Communities & Local Government": "ministry-of-housing-communities-and-local-government",
@@ -149,7 +148,11 @@ OTHER_ORGANISATION_MAPPING = {
     "Department for Business, Energy & Industrial Strategy": "department-for-business-energy-and-industrial-strategy",
     "Closed organisation: UK Commission for Employment and Skills": "uk-commission-for-employment-and-skills",
 }
-ALL_ORG_MAPPING = {**EXISTING_ORGANISATION_MAPPING, **OTHER_ORGANISATION_MAPPING}
+
+
+def get_all_org_mapping():
+    existing_organisation_mapping = {name: slug for slug, name in models.get_organisations().choices}
+    return {**existing_organisation_mapping, **OTHER_ORGANISATION_MAPPING}
 
 
 # MANY OF THESE:
@@ -230,8 +233,9 @@ def get_evaluation_types(evaluation_df):
 def get_organisations(evaluation_df):
     all_vals = evaluation_df["metadata_orgs_titles"].dropna(how="all")
     all_vals = all_vals.unique()
+    all_org_mapping = get_all_org_mapping()
     try:
-        converted_vals = [ALL_ORG_MAPPING[org] for org in all_vals]
+        converted_vals = [all_org_mapping[org] for org in all_vals]
     except KeyError:
         print(f"Non-matching org: {all_vals}")  # noqa
         converted_vals = []
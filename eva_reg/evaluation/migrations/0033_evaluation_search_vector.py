@@ -0,0 +1,34 @@
+# Generated by Django 3.2.18 on 2023-07-05 10:12
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+def populate_search_vectors(apps, schema_editor):
+    Evaluation = apps.get_model("evaluation", "Evaluation")
+    search_vector = django.contrib.postgres.search.SearchVector(
+        "title", "brief_description", weight="A"
+    ) + django.contrib.postgres.search.SearchVector("search_text", weight="B")
+    Evaluation.objects.update(search_vector=search_vector)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("evaluation", "0032_auto_20230628_1451"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="evaluation",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="evaluation",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="evaluation_search_vector_idx"
+            ),
+        ),
+        migrations.RunPython(populate_search_vectors, migrations.RunPython.noop),
+    ]
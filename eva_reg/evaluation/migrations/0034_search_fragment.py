@@ -0,0 +1,41 @@
+# Generated by Django 3.2.18 on 2023-07-06 09:41
+
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("evaluation", "0033_evaluation_search_vector"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchFragment",
+            fields=[
+                ("id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("modified_at", models.DateTimeField(auto_now=True)),
+                ("source_name", models.CharField(max_length=64)),
+                ("source_id", models.UUIDField()),
+                ("position", models.PositiveSmallIntegerField()),
+                ("text", models.TextField()),
+                (
+                    "evaluation",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="search_fragments",
+                        to="evaluation.evaluation",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="searchfragment",
+            constraint=models.UniqueConstraint(
+                fields=("source_name", "source_id"), name="unique_search_fragment_source"
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 3.2.18 on 2023-07-07 11:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("evaluation", "0034_search_fragment"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchIndexQueueItem",
+            fields=[
+                (
+                    "evaluation",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="+",
+                        serialize=False,
+                        to="evaluation.evaluation",
+                    ),
+                ),
+                ("queued_at", models.DateTimeField()),
+            ],
+        ),
+    ]
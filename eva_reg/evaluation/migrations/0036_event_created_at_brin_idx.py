@@ -0,0 +1,17 @@
+# Generated by Django 3.2.18 on 2023-07-10 09:12
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("evaluation", "0035_search_index_queue"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=django.contrib.postgres.indexes.BrinIndex(fields=["created_at"], name="event_created_at_brin_idx"),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 3.2.18 on 2023-07-24 10:45
+
+from django.db import migrations, models
+
+
+def load_and_link_organisations(apps, schema_editor):
+    from eva_reg.evaluation.organisations import load_organisations
+
+    Organisation = apps.get_model("evaluation", "Organisation")
+    Evaluation = apps.get_model("evaluation", "Evaluation")
+    load_organisations(Organisation)
+
+    slugs = set(Organisation.objects.values_list("slug", flat=True))
+    EvaluationOrganisation = Evaluation.linked_organisations.through
+    links = [
+        EvaluationOrganisation(evaluation_id=evaluation_id, organisation_id=slug)
+        for evaluation_id, organisations in Evaluation.objects.values_list("id", "organisations").iterator()
+        for slug in set(organisations or []) & slugs
+    ]
+    EvaluationOrganisation.objects.bulk_create(links, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("evaluation", "0036_event_created_at_brin_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Organisation",
+            fields=[
+                ("slug", models.SlugField(max_length=256, primary_key=True, serialize=False)),
+                ("name", models.CharField(max_length=512)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="evaluation",
+            name="linked_organisations",
+            field=models.ManyToManyField(blank=True, related_name="evaluations", to="evaluation.Organisation"),
+        ),
+        migrations.RunPython(load_and_link_organisations, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 3.2.18 on 2023-07-25 14:03
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("evaluation", "0037_organisation"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="evaluation",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["topics"], name="evaluation_topics_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="evaluation",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["evaluation_type"], name="evaluation_type_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="evaluation",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["impact_design_name"], name="evaluation_impact_design_idx"
+            ),
+        ),
+    ]
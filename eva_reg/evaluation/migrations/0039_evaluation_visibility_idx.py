@@ -0,0 +1,16 @@
+# Generated by Django 3.2.18 on 2023-07-26 09:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("evaluation", "0038_evaluation_list_field_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="evaluation",
+            index=models.Index(fields=["visibility"], name="evaluation_visibility_idx"),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 3.2.18 on 2023-07-27 10:12
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("evaluation", "0039_evaluation_visibility_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RsmImport",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("modified_at", models.DateTimeField(auto_now=True)),
+                (
+                    "evaluation",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="rsm_import",
+                        serialize=False,
+                        to="evaluation.evaluation",
+                    ),
+                ),
+                ("content_hash", models.CharField(max_length=64)),
+                ("reports", models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
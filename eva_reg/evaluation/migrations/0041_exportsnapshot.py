@@ -0,0 +1,29 @@
+# Generated by Django 3.2.18 on 2023-07-28 09:40
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("evaluation", "0040_rsmimport"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExportSnapshot",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("modified_at", models.DateTimeField(auto_now=True)),
+                ("filename", models.CharField(max_length=256, primary_key=True, serialize=False)),
+                ("content", models.BinaryField()),
+                ("content_hash", models.CharField(max_length=64)),
+                ("gzip_content", models.BinaryField()),
+                ("gzip_hash", models.CharField(max_length=64)),
+                ("state", models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
@@ -1,10 +1,16 @@
+import functools
+import time
 import uuid
 
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import BrinIndex, GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.db.models import Exists, F, Func, OuterRef, Q, Value
 from django_use_email_as_username.models import BaseUser, BaseUserManager
 
-from . import choices, enums, utils
+from . import choices, loader, search_index, utils
 from .pages import EvaluationPageStatus, get_default_page_statuses
 
 
@@ -14,8 +20,7 @@ class SaveEvaluationOnSave(models.Model):
 
     def save(self, *args, **kwargs):
         super().save(*args, **kwargs)
-        evaluation = self.evaluation
-        evaluation.save()
+        search_index.update_fragment(self)
 
 
 class UUIDPrimaryKeyBase(models.Model):
@@ -53,26 +58,26 @@ class NamedModel:
         return getattr(self, self._name_field)
 
 
+topic_display_names = dict(choices.Topic.choices)
+evaluation_type_display_names = dict(choices.EvaluationTypeOptions.choices)
+visibility_display_names = dict(choices.EvaluationVisibility.choices)
+
+
 def get_topic_display_name(db_name):
-    result = [topic[1] for topic in choices.Topic.choices if topic[0] == db_name]
-    return result[0]
+    return topic_display_names[db_name]
 
 
 def get_organisation_display_name(db_name):
-    result = [organisation[1] for organisation in enums.Organisation.choices if organisation[0] == db_name]
-    return result[0]
+    # An evaluation can be tagged with an organisation that isn't in the table (yet)
+    return get_organisations().mapping.get(db_name, db_name)
 
 
 def get_list_evaluation_types_display_name(db_name):
-    result = [
-        evaluation_type[1] for evaluation_type in choices.EvaluationTypeOptions.choices if evaluation_type[0] == db_name
-    ]
-    return result[0]
+    return evaluation_type_display_names[db_name]
 
 
 def get_visibility_display_name(db_name):
-    result = [visibility[1] for visibility in choices.EvaluationVisibility.choices if visibility[0] == db_name]
-    return result[0]
+    return visibility_display_names[db_name]
 
 
 def get_page_status_display_name(db_name):
@@ -82,6 +87,62 @@ def get_page_status_display_name(db_name):
         return None
 
 
+# Related objects whose search text is included in an evaluation's search text, in document order
+search_document_related_fields = [
+    "interventions",
+    "outcome_measures",
+    "other_measures",
+    "process_standards",
+    "link_other_services",
+    "costs",
+    "grants",
+    "documents",
+    "event_dates",
+    "process_evaluation_aspects",
+    "process_evaluation_methods",
+]
+
+
+def get_search_vector():
+    # Place the highest weight on title and description
+    return SearchVector("title", "brief_description", weight="A") + SearchVector("search_text", weight="B")
+
+
+def make_search_vector(title, brief_description, search_text):
+    """
+    The same weighted vector as get_search_vector, built from values rather than the stored columns,
+    so it can be written in the same statement that changes them
+    """
+    return SearchVector(
+        Value(title, output_field=models.TextField()),
+        Value(brief_description, output_field=models.TextField()),
+        weight="A",
+    ) + SearchVector(Value(search_text, output_field=models.TextField()), weight="B")
+
+
+def set_page_status(evaluation_id, page_name, status, user_id=None):
+    """
+    Set one page's status with a single jsonb_set update, leaving the rest of the evaluation (including its
+    modified_at and search text) alone, data download snapshots notice the change through their page statuses hash.
+    Nothing is written if the page already has that status or is DONE.
+    If user_id is given, only an evaluation that user contributes to is updated. Returns whether a row changed.
+    """
+    evaluations = Evaluation.objects.filter(id=evaluation_id)
+    if user_id:
+        evaluations = evaluations.filter(users__id=user_id)
+    evaluations = evaluations.exclude(page_statuses__contains={page_name: status}).exclude(
+        page_statuses__contains={page_name: EvaluationPageStatus.DONE.name}
+    )
+    page_statuses = Func(
+        F("page_statuses"),
+        Value([page_name], output_field=ArrayField(models.TextField())),
+        Value(status, output_field=models.JSONField()),
+        function="jsonb_set",
+        output_field=models.JSONField(),
+    )
+    return bool(evaluations.update(page_statuses=page_statuses))
+
+
 class TimeStampedModel(models.Model):
     created_at = models.DateTimeField(editable=False, auto_now_add=True)
     modified_at = models.DateTimeField(editable=False, auto_now=True)
@@ -91,18 +152,93 @@ class TimeStampedModel(models.Model):
 
 
 class Event(TimeStampedModel):
+    class Meta:
+        # Events are only ever appended, so created_at follows the physical row order and a BRIN index stays tiny
+        indexes = [BrinIndex(fields=["created_at"], name="event_created_at_brin_idx")]
+
     name = models.CharField(max_length=256)
     data = models.JSONField(encoder=DjangoJSONEncoder)
 
 
+class Organisation(models.Model):
+    """
+    An organisation from the GOV.UK organisations API, loaded by the load_organisations command
+    """
+
+    slug = models.SlugField(max_length=256, primary_key=True)
+    name = models.CharField(max_length=512)
+
+    def __str__(self):
+        return self.name
+
+
+# How long each process keeps the organisations before reading them again
+ORGANISATIONS_CACHE_SECONDS = 300
+
+_organisations_cache = {}
+
+
+def get_organisations():
+    """
+    Every organisation as a Choices class of slug -> name, ordered by name. Read from the database the first time
+    it's needed rather than at import, and again once it's ORGANISATIONS_CACHE_SECONDS old, so organisations loaded
+    by another process show up without a restart. Call forget_organisations() after changing the table.
+    """
+    loaded_at, organisations = _organisations_cache.get("organisations", (None, None))
+    now = time.monotonic()
+    if loaded_at is None or now - loaded_at > ORGANISATIONS_CACHE_SECONDS:
+        names = sorted(Organisation.objects.values_list("slug", "name"), key=lambda item: item[1].lower())
+        organisations = utils.Choices("Organisation", names)
+        _organisations_cache["organisations"] = (now, organisations)
+    return organisations
+
+
+def forget_organisations():
+    _organisations_cache.clear()
+
+
+def contributed_to_by(user):
+    """
+    Whether the user is one of an evaluation's contributors, as an EXISTS on the users link table
+    so it can be OR-ed with other conditions without joining (and duplicating) rows
+    """
+    return Exists(Evaluation.users.through.objects.filter(evaluation_id=OuterRef("pk"), user_id=user.id))
+
+
+class EvaluationQuerySet(models.QuerySet):
+    def visible_to(self, user):
+        """
+        Evaluations the user can see: public ones, civil service ones unless they're an external user,
+        and any they contribute to
+        """
+        visibilities = [choices.EvaluationVisibility.PUBLIC.value]
+        if not user.is_external_user:
+            visibilities.append(choices.EvaluationVisibility.CIVIL_SERVICE.value)
+        return self.filter(Q(visibility__in=visibilities) | Q(contributed_to_by(user)))
+
+
 # TODO - throughout have used TextField (where spec was for 10,000 chars - is limit actually necessary?)
 class Evaluation(TimeStampedModel, UUIDPrimaryKeyBase, NamedModel):
+    class Meta:
+        indexes = [
+            GinIndex(fields=["search_vector"], name="evaluation_search_vector_idx"),
+            models.Index(fields=["visibility"], name="evaluation_visibility_idx"),
+            # The default jsonb_ops operator class, as jsonb_path_ops doesn't support the ?| used by search filters
+            GinIndex(fields=["topics"], name="evaluation_topics_idx"),
+            GinIndex(fields=["evaluation_type"], name="evaluation_type_idx"),
+            GinIndex(fields=["impact_design_name"], name="evaluation_impact_design_idx"),
+        ]
+
+    objects = EvaluationQuerySet.as_manager()
+
     users = models.ManyToManyField(User, related_name="evaluations")
 
     title = models.CharField(max_length=1024, blank=True, null=True)
     brief_description = models.TextField(blank=True, null=True)
     topics = models.JSONField(default=list)  # TODO - do we use these?
     organisations = models.JSONField(default=list)  # TODO - how are we going to do orgs?
+    # The organisations above that are in the Organisation table, kept in step on save, see link_organisations
+    linked_organisations = models.ManyToManyField(Organisation, related_name="evaluations", blank=True)
     visibility = models.CharField(
         max_length=256, blank=False, null=False, default=choices.EvaluationVisibility.DRAFT.value
     )
@@ -225,6 +361,7 @@ class Evaluation(TimeStampedModel, UUIDPrimaryKeyBase, NamedModel):
 
     # Search
     search_text = models.TextField(blank=True, null=True, max_length=65536)
+    search_vector = SearchVectorField(blank=True, null=True, editable=False)
 
     # For matching with initial data upload from RSM - evaluation id
     rsm_id = models.FloatField(blank=True, null=True)
@@ -233,7 +370,7 @@ class Evaluation(TimeStampedModel, UUIDPrimaryKeyBase, NamedModel):
         if self.page_statuses.get(page_name) == EvaluationPageStatus.DONE.name:
             return
         self.page_statuses[page_name] = status
-        self.save()
+        set_page_status(self.id, page_name, status)
 
     def get_list_topics_display_names(self):
         return [get_topic_display_name(x) for x in self.topics]
@@ -288,7 +425,7 @@ class Evaluation(TimeStampedModel, UUIDPrimaryKeyBase, NamedModel):
         return choices.YesNo.mapping[self.ethics_committee_approval]
 
     def get_impact_design_name_display_name(self):
-        return [name[1] for name in choices.ImpactEvalDesign.choices if name[0] in self.impact_design_name]
+        return choices.ImpactEvalDesign.get_labels(self.impact_design_name)
 
     def get_issue_description_option_display_name(self):
         return choices.YesNo.mapping[self.issue_description_option]
@@ -302,10 +439,15 @@ class Evaluation(TimeStampedModel, UUIDPrimaryKeyBase, NamedModel):
     def __str__(self):
         return f"{self.id} : {self.title}"
 
-    def save(self, force_insert=False, force_update=False, using=None, update_fields=None):
+    def get_own_search_text(self):
+        """
+        Search text for the fields stored on the evaluation itself, as (simple fields text, choice fields text).
+        Text from related objects is stored separately as SearchFragments, see search_index.
+        """
         # TODO: reduce massive duplication in search text calculations
         all_fields = self._meta.fields
-        combined_field_data = ""
+        simple_fields_text = ""
+        choice_fields_text = ""
 
         # Unique fields
         unique_fields = ["users"]
@@ -315,24 +457,10 @@ class Evaluation(TimeStampedModel, UUIDPrimaryKeyBase, NamedModel):
 
         # Ignore fields
         search_text_field = "search_text"
+        search_vector_field = "search_vector"
         page_statuses_field = "page_statuses"
         status_field = "status"
 
-        # Foreign key fields
-        foreign_key_fields = [
-            "interventions",
-            "outcome_measures",
-            "other_measures",
-            "process_standards",
-            "link_other_services",
-            "costs",
-            "grants",
-            "documents",
-            "event_dates",
-            "process_evaluation_aspects",
-            "process_evaluation_methods",
-        ]
-
         # Multiple choice fields
         multiple_choice_fields = ["evaluation_type"]
 
@@ -358,10 +486,11 @@ class Evaluation(TimeStampedModel, UUIDPrimaryKeyBase, NamedModel):
 
         # Simple fields
         exclusion_fields = (
-            foreign_key_fields
+            search_document_related_fields
             + multiple_choice_fields
             + single_choice_fields
             + [search_text_field]
+            + [search_vector_field]
             + [page_statuses_field]
             + [status_field]
             + list_fields
@@ -373,76 +502,184 @@ class Evaluation(TimeStampedModel, UUIDPrimaryKeyBase, NamedModel):
         for f in simple_fields:
             value = self.__getattribute__(f.name)
             if value:
-                combined_field_data += f"{value}|"
-        for foreign_key_field in foreign_key_fields:
-            related_field = self._meta.get_field(foreign_key_field)
-            relevant_model = related_field.related_model
-            related_objects = relevant_model.objects.filter(evaluation_id=self.id)
-
-            if related_objects:
-                for related_object in related_objects:
-                    related_object_search_text = related_object.get_search_text()
-                    if related_object_search_text:
-                        combined_field_data += f"{related_object_search_text}|"
+                simple_fields_text += f"{value}|"
 
         # Multiple choice fields & list fields
 
-        evaluation_type_text = choices.turn_choices_list_to_string(
-            self.evaluation_type, choices.EvaluationTypeOptions.options
-        )
-        combined_field_data += evaluation_type_text
+        evaluation_type_text = choices.turn_choices_list_to_string(self.evaluation_type, choices.EvaluationTypeOptions)
+        choice_fields_text += evaluation_type_text
 
-        impact_design_name_text = choices.turn_choices_list_to_string(
-            self.impact_design_name, choices.ImpactEvalDesign.options
-        )
-        combined_field_data += impact_design_name_text
+        impact_design_name_text = choices.turn_choices_list_to_string(self.impact_design_name, choices.ImpactEvalDesign)
+        choice_fields_text += impact_design_name_text
 
-        topics_text = choices.turn_choices_list_to_string(self.topics, choices.Topic.options)
-        combined_field_data += topics_text
+        topics_text = choices.turn_choices_list_to_string(self.topics, choices.Topic)
+        choice_fields_text += topics_text
 
-        organisations_text = choices.turn_choices_list_to_string(self.organisations, enums.Organisation.options)
-        combined_field_data += organisations_text
+        organisations_text = choices.turn_choices_list_to_string(self.organisations, get_organisations())
+        choice_fields_text += organisations_text
 
         # Single choice fields
 
         economic_types_text = choices.map_choice_or_other(
-            self.economic_type, choices.EconomicEvaluationType.options, append_separator=True
+            self.economic_type, choices.EconomicEvaluationType, append_separator=True
         )
-        combined_field_data += economic_types_text
+        choice_fields_text += economic_types_text
 
         impact_design_name_text = choices.map_choice_or_other(
-            self.impact_design_name, choices.ImpactEvalDesign.options, append_separator=True
+            self.impact_design_name, choices.ImpactEvalDesign, append_separator=True
         )
-        combined_field_data += impact_design_name_text
+        choice_fields_text += impact_design_name_text
 
         impact_effect_measure_interval_text = choices.map_choice_or_other(
-            self.impact_effect_measure_interval, choices.ImpactMeasureInterval.options, append_separator=True
+            self.impact_effect_measure_interval, choices.ImpactMeasureInterval, append_separator=True
         )
-        combined_field_data += impact_effect_measure_interval_text
+        choice_fields_text += impact_effect_measure_interval_text
 
         impact_framework_text = choices.map_choice_or_other(
-            self.impact_framework, choices.ImpactFramework.options, append_separator=True
+            self.impact_framework, choices.ImpactFramework, append_separator=True
         )
-        combined_field_data += impact_framework_text
+        choice_fields_text += impact_framework_text
 
         impact_basis_text = choices.map_choice_or_other(
-            self.impact_basis, choices.ImpactAnalysisBasis.options, append_separator=True
+            self.impact_basis, choices.ImpactAnalysisBasis, append_separator=True
         )
-        combined_field_data += impact_basis_text
+        choice_fields_text += impact_basis_text
 
         impact_effect_measure_type_text = choices.map_choice_or_other(
-            self.impact_effect_measure_type, choices.ImpactMeasureType.options, append_separator=True
+            self.impact_effect_measure_type, choices.ImpactMeasureType, append_separator=True
         )
-        combined_field_data += impact_effect_measure_type_text
+        choice_fields_text += impact_effect_measure_type_text
 
         impact_interpretation_type_text = choices.map_choice_or_other(
-            self.impact_interpretation_type, choices.ImpactEvalInterpretation.options, append_separator=True
+            self.impact_interpretation_type, choices.ImpactEvalInterpretation, append_separator=True
         )
-        combined_field_data += impact_interpretation_type_text
+        choice_fields_text += impact_interpretation_type_text
+
+        return simple_fields_text, choice_fields_text
+
+    def make_search_text(self, fragment_texts):
+        simple_fields_text, choice_fields_text = self.get_own_search_text()
+        related_objects_text = "".join(f"{fragment_text}|" for fragment_text in fragment_texts)
+        combined_field_data = simple_fields_text + related_objects_text + choice_fields_text
+        return combined_field_data.strip("|")
+
+    def save(self, force_insert=False, force_update=False, using=None, update_fields=None):
+        if self._state.adding:
+            super().save()
+        else:
+            # Leave the search fields alone, this instance's copy of them may be out of date
+            super().save(update_fields=get_non_search_field_names())
+        self.link_organisations()
+        # The search text is rebuilt by the reindex worker, see search_index
+        search_index.mark_dirty(self.id)
+        loader.forget(self.id)
+
+    # The organisations as they were loaded or last linked, new evaluations start with none
+    _linked_organisations = []
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        evaluation = super().from_db(db, field_names, values)
+        if "organisations" in evaluation.__dict__:
+            evaluation._linked_organisations = list(evaluation.organisations)
+        return evaluation
+
+    def link_organisations(self):
+        """
+        Copy organisations, the slugs the facade reads and writes, to linked_organisations, which search
+        filters and counts with an index join. Only writes when the slugs have changed since loading.
+        """
+        if "organisations" in self.get_deferred_fields() or self.organisations == self._linked_organisations:
+            return
+        slugs = Organisation.objects.filter(slug__in=self.organisations).values_list("slug", flat=True)
+        self.linked_organisations.set(list(slugs))
+        self._linked_organisations = list(self.organisations)
+
+
+def touch_contributed_evaluations(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    m2m_changed handler for Evaluation.users. Contributors are part of an evaluation's data (downloads include
+    their emails), so adding or removing one counts as modifying the evaluation.
+    """
+    if action == "pre_clear":
+        evaluation_ids = instance.evaluations.values_list("id", flat=True) if reverse else [instance.id]
+    elif action in ("post_add", "post_remove") and pk_set:
+        evaluation_ids = pk_set if reverse else [instance.id]
+    else:
+        return
+    for evaluation_id in list(evaluation_ids):
+        search_index.touch_evaluation(evaluation_id)
+
+
+def touch_evaluations_of_deleted_user(sender, instance, **kwargs):
+    """
+    pre_delete handler for User, deleting a user removes them from the evaluations they contribute to
+    """
+    for evaluation_id in list(instance.evaluations.values_list("id", flat=True)):
+        search_index.touch_evaluation(evaluation_id)
+
+
+@functools.lru_cache(maxsize=None)
+def get_non_search_field_names():
+    return tuple(
+        field.name
+        for field in Evaluation._meta.concrete_fields
+        if not field.primary_key and field.name not in ("search_text", "search_vector")
+    )
+
 
-        combined_field_data = combined_field_data.strip("|")
-        self.search_text = combined_field_data
-        return super().save()
+class SearchFragment(TimeStampedModel, UUIDPrimaryKeyBase):
+    """
+    The search text of one related object, e.g. an Intervention, so an evaluation's search text can be
+    reassembled without re-reading every related table
+    """
+
+    evaluation = models.ForeignKey(Evaluation, related_name="search_fragments", on_delete=models.CASCADE)
+    source_name = models.CharField(max_length=64)
+    source_id = models.UUIDField()
+    position = models.PositiveSmallIntegerField()
+    text = models.TextField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["source_name", "source_id"], name="unique_search_fragment_source"),
+        ]
+
+
+class SearchIndexQueueItem(models.Model):
+    """
+    An evaluation whose search text needs rebuilding, see search_index
+    """
+
+    evaluation = models.OneToOneField(Evaluation, primary_key=True, related_name="+", on_delete=models.CASCADE)
+    queued_at = models.DateTimeField()
+
+
+class RsmImport(TimeStampedModel):
+    """
+    The hashes of the RSM rows an evaluation was imported from, so upload_rsm_data --update can skip rows that
+    haven't changed and only replace the related objects of reports that have
+    """
+
+    evaluation = models.OneToOneField(Evaluation, primary_key=True, related_name="rsm_import", on_delete=models.CASCADE)
+    content_hash = models.CharField(max_length=64)
+    # {report_id: {"hash": hash of the report's rows, "objects": [[model name, id], ...]}}
+    reports = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+
+
+class ExportSnapshot(TimeStampedModel):
+    """
+    A data download written by build_export_snapshots, kept in the database so every web instance can serve it,
+    see snapshots
+    """
+
+    filename = models.CharField(max_length=256, primary_key=True)
+    content = models.BinaryField()
+    content_hash = models.CharField(max_length=64)
+    gzip_content = models.BinaryField()
+    gzip_hash = models.CharField(max_length=64)
+    # The get_slice_state of the evaluations it was built from
+    state = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
 
 
 class Intervention(TimeStampedModel, UUIDPrimaryKeyBase, NamedModel, SaveEvaluationOnSave):
@@ -505,13 +742,9 @@ class OutcomeMeasure(TimeStampedModel, UUIDPrimaryKeyBase, NamedModel, SaveEvalu
         return choices.MeasureType.mapping[self.measure_type]
 
     def get_search_text(self):
-        primary_or_secondary = [
-            value[1] for value in choices.OutcomeType.choices if value[0] == self.primary_or_secondary
-        ]
-        direct_or_surrogate = [
-            value[1] for value in choices.OutcomeMeasure.choices if value[0] == self.direct_or_surrogate
-        ]
-        measure_type = [value[1] for value in choices.MeasureType.choices if value[0] == self.measure_type]
+        primary_or_secondary = choices.OutcomeType.get_labels([self.primary_or_secondary])
+        direct_or_surrogate = choices.OutcomeMeasure.get_labels([self.direct_or_surrogate])
+        measure_type = choices.MeasureType.get_labels([self.measure_type])
 
         searchable_fields = [
             str(self.name),
@@ -543,7 +776,7 @@ class OtherMeasure(TimeStampedModel, UUIDPrimaryKeyBase, NamedModel, SaveEvaluat
         return choices.MeasureType.mapping[self.measure_type]
 
     def get_search_text(self):
-        measure_type = [value[1] for value in choices.MeasureType.choices if value[0] == self.measure_type]
+        measure_type = choices.MeasureType.get_labels([self.measure_type])
 
         searchable_fields = [
             str(self.name),
@@ -568,7 +801,7 @@ class ProcessStandard(TimeStampedModel, UUIDPrimaryKeyBase, NamedModel, SaveEval
         return choices.FullNoPartial.mapping[self.conformity]
 
     def get_search_text(self):
-        conformity = [value[1] for value in choices.YesNoPartial.choices if value[0] == self.conformity]
+        conformity = choices.YesNoPartial.get_labels([self.conformity])
 
         searchable_fields = [
             str(self.name),
@@ -593,7 +826,7 @@ class Document(TimeStampedModel, UUIDPrimaryKeyBase, NamedModel, SaveEvaluationO
     _name_field = "title"
 
     def get_search_text(self):
-        document_types = [value[1] for value in choices.DocumentType.choices if value[0] in self.document_types]
+        document_types = choices.DocumentType.get_labels(self.document_types)
 
         searchable_fields = [
             str(self.title),
@@ -625,8 +858,8 @@ class EventDate(TimeStampedModel, UUIDPrimaryKeyBase, NamedModel, SaveEvaluation
         return self.event_date_name
 
     def get_search_text(self):
-        event_date_type = [value[1] for value in choices.EventDateType.choices if value[0] == self.event_date_type]
-        event_date_name = [value[1] for value in choices.EventDateOption.choices if value[0] == self.event_date_name]
+        event_date_type = choices.EventDateType.get_labels([self.event_date_type])
+        event_date_name = choices.EventDateOption.get_labels([self.event_date_name])
 
         searchable_fields = [
             str(self.date),
@@ -723,7 +956,7 @@ class ProcessEvaluationAspect(TimeStampedModel, UUIDPrimaryKeyBase, NamedModel,
         return self.aspect_name
 
     def get_search_text(self):
-        aspect_name = [value[1] for value in choices.ProcessEvaluationAspects.choices if value[0] == self.aspect_name]
+        aspect_name = choices.ProcessEvaluationAspects.get_labels([self.aspect_name])
 
         searchable_fields = [
             str(self.aspect_name_other),
@@ -766,9 +999,7 @@ class ProcessEvaluationMethod(TimeStampedModel, UUIDPrimaryKeyBase, NamedModel,
             self.get_name(),
             self.method_name_other,
             self.more_information,
-            "|".join(
-                choices.turn_list_to_display_values(self.aspects_measured, choices.ProcessEvaluationAspects.options)
-            ),
+            "|".join(choices.turn_list_to_display_values(self.aspects_measured, choices.ProcessEvaluationAspects)),
         ]
         searchable_fields = [field for field in searchable_fields if field not in (None, "", " ", "None")]
         return "|".join(searchable_fields)
@@ -0,0 +1,68 @@
+"""
+Organisations an evaluation can be tagged with, from the GOV.UK organisations API.
+
+data/organisations.json is a copy of the API's results, refreshed by scripts/scrape_organisations.py.
+load_organisations copies it into the Organisation table, which is what the app reads (see
+models.get_organisations).
+"""
+
+import json
+
+from django.conf import settings
+
+DATA_PATH = settings.BASE_DIR / "data" / "organisations.json"
+
+
+def get_name(item):
+    title = item["title"]
+    abbreviation = item["details"]["abbreviation"]
+    if abbreviation:
+        title = f"{title} ({abbreviation})"
+    return title
+
+
+def read_organisations(path=DATA_PATH):
+    """
+    Return {slug: name} for every organisation in the file
+    """
+    with open(path) as organisations_file:
+        items = json.load(organisations_file)
+    return {item["details"]["slug"]: get_name(item) for item in items}
+
+
+def load_organisations(organisation_model, path=DATA_PATH):
+    """
+    Add any new organisations in the file and rename any whose names have changed, returning the slugs that were
+    (created, updated). Takes the model so migrations can pass their historical one.
+    Organisations that are no longer in the file are kept, evaluations may still be tagged with them.
+    """
+    names = read_organisations(path)
+    existing = organisation_model.objects.in_bulk(list(names))
+    to_create = [organisation_model(slug=slug, name=name) for slug, name in names.items() if slug not in existing]
+    to_update = []
+    for slug, organisation in existing.items():
+        if organisation.name != names[slug]:
+            organisation.name = names[slug]
+            to_update.append(organisation)
+    organisation_model.objects.bulk_create(to_create, batch_size=1000)
+    organisation_model.objects.bulk_update(to_update, ["name"], batch_size=1000)
+    return [organisation.slug for organisation in to_create], [organisation.slug for organisation in to_update]
+
+
+def link_evaluations(evaluation_model, slugs):
+    """
+    Link the evaluations tagged with any of the slugs to those organisations, e.g. organisations that have just been
+    added, which evaluations saved before then couldn't be linked to. Returns the number of links added.
+    """
+    if not slugs:
+        return 0
+    slugs = set(slugs)
+    evaluation_organisation_model = evaluation_model.linked_organisations.through
+    tagged_evaluations = evaluation_model.objects.filter(organisations__has_any_keys=list(slugs))
+    links = [
+        evaluation_organisation_model(evaluation_id=evaluation_id, organisation_id=slug)
+        for evaluation_id, organisations in tagged_evaluations.values_list("id", "organisations").iterator()
+        for slug in set(organisations) & slugs
+    ]
+    evaluation_organisation_model.objects.bulk_create(links, batch_size=1000, ignore_conflicts=True)
+    return len(links)
@@ -1,74 +1,101 @@
-from django.contrib.auth.decorators import login_required
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import prefetch_related_objects
 from django.shortcuts import render
+from django.template.loader import render_to_string
 
-from eva_reg.evaluation import choices, enums, models
+from eva_reg.evaluation import choices, models
 
 from .utils import check_evaluation_view_permission
 
+# Related objects shown on each overview tab, loaded with the evaluation when the tab isn't cached
+OVERVIEW_PREFETCH = {
+    "overview": ("event_dates", "link_other_services"),
+    "measured": ("interventions", "outcome_measures", "other_measures"),
+    "design": (),
+    "analysis": ("process_standards",),
+    "findings": (),
+    "costs": ("costs",),
+}
+
+OVERVIEW_TEMPLATES = {
+    "overview": "overview/evaluation-overview.html",
+    "measured": "overview/evaluation-overview-measured.html",
+    "design": "overview/evaluation-overview-design.html",
+    "analysis": "overview/evaluation-overview-analysis.html",
+    "findings": "overview/evaluation-overview-findings.html",
+    "costs": "overview/evaluation-overview-costs.html",
+}
+
 
 @check_evaluation_view_permission
 def evaluation_summary_overview_view(request, evaluation_id):
-    return evaluation_summary_view(request, evaluation_id, "overview/evaluation-overview.html")
+    return evaluation_summary_view(request, request.evaluation, "overview")
 
 
 @check_evaluation_view_permission
 def evaluation_measured_overview_view(request, evaluation_id):
-    return evaluation_summary_view(request, evaluation_id, "overview/evaluation-overview-measured.html")
+    return evaluation_summary_view(request, request.evaluation, "measured")
 
 
 @check_evaluation_view_permission
 def evaluation_design_overview_view(request, evaluation_id):
-    return evaluation_summary_view(request, evaluation_id, "overview/evaluation-overview-design.html")
+    return evaluation_summary_view(request, request.evaluation, "design")
 
 
 @check_evaluation_view_permission
 def evaluation_analysis_overview_view(request, evaluation_id):
-    return evaluation_summary_view(request, evaluation_id, "overview/evaluation-overview-analysis.html")
+    return evaluation_summary_view(request, request.evaluation, "analysis")
 
 
 @check_evaluation_view_permission
 def evaluation_findings_overview_view(request, evaluation_id):
-    return evaluation_summary_view(request, evaluation_id, "overview/evaluation-overview-findings.html")
+    return evaluation_summary_view(request, request.evaluation, "findings")
 
 
 @check_evaluation_view_permission
 def evaluation_cost_overview_view(request, evaluation_id):
-    return evaluation_summary_view(request, evaluation_id, "overview/evaluation-overview-costs.html")
+    return evaluation_summary_view(request, request.evaluation, "costs")
 
 
-@login_required
-def evaluation_summary_view(request, evaluation_id, page):
-    evaluation = models.Evaluation.objects.get(pk=evaluation_id)
-    user_can_edit = request.user in evaluation.users.all()
-    interventions = models.Intervention.objects.filter(evaluation_id=evaluation.id)
-    outcome_measures = models.OutcomeMeasure.objects.filter(evaluation_id=evaluation.id)
-    other_measures = models.OtherMeasure.objects.filter(evaluation_id=evaluation.id)
-    costs = models.EvaluationCost.objects.filter(evaluation_id=evaluation.id)
-    processes_and_standards = models.ProcessStandard.objects.filter(evaluation_id=evaluation.id)
-    evaluation_types = [
-        evaluation_type[1]
-        for evaluation_type in choices.EvaluationTypeOptions.choices
-        if evaluation_type[0] in evaluation.evaluation_type
-    ]
-    topics = [topic[1] for topic in choices.Topic.choices if topic[0] in evaluation.topics]
-    organisations = [
-        organisation[1] for organisation in enums.Organisation.choices if organisation[0] in evaluation.organisations
-    ]
-    dates = models.EventDate.objects.filter(evaluation_id=evaluation.id)
-    links = models.LinkOtherService.objects.filter(evaluation_id=evaluation.id)
+def get_overview_cache_key(evaluation, tab, user_can_edit):
+    modified_at = evaluation.modified_at.isoformat()
+    return f"evaluation-overview:{evaluation.id}:{tab}:{modified_at}:{evaluation.visibility}:{int(user_can_edit)}"
+
+
+def render_overview_tab(request, evaluation, tab, user_can_edit):
+    prefetch_related_objects([evaluation], *OVERVIEW_PREFETCH[tab])
+    evaluation_types = choices.EvaluationTypeOptions.get_labels(evaluation.evaluation_type)
+    topics = choices.Topic.get_labels(evaluation.topics)
+    organisations = models.get_organisations().get_labels(evaluation.organisations)
 
+    # Only the collections prefetched for this tab are evaluated by its template
     data = {
         "evaluation": evaluation,
         "user_can_edit": user_can_edit,
-        "interventions": interventions,
-        "outcome_measures": outcome_measures,
-        "other_measures": other_measures,
-        "costs": costs,
-        "processes_and_standards": processes_and_standards,
-        "date": dates,
-        "links": [{"name": link.name_of_service, "link": link.link_or_identifier} for link in links],
+        "interventions": evaluation.interventions.all(),
+        "outcome_measures": evaluation.outcome_measures.all(),
+        "other_measures": evaluation.other_measures.all(),
+        "costs": evaluation.costs.all(),
+        "processes_and_standards": evaluation.process_standards.all(),
+        "date": evaluation.event_dates.all(),
+        "links": evaluation.link_other_services.all(),
         "evaluation_types": evaluation_types,
         "topics": topics,
         "organisations": organisations,
     }
-    return render(request, page, {"data": data})
+    return render_to_string(OVERVIEW_TEMPLATES[tab], {"data": data}, request=request)
+
+
+def evaluation_summary_view(request, evaluation, tab):
+    """
+    The tab's HTML is cached per evaluation. Saving an evaluation, or any of its related objects,
+    moves its modified_at on so the old entries are no longer used.
+    """
+    user_can_edit = request.user in evaluation.users.all()
+    cache_key = get_overview_cache_key(evaluation, tab, user_can_edit)
+    tab_html = cache.get(cache_key)
+    if tab_html is None:
+        tab_html = render_overview_tab(request, evaluation, tab, user_can_edit)
+        cache.set(cache_key, tab_html, settings.OVERVIEW_CACHE_TIMEOUT)
+    return render(request, "overview/overview-page.html", {"tab_html": tab_html})
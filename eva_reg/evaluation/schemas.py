@@ -4,6 +4,22 @@ from eva_reg.evaluation.utils import is_civil_service_email
 
 from . import choices
 
+# Related objects dumped by EvaluationSchema's Function fields, prefetch these when dumping evaluations
+EVALUATION_SCHEMA_PREFETCH = (
+    "users",
+    "costs",
+    "documents",
+    "event_dates",
+    "process_evaluation_aspects",
+    "process_evaluation_methods",
+    "interventions",
+    "outcome_measures",
+    "other_measures",
+    "process_standards",
+    "grants",
+    "link_other_services",
+)
+
 
 def make_values_in_choices(choices_values):
     def values_in_choices(list_values):
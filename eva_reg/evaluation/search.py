@@ -0,0 +1,151 @@
+import base64
+import binascii
+import json
+
+from django.db import connection
+from django.db.models import Exists, OuterRef, Prefetch, Q
+
+from . import models
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Keyset orderings, always descending, with id as the tie-breaker
+RANK_ORDERING = ("rank", "id")
+MODIFIED_ORDERING = ("modified_at", "id")
+
+
+def prefetch_result_card_data(qs):
+    """
+    Prefetch the related names shown on each search result card, so a page costs the same number of queries
+    however many results it has
+    """
+    return qs.prefetch_related(
+        Prefetch("interventions", queryset=models.Intervention.objects.only("evaluation_id", "name")),
+        Prefetch("outcome_measures", queryset=models.OutcomeMeasure.objects.only("evaluation_id", "name")),
+    )
+
+
+def get_page_size(value):
+    try:
+        page_size = int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(page_size, MAX_PAGE_SIZE))
+
+
+def encode_cursor(values):
+    # Keep full microsecond precision for timestamps, DjangoJSONEncoder would truncate them
+    cursor_json = json.dumps(values, default=str)
+    return base64.urlsafe_b64encode(cursor_json.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor, ordering):
+    if not cursor:
+        return None
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, binascii.Error, UnicodeError):
+        return None
+    if not isinstance(values, list) or len(values) != len(ordering):
+        return None
+    return values
+
+
+def _make_cursor(evaluation, ordering):
+    return encode_cursor([getattr(evaluation, field) for field in ordering])
+
+
+def _make_keyset_filter(ordering, values, lookup):
+    """
+    Build a filter selecting rows strictly beyond the cursor, e.g. for ("rank", "id")
+    and lookup "lt": rank < r OR (rank = r AND id < i)
+    """
+    query = Q()
+    for position, field in enumerate(ordering):
+        equal_fields = {ordering[i]: values[i] for i in range(position)}
+        query |= Q(**equal_fields, **{f"{field}__{lookup}": values[position]})
+    return query
+
+
+def get_page(qs, ordering, after=None, before=None, page_size=DEFAULT_PAGE_SIZE):
+    """
+    Fetch one page of a queryset using keyset pagination, which costs the same however deep the page.
+    Pass the cursor of the last row seen as `after` to move forward, or the first row seen as `before` to move back.
+    """
+    after_values = decode_cursor(after, ordering)
+    before_values = decode_cursor(before, ordering)
+
+    if before_values and not after_values:
+        qs = qs.filter(_make_keyset_filter(ordering, before_values, "gt"))
+        rows = list(qs.order_by(*ordering)[: page_size + 1])
+        has_previous = len(rows) > page_size
+        has_next = True
+        evaluations = list(reversed(rows[:page_size]))
+    else:
+        if after_values:
+            qs = qs.filter(_make_keyset_filter(ordering, after_values, "lt"))
+        rows = list(qs.order_by(*[f"-{field}" for field in ordering])[: page_size + 1])
+        has_previous = bool(after_values)
+        has_next = len(rows) > page_size
+        evaluations = rows[:page_size]
+
+    page = {
+        "evaluations": evaluations,
+        "next_cursor": None,
+        "previous_cursor": None,
+        "page_size": page_size,
+    }
+    if evaluations and has_next:
+        page["next_cursor"] = _make_cursor(evaluations[-1], ordering)
+    if evaluations and has_previous:
+        page["previous_cursor"] = _make_cursor(evaluations[0], ordering)
+    return page
+
+
+LIST_FACETS = ("topics", "evaluation_type")
+
+
+def filter_by_any(qs, field_name, values):
+    """
+    Evaluations whose JSON list field_name includes any of the values, as a single ?| test that can use
+    the field's GIN index
+    """
+    return qs.filter(**{f"{field_name}__has_any_keys": list(values)})
+
+
+def filter_by_organisations(qs, slugs):
+    """
+    Evaluations tagged with any of the organisations, found through the linked_organisations index
+    """
+    links = models.Evaluation.linked_organisations.through.objects.filter(
+        evaluation_id=OuterRef("pk"), organisation_id__in=slugs
+    )
+    return qs.filter(Exists(links))
+
+
+def get_facet_counts(qs):
+    """
+    Count matching evaluations for every organisation, topic, evaluation type and visibility in one query.
+    Returns a dict of facet name -> {value: number of evaluations}
+    """
+    matching_sql, params = qs.order_by().values("id", "visibility", *LIST_FACETS).query.sql_with_params()
+    links_table = models.Evaluation.linked_organisations.through._meta.db_table
+    facet_queries = [
+        f"SELECT '{facet}', facet_value, COUNT(DISTINCT id) FROM matching, jsonb_array_elements_text(matching.{facet}) "
+        f"AS facet_value GROUP BY facet_value"
+        for facet in LIST_FACETS
+    ]
+    facet_queries.append(
+        f"SELECT 'organisations', link.organisation_id, COUNT(DISTINCT matching.id) FROM matching "
+        f"JOIN {links_table} AS link ON link.evaluation_id = matching.id GROUP BY link.organisation_id"
+    )
+    facet_queries.append("SELECT 'visibility', visibility, COUNT(DISTINCT id) FROM matching GROUP BY visibility")
+    sql = f"WITH matching AS ({matching_sql}) " + " UNION ALL ".join(facet_queries)
+
+    facet_counts = {facet: {} for facet in LIST_FACETS + ("organisations", "visibility")}
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        for facet, value, count in cursor.fetchall():
+            facet_counts[facet][value] = count
+    return facet_counts
@@ -0,0 +1,201 @@
+"""
+Incremental, deferred maintenance of evaluation search text.
+
+Each related object (Intervention, Document etc.) stores its own search text as a SearchFragment when it is
+saved. Changed evaluations are marked dirty in a queue table when the transaction commits, and the
+reindex_worker command drains the queue in batches, reassembling each evaluation's search text from its own
+fields plus its fragments. However many times an evaluation is saved before the worker gets to it, it is only
+rebuilt once.
+"""
+
+import itertools
+import threading
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from . import loader, models
+
+DEFAULT_BATCH_SIZE = 100
+
+_pending = threading.local()
+
+
+def _get_pending_evaluation_ids():
+    if not hasattr(_pending, "evaluation_ids"):
+        _pending.evaluation_ids = set()
+    return _pending.evaluation_ids
+
+
+def get_source_name(related_object):
+    return related_object._meta.get_field("evaluation").remote_field.related_name
+
+
+def update_fragment(related_object):
+    """
+    Store the search text for a related object that has just been saved, and mark its evaluation dirty
+    """
+    source_name = get_source_name(related_object)
+    text = related_object.get_search_text()
+    if text:
+        updated = models.SearchFragment.objects.filter(source_name=source_name, source_id=related_object.id).update(
+            evaluation_id=related_object.evaluation_id, text=text, modified_at=timezone.now()
+        )
+        if not updated:
+            models.SearchFragment.objects.create(
+                evaluation_id=related_object.evaluation_id,
+                source_name=source_name,
+                source_id=related_object.id,
+                position=models.search_document_related_fields.index(source_name),
+                text=text,
+            )
+    else:
+        models.SearchFragment.objects.filter(source_name=source_name, source_id=related_object.id).delete()
+    touch_evaluation(related_object.evaluation_id)
+    mark_dirty(related_object.evaluation_id)
+
+
+def remove_fragment(sender, instance, **kwargs):
+    """
+    post_delete handler for related objects
+    """
+    models.SearchFragment.objects.filter(source_name=get_source_name(instance), source_id=instance.id).delete()
+    touch_evaluation(instance.evaluation_id)
+    mark_dirty(instance.evaluation_id)
+
+
+def touch_evaluation(evaluation_id):
+    # Changing a related object counts as modifying the evaluation
+    models.Evaluation.objects.filter(id=evaluation_id).update(modified_at=timezone.now())
+    loader.forget(evaluation_id)
+
+
+def mark_dirty(evaluation_id):
+    """
+    Queue the evaluation's search text to be rebuilt when the current transaction commits
+    (immediately if there isn't one). The evaluations marked in a transaction are queued together, once each.
+    """
+    _get_pending_evaluation_ids().add(evaluation_id)
+    # Register every time, a rolled back transaction or savepoint drops its callbacks but not our pending ids
+    transaction.on_commit(_enqueue_pending)
+
+
+def _enqueue_pending():
+    """
+    Queue every pending evaluation, the first callback to run after a commit empties the set for the rest.
+    Ids left over from a rolled back transaction are queued with the next commit, which costs a rebuild of an
+    unchanged evaluation but means the set never outlives the next committed change.
+    """
+    pending_evaluation_ids = _get_pending_evaluation_ids()
+    evaluation_ids = list(pending_evaluation_ids)
+    pending_evaluation_ids.clear()
+    enqueue(evaluation_ids)
+
+
+def enqueue(evaluation_ids):
+    """
+    Add evaluations to the queue, ignoring any that have since been deleted. If one is already queued
+    (or being processed) its queued_at is moved on, so the worker won't remove it until it has seen the
+    latest change.
+    """
+    if not evaluation_ids:
+        return
+    queue_table = models.SearchIndexQueueItem._meta.db_table
+    evaluation_table = models.Evaluation._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {queue_table} (evaluation_id, queued_at) "
+            f"SELECT id, %s FROM {evaluation_table} WHERE id = ANY(%s) "
+            "ON CONFLICT (evaluation_id) DO UPDATE SET queued_at = EXCLUDED.queued_at",
+            [timezone.now(), list(evaluation_ids)],
+        )
+
+
+def get_fragment_texts_by_evaluation(evaluation_ids):
+    fragments = models.SearchFragment.objects.filter(evaluation_id__in=evaluation_ids).order_by(
+        "evaluation_id", "position", "created_at"
+    )
+    fragment_texts = {evaluation_id: [] for evaluation_id in evaluation_ids}
+    for evaluation_id, text in fragments.values_list("evaluation_id", "text"):
+        fragment_texts[evaluation_id].append(text)
+    return fragment_texts
+
+
+def rebuild_search_text(evaluation, fragment_texts):
+    """
+    Reassemble the evaluation's search text from its own fields and stored fragments, and write it
+    (with the search vector) without re-saving the rest of the evaluation
+    """
+    evaluation.search_text = evaluation.make_search_text(fragment_texts)
+    models.Evaluation.objects.filter(id=evaluation.id).update(
+        search_text=evaluation.search_text,
+        search_vector=models.make_search_vector(evaluation.title, evaluation.brief_description, evaluation.search_text),
+    )
+
+
+def process_batch(batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Rebuild the search text for up to batch_size queued evaluations, returning how many were processed.
+    Rows locked by another worker are skipped, so several workers can run at once.
+    """
+    with transaction.atomic():
+        queue_items = list(
+            models.SearchIndexQueueItem.objects.select_for_update(skip_locked=True).order_by("queued_at")[:batch_size]
+        )
+        if not queue_items:
+            return 0
+        evaluation_ids = [queue_item.evaluation_id for queue_item in queue_items]
+        evaluations = models.Evaluation.objects.in_bulk(evaluation_ids)
+        fragment_texts = get_fragment_texts_by_evaluation(evaluation_ids)
+        for evaluation_id, evaluation in evaluations.items():
+            rebuild_search_text(evaluation, fragment_texts[evaluation_id])
+        for queue_item in queue_items:
+            # Only remove items that haven't been queued again since we read them
+            models.SearchIndexQueueItem.objects.filter(
+                evaluation_id=queue_item.evaluation_id, queued_at=queue_item.queued_at
+            ).delete()
+    return len(queue_items)
+
+
+def process_queue(batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Drain the queue in the current process, e.g. in tests
+    """
+    total_processed = 0
+    while True:
+        processed = process_batch(batch_size)
+        if not processed:
+            return total_processed
+        total_processed += processed
+
+
+def make_fragments(evaluation_id, related_objects):
+    """
+    Unsaved fragments for an evaluation's related objects, in the order their text appears in the search text
+    """
+    fragments = []
+    for related_object in related_objects:
+        text = related_object.get_search_text()
+        if text:
+            source_name = get_source_name(related_object)
+            fragments.append(
+                models.SearchFragment(
+                    evaluation_id=evaluation_id,
+                    source_name=source_name,
+                    source_id=related_object.id,
+                    position=models.search_document_related_fields.index(source_name),
+                    text=text,
+                )
+            )
+    return sorted(fragments, key=lambda fragment: fragment.position)
+
+
+def rebuild_fragments(evaluation):
+    """
+    Recreate all fragments for an evaluation from its related objects
+    """
+    models.SearchFragment.objects.filter(evaluation_id=evaluation.id).delete()
+    related_objects = itertools.chain.from_iterable(
+        getattr(evaluation, related_field).all() for related_field in models.search_document_related_fields
+    )
+    models.SearchFragment.objects.bulk_create(make_fragments(evaluation.id, related_objects))
@@ -0,0 +1,178 @@
+"""
+Precomputed data downloads.
+
+The PUBLIC and CIVIL_SERVICE slices of the registry are the same for every (internal) user, so the
+build_export_snapshots command writes them to the database as CSV and JSON, with gzipped copies and a content hash
+for each. download_page_view serves these (from a copy on the web instance's disk) when they exist and are up to
+date, rather than serialising the registry again.
+
+Each snapshot records the state of its slices when it was built (see get_slice_state), and is only served while
+the slices are still in that state. Anything else, e.g. an evaluation being changed, moved to DRAFT or deleted, makes
+it stale until build_export_snapshots --watch, which runs as its own process, rebuilds it.
+"""
+
+import gzip
+import hashlib
+import os
+import pathlib
+import tempfile
+
+from django.conf import settings
+from django.contrib.postgres.aggregates import StringAgg
+from django.db.models import Count, Max, TextField
+from django.db.models.functions import MD5, Cast
+
+from . import exports
+from .choices import EvaluationVisibility
+from .models import Evaluation, ExportSnapshot
+
+# Download options that can be served from a snapshot, and the visibility each one selects
+SNAPSHOT_SLICES = {
+    "civil_service_only": EvaluationVisibility.CIVIL_SERVICE.value,
+    "public": EvaluationVisibility.PUBLIC.value,
+}
+
+SNAPSHOT_FORMATS = {
+    "csv": exports.iter_csv,
+    "json": exports.iter_json,
+}
+
+
+def get_snapshot_name(slices):
+    return "-".join(sorted(slices))
+
+
+def get_slice_queryset(slices):
+    visibilities = [SNAPSHOT_SLICES[slice_name] for slice_name in slices]
+    return Evaluation.objects.filter(visibility__in=visibilities)
+
+
+def get_slice_state(slices):
+    """
+    The number of evaluations in the slices, when the latest of them was modified and a hash of their page statuses,
+    from one aggregate query. Removing or deleting an evaluation changes the count, and changing or adding one changes
+    the latest modified_at (changes to related objects and contributors update it too). Page statuses are set without
+    updating modified_at (see models.set_page_status), so they're compared separately.
+    """
+    state = get_slice_queryset(slices).aggregate(
+        evaluation_count=Count("id"),
+        modified_at=Max("modified_at"),
+        page_statuses_hash=MD5(
+            StringAgg(Cast("page_statuses", TextField()), delimiter="\n", ordering="id", output_field=TextField())
+        ),
+    )
+    return {
+        "evaluation_count": state["evaluation_count"],
+        "modified_at": state["modified_at"] and state["modified_at"].isoformat(),
+        "page_statuses_hash": state["page_statuses_hash"],
+    }
+
+
+def get_all_slice_combinations():
+    slice_names = sorted(SNAPSHOT_SLICES)
+    combinations = [[]]
+    for slice_name in slice_names:
+        combinations = combinations + [combination + [slice_name] for combination in combinations]
+    return [combination for combination in combinations if combination]
+
+
+class SnapshotStorage:
+    """
+    Snapshots in the database (ExportSnapshot), shared by every process, with a copy of each kept in a local
+    directory to be served from. The copies are named by content hash, so one is never replaced while it's being
+    served, and are written to a temporary name then moved into place, so a download never sees a half-written file.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = pathlib.Path(directory or settings.EXPORT_SNAPSHOT_DIR)
+
+    def _replace(self, filename, content):
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{filename}.")
+        try:
+            with os.fdopen(file_descriptor, "wb") as temp_file:
+                temp_file.write(content)
+            os.replace(temp_path, self.directory / filename)
+        finally:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+    def _get_local_copy(self, filename, gzipped, content_hash):
+        """
+        The path of the local copy of a snapshot (or its gzipped copy), fetching it from the database if it isn't
+        there and removing copies of older versions. None if the snapshot has changed since content_hash was read.
+        """
+        local_name = f"{filename}.gz" if gzipped else filename
+        path = self.directory / f"{local_name}-{content_hash}"
+        if path.exists():
+            return path
+        content_field, hash_field = ("gzip_content", "gzip_hash") if gzipped else ("content", "content_hash")
+        content = (
+            ExportSnapshot.objects.filter(filename=filename, **{hash_field: content_hash})
+            .values_list(content_field, flat=True)
+            .first()
+        )
+        if content is None:
+            return None
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for old_path in self.directory.glob(f"{local_name}-*"):
+            if old_path != path:
+                old_path.unlink(missing_ok=True)
+        self._replace(path.name, bytes(content))
+        return path
+
+    def write(self, filename, chunks, state=None):
+        """
+        Store a snapshot and a gzipped copy, with their hashes and the state they were built from
+        """
+        content = b"".join(chunk.encode("utf-8") for chunk in chunks)
+        gzip_content = gzip.compress(content)
+        snapshot, _ = ExportSnapshot.objects.update_or_create(
+            filename=filename,
+            defaults={
+                "content": content,
+                "content_hash": hashlib.sha256(content).hexdigest(),
+                "gzip_content": gzip_content,
+                "gzip_hash": hashlib.sha256(gzip_content).hexdigest(),
+                "state": state or {},
+            },
+        )
+        return snapshot
+
+    def is_current(self, filename, state):
+        return ExportSnapshot.objects.filter(filename=filename, state=state).exists()
+
+    def get(self, filename, gzipped=False, state=None):
+        """
+        Return (path, etag) for a snapshot, or None if it hasn't been built or (if state is given) it was built from
+        a different state
+        """
+        info = ExportSnapshot.objects.filter(filename=filename).values("content_hash", "gzip_hash", "state").first()
+        if not info:
+            return None
+        if state is not None and info["state"] != state:
+            return None
+        content_hash = info["gzip_hash"] if gzipped else info["content_hash"]
+        path = self._get_local_copy(filename, gzipped, content_hash)
+        if not path:
+            return None
+        return path, f'"{content_hash}"'
+
+
+def build_snapshots(storage=None, stale_only=False):
+    """
+    Write every format of every combination of slices, or only those that are missing or out of date,
+    returning the names of the files written
+    """
+    storage = storage or SnapshotStorage()
+    filenames = []
+    for slices in get_all_slice_combinations():
+        # Read before the evaluations, so a change made during the build leaves the snapshot stale
+        state = get_slice_state(slices)
+        evaluations_qs = get_slice_queryset(slices).order_by("created_at")
+        for snapshot_format, make_chunks in SNAPSHOT_FORMATS.items():
+            filename = f"{get_snapshot_name(slices)}.{snapshot_format}"
+            if stale_only and storage.is_current(filename, state):
+                continue
+            storage.write(filename, make_chunks(evaluations_qs), state)
+            filenames.append(filename)
+    return filenames
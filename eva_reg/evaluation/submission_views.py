@@ -1,7 +1,6 @@
 import marshmallow
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
-from django.db.models import Q
 from django.shortcuts import redirect, render
 from django.urls import reverse
 
@@ -11,16 +10,23 @@ from .utils import (
     check_is_civil_service_user,
 )
 
+# The evaluation fields needed to navigate between wizard pages
+NAVIGATION_FIELDS = [
+    "id",
+    "title",
+    "page_statuses",
+    "evaluation_type",
+    "issue_description_option",
+    "ethics_option",
+    "grants_option",
+]
+
 
 @login_required
 def index_view(request):
     user = request.user
-    evaluations = models.Evaluation.objects.all()
-    query = Q()
-    query |= Q(visibility__contains=choices.EvaluationVisibility.PUBLIC.value)
-    query |= Q(users__in=[user])
-    total_evaluation_visible_to_user_count = evaluations.filter(query).count()
-    my_evaluations_count = evaluations.filter(users__in=[user]).count()
+    total_evaluation_visible_to_user_count = models.Evaluation.objects.visible_to(user).count()
+    my_evaluations_count = models.Evaluation.objects.filter(models.contributed_to_by(user)).count()
     feedback_email = settings.FEEDBACK_EMAIL
     context = {
         "total_evaluation_visible_to_user_count": total_evaluation_visible_to_user_count,
@@ -64,7 +70,7 @@ def create_evaluation(request):
 def simple_page_view(request, evaluation_id, page_data):
     page_name = page_data["page_name"]
     user = request.user
-    evaluation = interface.facade.evaluation.get(evaluation_id)
+    evaluation = interface.facade.evaluation.get(evaluation_id, fields=NAVIGATION_FIELDS)
     prev_url_name, next_url_name = pages.get_prev_next_page_name(page_name, get_page_options(evaluation))
     prev_url = make_evaluation_url(evaluation_id, prev_url_name)
     next_url = make_evaluation_url(evaluation_id, next_url_name)
@@ -140,7 +146,7 @@ def evaluation_view(request, evaluation_id, page_name, title):
         template_name,
         {
             "errors": errors,
-            "dropdown_choices": choices.dropdown_choices,
+            "dropdown_choices": {**choices.dropdown_choices, "organisations": models.get_organisations().choices},
             "visibilities": visibilities,
             "data": data,
             "next_url": next_url,
@@ -231,7 +237,7 @@ def make_summary_related_object_context(evaluation, model_name, form_data):
 @check_edit_evaluation_permission
 def summary_related_object_page_view(request, evaluation_id, model_name, form_data):
     user = request.user
-    evaluation = interface.facade.evaluation.get(evaluation_id)
+    evaluation = interface.facade.evaluation.get(evaluation_id, fields=NAVIGATION_FIELDS)
     object_name = form_data["object_name"]
     summary_page_name = form_data["summary_page_name"]
     page_url_name = form_data["page_url_name"]
@@ -261,7 +267,7 @@ def summary_related_object_page_view(request, evaluation_id, model_name, form_da
 
 
 def make_related_object_context(evaluation_id, title, object_name, url_names, dropdown_choices):
-    evaluation = interface.facade.evaluation.get(evaluation_id)
+    evaluation = interface.facade.evaluation.get(evaluation_id, fields=NAVIGATION_FIELDS)
     next_url = reverse(url_names["next_section_url_name"], args=(evaluation_id,))
     prev_url = reverse(url_names["prev_section_url_name"], args=(evaluation_id,))
     summary_url = reverse(url_names["summary_page"], args=(evaluation_id,))
@@ -542,7 +548,7 @@ def intervention_page_view(request, evaluation_id, intervention_id):
     model_name = "Intervention"
     title = "Interventions"
     template_name = "submissions/intervention-page.html"
-    evaluation = interface.facade.evaluation.get(evaluation_id)
+    evaluation = interface.facade.evaluation.get(evaluation_id, fields=NAVIGATION_FIELDS)
     url_names = get_related_object_page_url_names("interventions", get_page_options(evaluation))
     response = related_object_page_view(
         request,
@@ -576,7 +582,7 @@ def outcome_measure_page_view(request, evaluation_id, outcome_measure_id):
     model_name = "OutcomeMeasure"
     title = "Outcome measures"
     template_name = "submissions/outcome-measure-page.html"
-    evaluation = interface.facade.evaluation.get(evaluation_id)
+    evaluation = interface.facade.evaluation.get(evaluation_id, fields=NAVIGATION_FIELDS)
     url_names = get_related_object_page_url_names("outcome-measures", get_page_options(evaluation))
     response = related_object_page_view(
         request,
@@ -610,7 +616,7 @@ def other_measure_page_view(request, evaluation_id, other_measure_id):
     model_name = "OtherMeasure"
     title = "Other measures"
     template_name = "submissions/other-measure-page.html"
-    evaluation = interface.facade.evaluation.get(evaluation_id)
+    evaluation = interface.facade.evaluation.get(evaluation_id, fields=NAVIGATION_FIELDS)
     url_names = get_related_object_page_url_names("other-measures", get_page_options(evaluation))
     response = related_object_page_view(
         request,
@@ -644,7 +650,7 @@ def process_standard_page_view(request, evaluation_id, process_standard_id):
     model_name = "ProcessStandard"
     title = "Processes and standards"
     template_name = "submissions/processes-standard-page.html"
-    evaluation = interface.facade.evaluation.get(evaluation_id)
+    evaluation = interface.facade.evaluation.get(evaluation_id, fields=NAVIGATION_FIELDS)
     url_names = get_related_object_page_url_names("processes-standards", get_page_options(evaluation))
     response = related_object_page_view(
         request,
@@ -678,7 +684,7 @@ def grant_page_view(request, evaluation_id, grant_id):
     model_name = "Grant"
     title = "Grant"
     template_name = "submissions/grant-page.html"
-    evaluation = interface.facade.evaluation.get(evaluation_id)
+    evaluation = interface.facade.evaluation.get(evaluation_id, fields=NAVIGATION_FIELDS)
     url_names = get_related_object_page_url_names("grants", get_page_options(evaluation))
     response = related_object_page_view(
         request,
@@ -712,7 +718,7 @@ def evaluation_cost_page_view(request, evaluation_id, evaluation_cost_id):
     model_name = "EvaluationCost"
     title = "Evaluation costs and budget"
     template_name = "submissions/evaluation-cost-page.html"
-    evaluation = interface.facade.evaluation.get(evaluation_id)
+    evaluation = interface.facade.evaluation.get(evaluation_id, fields=NAVIGATION_FIELDS)
     url_names = get_related_object_page_url_names("evaluation-costs", get_page_options(evaluation))
     response = related_object_page_view(
         request,
@@ -729,7 +735,7 @@ def evaluation_cost_page_view(request, evaluation_id, evaluation_cost_id):
 
 def filter_evaluation_overview_users_view(request, evaluation_id):
     user = request.user
-    evaluation = interface.facade.evaluation.get(evaluation_id)
+    evaluation = interface.facade.evaluation.get(evaluation_id, fields=["users"])
     email_exists = any(email["email"] == user.email for email in evaluation["users"])
     if email_exists:
         return redirect("evaluation-overview", evaluation_id)
@@ -802,7 +808,7 @@ def document_page_view(request, evaluation_id, document_id):
     model_name = "Document"
     title = "Document"
     template_name = "submissions/document-page.html"
-    evaluation = interface.facade.evaluation.get(evaluation_id)
+    evaluation = interface.facade.evaluation.get(evaluation_id, fields=NAVIGATION_FIELDS)
     url_names = get_related_object_page_url_names("documents", get_page_options(evaluation))
     response = related_object_page_view(
         request,
@@ -836,7 +842,7 @@ def links_page_view(request, evaluation_id, link_id):
     model_name = "LinkOtherService"
     title = "Links to other service"
     template_name = "submissions/links-page.html"
-    evaluation = interface.facade.evaluation.get(evaluation_id)
+    evaluation = interface.facade.evaluation.get(evaluation_id, fields=NAVIGATION_FIELDS)
     url_names = get_related_object_page_url_names("links", get_page_options(evaluation))
     response = related_object_page_view(
         request,
@@ -870,7 +876,7 @@ def event_date_page_view(request, evaluation_id, event_date_id):
     model_name = "EventDate"
     title = "Event date"
     template_name = "submissions/event-date-page.html"
-    evaluation = interface.facade.evaluation.get(evaluation_id)
+    evaluation = interface.facade.evaluation.get(evaluation_id, fields=NAVIGATION_FIELDS)
     url_names = get_related_object_page_url_names("event-dates", get_page_options(evaluation))
     response = related_object_page_view(
         request,
@@ -947,7 +953,7 @@ def process_evaluation_method_page_view(request, evaluation_id, process_evaluati
 @check_edit_evaluation_permission
 def evaluation_process_design_aspects_view(request, evaluation_id):
     user = request.user
-    evaluation = interface.facade.evaluation.get(evaluation_id)
+    evaluation = interface.facade.evaluation.get(evaluation_id, fields=NAVIGATION_FIELDS)
     page_name = "process-design-aspects"
     title = "Process design: Aspects to investigate"
     page_options = {k: evaluation[k] for k in pages.page_options_mapping.keys()}
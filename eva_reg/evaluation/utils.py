@@ -9,7 +9,7 @@ from django.http import Http404
 
 from eva_reg.settings import ALLOWED_CIVIL_SERVICE_DOMAINS
 
-from . import choices, models
+from . import choices, events, loader
 
 event_names = set()
 
@@ -37,9 +37,14 @@ class DuplicateEvent(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=None)
+def get_signature(func):
+    return inspect.signature(func)
+
+
 def get_arguments(func, *args, **kwargs):
     """Calculate what the args would be inside a function"""
-    sig = inspect.signature(func)
+    sig = get_signature(func)
     bound_args = sig.bind(*args, **kwargs)
     bound_args.apply_defaults()
     arguments = bound_args.arguments
@@ -49,20 +54,26 @@ def get_arguments(func, *args, **kwargs):
 def _register_event(event_name, arguments):
     event_names.add(event_name)
     arguments = {key: value for (key, value) in arguments.items() if key != "self"}
-    event = models.Event(name=event_name, data=arguments)
-    event.save()
+    events.get_event_sink().record(event_name, arguments)
+
+
+@functools.lru_cache(maxsize=None)
+def get_schema_instance(schema_class):
+    # Schemas hold no state between loads and dumps, so one instance can be shared across threads
+    return schema_class()
 
 
 def resolve_schema(schema):
     """Allow either a class or an instance to be passed"""
     if isinstance(schema, marshmallow.schema.SchemaMeta):
-        schema = schema()
+        schema = get_schema_instance(schema)
     return schema
 
 
 def register_event(event_name):
     def _decorator(func):
         func.event_name = event_name
+        get_signature(func)
 
         @functools.wraps(func)
         def _inner(*args, **kwargs):
@@ -86,7 +97,7 @@ def process_self(func, arguments):
 def check_edit_evaluation_permission(func):
     def wrapper(request, *args, **kwargs):
         evaluation_id = kwargs["evaluation_id"]
-        evaluation = models.Evaluation.objects.get(pk=evaluation_id)
+        evaluation = loader.get_evaluation(evaluation_id)
         evaluation_users = evaluation.users.all()
         if request.user not in evaluation_users:
             raise Http404("Evaluation not found")
@@ -95,35 +106,53 @@ def check_edit_evaluation_permission(func):
     return wrapper
 
 
-def apply_schema(schema, data, load_or_dump):
+def project_schema(schema, only):
+    """A copy of the schema that only includes the fields in only"""
+    schema = resolve_schema(schema)
+    return _get_projected_schema(schema.__class__, tuple(sorted(only)), schema.many, schema.unknown)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_projected_schema(schema_class, only, many, unknown):
+    return schema_class(only=only, many=many, unknown=unknown)
+
+
+def apply_schema(schema, data, load_or_dump, only=None):
     """Apply a schema to some data"""
     if not schema:
         return data
     if load_or_dump not in ("load", "dump"):
         raise ValueError(f"Unknown value {load_or_dump}")
     if schema:
-        schema = resolve_schema(schema)
+        schema = project_schema(schema, only) if only else resolve_schema(schema)
         arguments = getattr(schema, load_or_dump)(data)
     return arguments
 
 
-def with_schema(default=None, load=None, dump=None):
+def with_schema(default=None, load=None, dump=None, only_argument=None):
     """Applies the load_schema.load on the arguments to the function,
     and dump_schema.dump on the result of the function.
 
     This ensures that validation has been passed and that the result of the
-    function is JSON serialisable"""
-    load_schema = load or default
-    dump_schema = dump or default
+    function is JSON serialisable
+
+    If only_argument names an argument of the function, the field names passed in it
+    (if any) restrict what is dumped"""
+    # Resolved once here, building a large schema is slow
+    load_schema = resolve_schema(load or default)
+    dump_schema = resolve_schema(dump or default)
 
     def _decorator(func):
+        get_signature(func)
+
         @functools.wraps(func)
         def _inner(*args, **kwargs):
             arguments = get_arguments(func, *args, **kwargs)
             bound_func, arguments = process_self(func, arguments)
             arguments = apply_schema(load_schema, arguments, "load")
             result = bound_func(**arguments)
-            result = apply_schema(dump_schema, result, "dump")
+            only = arguments.get(only_argument) if only_argument else None
+            result = apply_schema(dump_schema, result, "dump", only=only)
             return result
 
         return _inner
@@ -172,37 +201,56 @@ class ChoicesMeta(enum.EnumMeta):
         cls = super().__new__(metacls, classname, bases, classdict, **kwds)
         for member, label in zip(cls.__members__.values(), labels):
             member._label_ = label
-        return enum.unique(cls)
+        cls = enum.unique(cls)
+        # Members can't change after class creation, so work out every view of them once
+        cls._names_ = tuple(member.name for member in cls)
+        cls._choices_ = tuple((member.name, member.label) for member in cls)
+        cls._labels_ = tuple(label for _, label in cls._choices_)
+        cls._options_ = tuple({"value": value, "text": text} for value, text in cls._choices_)
+        cls._mapping_ = types.MappingProxyType(dict(cls._choices_))
+        cls._positions_ = types.MappingProxyType({name: position for position, name in enumerate(cls._names_)})
+        cls._member_values_ = frozenset(member.value for member in cls)
+        return cls
 
     def __contains__(cls, member):
         if not isinstance(member, enum.Enum):
             # Allow non-enums to match against member values.
-            return any(x.value == member for x in cls)
+            try:
+                return member in cls._member_values_
+            except TypeError:  # Unhashable, so can't be a member value
+                return False
         return super().__contains__(member)
 
     @property
     def names(cls):
-        return tuple(member.name for member in cls)
+        return cls._names_
 
     @property
     def choices(cls):
-        return tuple((member.name, member.label) for member in cls)
+        return cls._choices_
 
     @property
     def labels(cls):
-        return tuple(label for _, label in cls.choices)
+        return cls._labels_
 
     @property
     def values(cls):
-        return tuple(value for value, _ in cls.choices)
+        return cls._names_
 
     @property
     def options(cls):
-        return tuple({"value": value, "text": text} for value, text in cls.choices)
+        return cls._options_
 
     @property
     def mapping(cls):
-        return dict(tuple(cls.choices))
+        return cls._mapping_
+
+    def get_labels(cls, values):
+        """
+        Labels of the given values in choice order, ignoring any that aren't choices
+        """
+        known_values = {value for value in values if value in cls._positions_}
+        return [cls._mapping_[value] for value in sorted(known_values, key=cls._positions_.__getitem__)]
 
 
 class Choices(enum.Enum, metaclass=ChoicesMeta):
@@ -225,20 +273,29 @@ class Choices(enum.Enum, metaclass=ChoicesMeta):
 
 
 def restrict_to_permitted_evaluations(user, evaluations_qs):
-    evals_for_user_qs = evaluations_qs.filter(users__in=[user])
-    public_evals_qs = evaluations_qs.filter(visibility=choices.EvaluationVisibility.PUBLIC.value)
-    restricted_evaluations_qs = evals_for_user_qs | public_evals_qs
-    if not user.is_external_user:
-        civil_service_evals_qs = evaluations_qs.filter(visibility=choices.EvaluationVisibility.CIVIL_SERVICE.value)
-        restricted_evaluations_qs = civil_service_evals_qs | restricted_evaluations_qs
-    return restricted_evaluations_qs
+    return evaluations_qs.visible_to(user)
+
+
+def get_evaluation_bundle(evaluation_id, prefetch=()):
+    """
+    Fetch an evaluation with its users and any other related collections in one prefetch pass
+    """
+    return loader.get_evaluation(evaluation_id, prefetch)
+
 
+def check_evaluation_view_permission(func=None, prefetch=()):
+    """
+    The evaluation is loaded once, with the related collections in prefetch, and passed to the view as
+    request.evaluation. Use as @check_evaluation_view_permission or @check_evaluation_view_permission(prefetch=...)
+    """
+    if func is None:
+        return functools.partial(check_evaluation_view_permission, prefetch=prefetch)
 
-def check_evaluation_view_permission(func):
     @login_required
     def wrapper(request, *args, **kwargs):
         evaluation_id = kwargs["evaluation_id"]
-        evaluation = models.Evaluation.objects.get(pk=evaluation_id)
+        evaluation = get_evaluation_bundle(evaluation_id, prefetch)
+        request.evaluation = evaluation
         evaluation_users = evaluation.users.all()
         civil_service_user = not request.user.is_external_user
         evaluation_is_public = evaluation.visibility == choices.EvaluationVisibility.PUBLIC.value
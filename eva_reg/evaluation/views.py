@@ -1,25 +1,20 @@
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
-from django.contrib.postgres.search import (
-    SearchQuery,
-    SearchRank,
-    SearchVector,
-)
-from django.db.models import Q
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast
 from django.http import HttpResponseNotAllowed
 from django.shortcuts import redirect, render
+from django.urls import reverse
 from django.views.decorators.http import require_http_methods
 from marshmallow import EXCLUDE
 from marshmallow.exceptions import ValidationError
 
 from eva_reg.evaluation import interface, schemas
 
-from . import choices, enums, models
+from . import choices, models, search
 from .email_handler import send_contributor_added_email, send_invite_email
-from .utils import (
-    check_edit_evaluation_permission,
-    restrict_to_permitted_evaluations,
-)
+from .utils import check_edit_evaluation_permission
 
 
 class MethodDispatcher:
@@ -42,45 +37,44 @@ def beta_test_view(request, exception=None):
     return render(request, "beta/beta-test.html", {})
 
 
-def get_search_filters(qs, organisations, topics, visibility, evaluation_types):
-    organisation_filters = enums.Organisation.choices
-    filtered_organisation_filters = [
-        organisation_filter
-        for organisation_filter in organisation_filters
-        if organisation_filter[0] in organisations or any(organisation_filter[0] in i.organisations for i in qs)
-    ]
-
-    topic_filters = choices.Topic.choices
-    filtered_topics_filters = [
-        topic_filter
-        for topic_filter in topic_filters
-        if topic_filter[0] in topics or any(topic_filter[0] in i.topics for i in qs)
+def make_facet_filters(facet_choices, facet_counts, selected):
+    return [
+        (value, label, facet_counts.get(value, 0))
+        for value, label in facet_choices
+        if value in selected or facet_counts.get(value)
     ]
 
-    visibility_filters = choices.EvaluationVisibility.choices
-    filtered_visibility_filters = [
-        visibility_filter
-        for visibility_filter in visibility_filters
-        if visibility_filter[0] in visibility or any(visibility_filter[0] in i.visibility for i in qs)
-    ]
-
-    evaluation_types_filters = choices.EvaluationTypeOptions.choices
-    filtered_evaluation_types_filters = [
-        evaluation_types_filter
-        for evaluation_types_filter in evaluation_types_filters
-        if evaluation_types_filter[0] in evaluation_types
-        or any(evaluation_types_filter[0] in i.evaluation_type for i in qs)
-    ]
 
+def get_search_filters(qs, organisations, topics, visibility, evaluation_types):
+    facet_counts = search.get_facet_counts(qs)
     output = {
-        "visibilities": filtered_visibility_filters,
-        "evaluation_types": filtered_evaluation_types_filters,
-        "topics": filtered_topics_filters,
-        "organisations": filtered_organisation_filters,
+        "visibilities": make_facet_filters(
+            choices.EvaluationVisibility.choices, facet_counts["visibility"], visibility
+        ),
+        "evaluation_types": make_facet_filters(
+            choices.EvaluationTypeOptions.choices, facet_counts["evaluation_type"], evaluation_types
+        ),
+        "topics": make_facet_filters(choices.Topic.choices, facet_counts["topics"], topics),
+        "organisations": make_facet_filters(
+            models.get_organisations().choices, facet_counts["organisations"], organisations
+        ),
     }
     return output
 
 
+def make_search_page_url(request, after=None, before=None):
+    if not (after or before):
+        return None
+    params = request.GET.copy()
+    params.pop("after", None)
+    params.pop("before", None)
+    if after:
+        params["after"] = after
+    if before:
+        params["before"] = before
+    return f"{reverse('search')}?{params.urlencode()}"
+
+
 @login_required
 @require_http_methods(["GET"])
 class EvaluationSearchView(MethodDispatcher):
@@ -93,49 +87,43 @@ class EvaluationSearchView(MethodDispatcher):
         active_filter = request.GET.get("active_filter")
         current_url = request.get_full_path()
 
-        qs = models.Evaluation.objects.all()
-        qs = restrict_to_permitted_evaluations(request.user, qs)
+        qs = models.Evaluation.objects.visible_to(request.user)
         total_evaluations = qs.count()
 
         if organisations:
-            organisations_qs = models.Evaluation.objects.none()
-            for organisation in organisations:
-                organisation_qs = qs.filter(organisations__contains=organisation)
-                organisations_qs = organisations_qs | organisation_qs
-            qs = organisations_qs
+            qs = search.filter_by_organisations(qs, organisations)
         if topics:
-            topics_qs = models.Evaluation.objects.none()
-            for topic in topics:
-                topic_qs = qs.filter(topics__contains=topic)
-                topics_qs = topics_qs | topic_qs
-            qs = topics_qs
+            qs = search.filter_by_any(qs, "topics", topics)
         if evaluation_types:
-            evaluation_types_qs = models.Evaluation.objects.none()
-            for evaluation_type in evaluation_types:
-                evaluation_type_qs = qs.filter(evaluation_type__contains=evaluation_type)
-                evaluation_types_qs = evaluation_types_qs | evaluation_type_qs
-            qs = evaluation_types_qs
+            qs = search.filter_by_any(qs, "evaluation_type", evaluation_types)
         filters = get_search_filters(qs, organisations, topics, visibility, evaluation_types)
-        if visibility:
-            query = Q()
-            if choices.EvaluationVisibility.DRAFT.value in visibility:
-                query |= Q(visibility__contains=choices.EvaluationVisibility.DRAFT.value)
-            if choices.EvaluationVisibility.PUBLIC.value in visibility:
-                query |= Q(visibility__contains=choices.EvaluationVisibility.PUBLIC.value)
-            if choices.EvaluationVisibility.CIVIL_SERVICE.value in visibility:
-                query |= Q(visibility__contains=choices.EvaluationVisibility.CIVIL_SERVICE.value)
-            qs = qs.filter(query)
-        # For now, place the highest weight on title and description
+        selected_visibilities = [value for value in visibility if value in choices.EvaluationVisibility]
+        if selected_visibilities:
+            qs = qs.filter(visibility__in=selected_visibilities)
+        # Weighted search vector is stored on the evaluation, see models.get_search_vector
         if search_term:
-            search_vector = SearchVector("title", "brief_description", weight="A") + SearchVector(
-                "search_text", weight="B"
-            )
             search_query = SearchQuery(search_term)
-            rank = SearchRank(search_vector, search_query)
-            qs = qs.annotate(search=search_vector).annotate(rank=rank).filter(search=search_query).order_by("-rank")
+            # Cast the rank to double precision so it survives the round trip through a pagination cursor
+            rank = Cast(SearchRank(F("search_vector"), search_query), FloatField())
+            qs = qs.filter(search_vector=search_query).annotate(rank=rank)
+            ordering = search.RANK_ORDERING
+        else:
+            ordering = search.MODIFIED_ORDERING
+
+        result_count = qs.count()
+        page = search.get_page(
+            search.prefetch_result_card_data(qs),
+            ordering,
+            after=request.GET.get("after"),
+            before=request.GET.get("before"),
+            page_size=search.get_page_size(request.GET.get("page_size")),
+        )
 
         data = {
-            "evaluations": qs,
+            "evaluations": page["evaluations"],
+            "result_count": result_count,
+            "next_url": make_search_page_url(request, after=page["next_cursor"]),
+            "previous_url": make_search_page_url(request, before=page["previous_cursor"]),
             "visibilities": filters["visibilities"],
             "evaluation_types": filters["evaluation_types"],
             "topics": filters["topics"],
@@ -7,7 +7,7 @@ from django.templatetags.static import static
 from django.urls import reverse
 from markdown_it import MarkdownIt
 
-from eva_reg.evaluation import fields, models, pages
+from eva_reg.evaluation import fields, loader, models, pages
 
 markdown_converter = MarkdownIt()
 
@@ -95,7 +95,7 @@ def get_status_chip_colour(status):
 
 
 def get_visibility_display_name_for_evaluation(evaluation_id):
-    evaluation = models.Evaluation.objects.get(pk=evaluation_id)
+    evaluation = loader.get_evaluation(evaluation_id)
     return evaluation.get_visibility_display_name()
 
 
@@ -29,6 +29,14 @@ VCAP_APPLICATION = env.json("VCAP_APPLICATION", default={})
 BASE_URL = env.str("BASE_URL")
 BASIC_AUTH = env.str("BASIC_AUTH", default="")
 
+# How events from @register_event are written, "buffered" (at transaction commit) or "synchronous"
+EVENT_SINK = env.str("EVENT_SINK", default="buffered")
+# How long prune_events keeps events for
+EVENT_RETENTION_DAYS = env.int("EVENT_RETENTION_DAYS", default=365 * 2)
+
+# Where web servers keep their copies of the precomputed data downloads written by build_export_snapshots
+EXPORT_SNAPSHOT_DIR = env.str("EXPORT_SNAPSHOT_DIR", default=str(BASE_DIR / "export-snapshots"))
+
 APPEND_SLASH = True
 
 ALLOWED_HOSTS = [
@@ -88,6 +96,7 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "global_login_required.GlobalLoginRequiredMiddleware",
+    "eva_reg.evaluation.loader.evaluation_loader_middleware",
 ]
 
 if BASIC_AUTH:
@@ -149,6 +158,12 @@ DATABASES = {
     }
 }
 
+# e.g. CACHE_URL=dbcache://cache_table or filecache:///tmp/eva-reg-cache
+CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}
+
+# How long a rendered overview tab is kept. Keys include the evaluation's modified_at, so edits are never served stale
+OVERVIEW_CACHE_TIMEOUT = env.int("OVERVIEW_CACHE_TIMEOUT", default=60 * 60 * 24)
+
 AUTHENTICATION_BACKENDS = [
     "django.contrib.auth.backends.ModelBackend",
     "allauth.account.auth_backends.AuthenticationBackend",
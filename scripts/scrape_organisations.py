@@ -5,7 +5,6 @@ import httpx
 
 __here__ = pathlib.Path(__file__).parent
 DATA_DIR = __here__ / ".." / "data"
-APP_DIR = __here__ / ".." / "eva_reg" / "evaluation"
 
 base_url = "https://www.gov.uk/api/organisations"
 
@@ -30,40 +29,15 @@ def gather_results(start_url):
 
 
 def dump_data(data):
-    output_filename = DATA_DIR / "organisations_raw.json"
+    output_filename = DATA_DIR / "organisations.json"
     with output_filename.open("w") as f:
         json.dump(data, f, indent=2)
 
 
-def get_name(item):
-    title = item["title"]
-    abbreviation = item["details"]["abbreviation"]
-    if abbreviation:
-        title = f"{title} ({abbreviation})"
-    return title
-
-
-def dump_python(data):
-    python_template = """
-from . import utils
-
-org_tuples = (
-{org_tuples}
-)
-Organisation = utils.Choices("Organisation", org_tuples)
-"""
-    org_tuples = tuple((item["details"]["slug"], get_name(item)) for item in data)
-    org_tuples = sorted(org_tuples, key=lambda x: x[1].lower())
-    org_tuples = ",\n".join(repr(t) for t in org_tuples)
-    content = python_template.format(org_tuples=org_tuples)
-    output_filename = APP_DIR / "data.py"
-    output_filename.write_text(content)
-
-
 def main():
     results = list(gather_results(base_url))
     dump_data(results)
-    dump_python(results)
+    print("Wrote data/organisations.json, run `manage.py load_organisations` to update the database")  # noqa: T201
 
 
 if __name__ == "__main__":
@@ -1,3 +1,5 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from nose import with_setup
 
 from eva_reg.evaluation import choices, fields, interface, models
@@ -163,3 +165,68 @@ def test_overview_external_access(client):
     check_overview_urls(client, evaluation_ids["civil_service"], expected_status_code=404)
     check_overview_urls(client, evaluation_ids["draft_not_a_contributor"], expected_status_code=404)
     check_overview_urls(client, evaluation_ids["draft_contributor"], expected_status_code=200)
+
+
+def count_overview_queries(client, evaluation_id):
+    query_counts = {}
+    for url in OVERVIEW_URLS:
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(f"/evaluation-summary/{evaluation_id}{url}")
+        assert response.status_code == 200, response.status_code
+        query_counts[url] = len(context.captured_queries)
+    return query_counts
+
+
+def add_overview_related_objects(evaluation, number):
+    for i in range(number):
+        models.Intervention(evaluation=evaluation, name=f"Overview intervention {i}").save()
+        models.OutcomeMeasure(evaluation=evaluation, name=f"Overview outcome {i}").save()
+        models.OtherMeasure(evaluation=evaluation, name=f"Overview measure {i}").save()
+        models.EvaluationCost(evaluation=evaluation, item_name=f"Overview cost {i}").save()
+        models.ProcessStandard(evaluation=evaluation, name=f"Overview standard {i}").save()
+        models.EventDate(
+            evaluation=evaluation, event_date_name="OTHER", event_date_name_other=f"Overview date {i}"
+        ).save()
+        models.LinkOtherService(
+            evaluation=evaluation, name_of_service=f"Overview link {i}", link_or_identifier="example.com"
+        ).save()
+
+
+@utils.with_authenticated_client
+def test_overview_query_count(client):
+    evaluations = []
+    for number in (1, 3):
+        evaluation = models.Evaluation(
+            title="Overview query count", visibility=choices.EvaluationVisibility.PUBLIC.value
+        )
+        evaluation.save()
+        add_overview_related_objects(evaluation, number)
+        evaluations.append(evaluation)
+
+    query_counts = [count_overview_queries(client, evaluation.id) for evaluation in evaluations]
+    assert query_counts[0] == query_counts[1], query_counts
+    response = client.get(f"/evaluation-summary/{evaluations[1].id}/overview/")
+    assert "Overview link 2" in response.text
+    assert "Overview date 2" in response.text
+    models.Evaluation.objects.filter(title="Overview query count").delete()
+
+
+@utils.with_authenticated_client
+def test_overview_cache(client):
+    evaluation = models.Evaluation(title="Overview cache", visibility=choices.EvaluationVisibility.PUBLIC.value)
+    evaluation.save()
+    add_overview_related_objects(evaluation, 1)
+    url = f"/evaluation-summary/{evaluation.id}/overview/"
+    first_query_counts = count_overview_queries(client, evaluation.id)
+    second_query_counts = count_overview_queries(client, evaluation.id)
+    assert second_query_counts[OVERVIEW_URLS[0]] < first_query_counts[OVERVIEW_URLS[0]], second_query_counts
+
+    # Bypassing save, so the cached tab is still served
+    models.LinkOtherService.objects.filter(evaluation=evaluation).update(name_of_service="Overview link changed")
+    assert "Overview link 0" in client.get(url).text
+
+    models.LinkOtherService.objects.get(evaluation=evaluation).save()
+    response = client.get(url)
+    assert "Overview link changed" in response.text
+    assert "Overview link 0" not in response.text
+    models.Evaluation.objects.filter(title="Overview cache").delete()
@@ -13,6 +13,13 @@ def test_get_display_name():
     assert start == "Evaluation start", start
     assert not other, other
 
+    start = choices.get_display_name("EVALUATION_START", choices.EventDateOption)
+    other = choices.get_display_name("A N other", choices.EventDateOption)
+    unhashable = choices.get_display_name(["EVALUATION_START"], choices.EventDateOption)
+    assert start == "Evaluation start", start
+    assert not other, other
+    assert not unhashable, unhashable
+
 
 def test_map_choice_or_other():
     start = choices.map_choice_or_other("EVALUATION_START", choices.EventDateOption.options)
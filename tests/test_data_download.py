@@ -1,3 +1,24 @@
+import csv
+import io
+import json
+import pathlib
+import tempfile
+import zipfile
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from django.test import override_settings
+
+from eva_reg.evaluation import choices, snapshots
+from eva_reg.evaluation.models import (
+    Evaluation,
+    EvaluationCost,
+    ExportSnapshot,
+    Intervention,
+    User,
+    set_page_status,
+)
+
 from .utils import with_authenticated_client, with_client
 
 
@@ -11,3 +32,169 @@ def test_get_data_download_not_authenticated(client):
 def test_get_data_download(client):
     response = client.get("/data-download/")
     assert response.status_code == 200, response.status_code
+
+
+def setup_download_evaluations():
+    user = User.objects.get(email="peter.rabbit@example.com")
+    for i in range(3):
+        evaluation = Evaluation(title=f"Download evaluation {i}", topics=["TRANSPORT"])
+        evaluation.save()
+        evaluation.users.add(user)
+        Intervention(evaluation=evaluation, name=f"Download intervention {i}").save()
+        EvaluationCost(evaluation=evaluation, item_name="Biscuits", item_cost=12).save()
+
+
+def teardown_download_evaluations():
+    Evaluation.objects.filter(title__startswith="Download evaluation").delete()
+
+
+@with_authenticated_client
+def test_download_json(client):
+    setup_download_evaluations()
+    response = client.get("/data-download/", params={"json": "", "my_evaluations": ""})
+    assert response.status_code == 200, response.status_code
+    assert response.headers["Content-Disposition"] == "attachment; filename=evaluation-data.json"
+    data = json.loads(response.content)
+    downloaded = {item["title"]: item for item in data if item["title"].startswith("Download evaluation")}
+    assert len(downloaded) == 3, downloaded.keys()
+    assert downloaded["Download evaluation 1"]["interventions"][0]["name"] == "Download intervention 1"
+    assert downloaded["Download evaluation 1"]["costs"][0]["item_cost"] == 12
+    assert downloaded["Download evaluation 1"]["users"] == [{"email": "peter.rabbit@example.com"}]
+    teardown_download_evaluations()
+
+
+@with_authenticated_client
+def test_download_csv(client):
+    setup_download_evaluations()
+    response = client.get("/data-download/", params={"csv": "", "my_evaluations": ""})
+    assert response.status_code == 200, response.status_code
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    titles = {row["title"] for row in rows}
+    assert {"Download evaluation 0", "Download evaluation 1", "Download evaluation 2"} <= titles, titles
+    assert "Download intervention 2" in response.text
+    teardown_download_evaluations()
+
+
+@with_authenticated_client
+def test_download_empty_csv(client):
+    response = client.get("/data-download/", params={"csv": ""})
+    assert response.status_code == 200, response.status_code
+    assert response.text == "\r\n", response.text
+
+
+@with_authenticated_client
+def test_download_snapshot(client):
+    evaluation = Evaluation(title="Download evaluation snapshot", visibility=choices.EvaluationVisibility.PUBLIC.value)
+    evaluation.save()
+    with tempfile.TemporaryDirectory() as snapshot_dir, override_settings(EXPORT_SNAPSHOT_DIR=snapshot_dir):
+        filenames = snapshots.build_snapshots()
+        assert "public.csv" in filenames, filenames
+        assert "civil_service_only-public.json" in filenames, filenames
+        # The snapshots are in the database, each web instance copies them to its own disk when first served
+        assert not list(pathlib.Path(snapshot_dir).iterdir())
+
+        response = client.get("/data-download/", params={"csv": "", "public": ""}, headers={"Accept-Encoding": ""})
+        assert response.status_code == 200, response.status_code
+        assert "Content-Encoding" not in response.headers, response.headers
+        assert "Download evaluation snapshot" in response.text
+        etag = response.headers["ETag"]
+
+        response = client.get(
+            "/data-download/", params={"csv": "", "public": ""}, headers={"Accept-Encoding": "", "If-None-Match": etag}
+        )
+        assert response.status_code == 304, response.status_code
+
+        response = client.get("/data-download/", params={"json": "", "public": ""}, headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200, response.status_code
+        assert response.headers["Content-Encoding"] == "gzip", response.headers
+        assert "Download evaluation snapshot" in {item["title"] for item in response.json()}
+
+        response = client.get(
+            "/data-download/", params={"json": "", "public": ""}, headers={"Accept-Encoding": "gzip;q=0, identity"}
+        )
+        assert "Content-Encoding" not in response.headers, response.headers
+
+        # Stale snapshots aren't served, the download is generated live until they are rebuilt
+        evaluation.title = "Download evaluation changed after snapshot"
+        evaluation.save()
+        response = client.get("/data-download/", params={"csv": "", "public": ""}, headers={"Accept-Encoding": ""})
+        assert "ETag" not in response.headers, response.headers
+        assert "Download evaluation changed after snapshot" in response.text
+
+        assert "public.csv" in snapshots.build_snapshots(stale_only=True)
+        assert not snapshots.build_snapshots(stale_only=True)
+        response = client.get("/data-download/", params={"csv": "", "public": ""}, headers={"Accept-Encoding": ""})
+        assert "ETag" in response.headers, response.headers
+        assert "Download evaluation changed after snapshot" in response.text
+        assert response.headers["ETag"] != etag
+        # Only the latest copy of each snapshot is kept
+        public_csv_copies = list(pathlib.Path(snapshot_dir).glob("public.csv-*"))
+        assert len(public_csv_copies) == 1, public_csv_copies
+
+        evaluation.visibility = choices.EvaluationVisibility.DRAFT.value
+        evaluation.save()
+        response = client.get("/data-download/", params={"csv": "", "public": ""}, headers={"Accept-Encoding": ""})
+        assert "Download evaluation changed after snapshot" not in response.text
+
+        response = client.get("/data-download/", params={"json": "", "public": "", "my_evaluations": ""})
+        assert "ETag" not in response.headers, response.headers
+    ExportSnapshot.objects.all().delete()
+    teardown_download_evaluations()
+
+
+def test_snapshot_rebuilt_after_page_status_and_contributor_changes():
+    evaluation = Evaluation(
+        title="Download evaluation contributors", visibility=choices.EvaluationVisibility.PUBLIC.value
+    )
+    evaluation.save()
+    user = User.objects.get(email="peter.rabbit@example.com")
+    with tempfile.TemporaryDirectory() as snapshot_dir, override_settings(EXPORT_SNAPSHOT_DIR=snapshot_dir):
+        snapshots.build_snapshots()
+        assert not snapshots.build_snapshots(stale_only=True)
+
+        # Neither of these changes the evaluation's row directly, but both are in the downloads
+        set_page_status(evaluation.id, "intro", "IN_PROGRESS")
+        assert "public.json" in snapshots.build_snapshots(stale_only=True)
+        assert not snapshots.build_snapshots(stale_only=True)
+
+        evaluation.users.add(user)
+        assert "public.json" in snapshots.build_snapshots(stale_only=True)
+        assert "peter.rabbit@example.com" in snapshots.SnapshotStorage().get("public.csv")[0].read_text()
+
+        user.evaluations.remove(evaluation)
+        assert "public.json" in snapshots.build_snapshots(stale_only=True)
+        assert "peter.rabbit@example.com" not in snapshots.SnapshotStorage().get("public.csv")[0].read_text()
+    ExportSnapshot.objects.all().delete()
+    teardown_download_evaluations()
+
+
+@with_authenticated_client
+def test_download_parquet(client):
+    setup_download_evaluations()
+    response = client.get("/data-download/", params={"parquet": "", "my_evaluations": ""})
+    assert response.status_code == 200, response.status_code
+    assert response.headers["Content-Type"] == "application/zip", response.headers
+    with zipfile.ZipFile(io.BytesIO(response.content)) as zip_file:
+        assert "evaluations.parquet" in zip_file.namelist(), zip_file.namelist()
+        evaluations = pq.read_table(zip_file.open("evaluations.parquet")).to_pylist()
+        interventions = pq.read_table(zip_file.open("interventions.parquet")).to_pylist()
+        costs = pq.read_table(zip_file.open("costs.parquet"))
+    downloaded = {item["title"]: item for item in evaluations if item["title"].startswith("Download evaluation")}
+    assert len(downloaded) == 3, downloaded.keys()
+    evaluation = downloaded["Download evaluation 1"]
+    assert evaluation["topics"] == ["TRANSPORT"], evaluation["topics"]
+    assert "search_text" not in evaluation
+    intervention_names = {item["name"] for item in interventions if item["evaluation_id"] == evaluation["id"]}
+    assert intervention_names == {"Download intervention 1"}, intervention_names
+    assert costs.schema.field("item_cost").type == pa.float64(), costs.schema
+    teardown_download_evaluations()
+
+
+@with_authenticated_client
+def test_download_arrow(client):
+    response = client.get("/data-download/", params={"arrow": ""})
+    assert response.status_code == 200, response.status_code
+    with zipfile.ZipFile(io.BytesIO(response.content)) as zip_file:
+        table = pa.ipc.open_file(io.BytesIO(zip_file.read("users.arrow"))).read_all()
+    assert table.num_rows == 0, table.num_rows
+    assert table.schema.names == ["evaluation_id", "email"], table.schema.names
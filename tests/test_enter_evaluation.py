@@ -1,8 +1,10 @@
 import functools
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from nose.tools import with_setup
 
-from eva_reg.evaluation import choices, enums, models
+from eva_reg.evaluation import choices, models
 
 from . import utils
 
@@ -156,7 +158,7 @@ def test_step_through_evaluation():
             "Description",
             {
                 "brief_description": "A brief description of the evaluation",
-                "organisations": [enums.Organisation.choices[0][0]],
+                "organisations": [models.get_organisations().choices[0][0]],
             },
             evaluation.id,
         ),
@@ -525,3 +527,22 @@ def test_invite_collaborators():
     assert response.status_code == 200
     assert response.has_text("This should be a valid Civil Service email")
     assert not response.has_text("invalid@example.org")
+
+
+@utils.with_authenticated_client
+def test_evaluation_loaded_once_per_request(client):
+    user = models.User.objects.get(email="peter.rabbit@example.com")
+    evaluation = models.Evaluation(title="Loaded once")
+    evaluation.save()
+    evaluation.users.add(user)
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(f"evaluation/{evaluation.id}/title")
+    assert response.status_code == 200, response.status_code
+    evaluation_table = models.Evaluation._meta.db_table
+    evaluation_loads = [
+        query["sql"]
+        for query in context.captured_queries
+        if query["sql"].startswith(f'SELECT "{evaluation_table}"."id"')
+    ]
+    assert len(evaluation_loads) == 1, evaluation_loads
+    evaluation.delete()
@@ -0,0 +1,136 @@
+import datetime
+
+from django.db import connection, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from eva_reg.evaluation import events, models
+
+from .utils import with_authenticated_client
+
+
+class RolledBack(Exception):
+    pass
+
+
+def get_event_count(name):
+    return models.Event.objects.filter(name=name).count()
+
+
+@override_settings(EVENT_SINK="buffered")
+def test_buffered_event_sink():
+    sink = events.get_event_sink()
+    with CaptureQueriesContext(connection) as context:
+        with transaction.atomic():
+            for i in range(3):
+                sink.record("Buffered test event", {"number": i})
+            assert get_event_count("Buffered test event") == 0
+    inserts = [query for query in context.captured_queries if query["sql"].startswith("INSERT")]
+    assert len(inserts) == 1, inserts
+    assert get_event_count("Buffered test event") == 3
+
+    try:
+        with transaction.atomic():
+            sink.record("Rolled back test event", {})
+            raise RolledBack()
+    except RolledBack:
+        pass
+    with transaction.atomic():
+        sink.record("Buffered test event", {"number": 3})
+    assert get_event_count("Rolled back test event") == 0
+    assert get_event_count("Buffered test event") == 4
+
+    # Outside a transaction events are written straight away
+    sink.record("Buffered test event", {"number": 4})
+    assert get_event_count("Buffered test event") == 5
+    models.Event.objects.filter(name="Buffered test event").delete()
+
+
+@override_settings(EVENT_SINK="buffered")
+def test_buffered_event_sink_rollback():
+    sink = events.get_event_sink()
+    with transaction.atomic():
+        try:
+            with transaction.atomic():
+                sink.record("Rolled back savepoint test event", {})
+                raise RolledBack()
+        except RolledBack:
+            pass
+        sink.record("Committed test event", {})
+    assert get_event_count("Rolled back savepoint test event") == 0
+    assert get_event_count("Committed test event") == 1
+
+    with transaction.atomic():
+        sink.record("Rolled back test event", {})
+        transaction.set_rollback(True)
+    with transaction.atomic():
+        sink.record("Committed test event", {})
+        sink.record("Committed test event", {})
+    assert get_event_count("Rolled back test event") == 0
+    assert get_event_count("Committed test event") == 3
+    models.Event.objects.filter(name="Committed test event").delete()
+
+
+@override_settings(EVENT_SINK="buffered")
+def test_buffered_event_sink_latest_event_rolled_back():
+    sink = events.get_event_sink()
+    with transaction.atomic():
+        sink.record("Committed test event", {})
+        try:
+            with transaction.atomic():
+                sink.record("Rolled back savepoint test event", {})
+                raise RolledBack()
+        except RolledBack:
+            pass
+    # The committed event waits for the next write
+    assert get_event_count("Committed test event") == 0
+    with transaction.atomic():
+        sink.record("Committed test event", {})
+    assert get_event_count("Rolled back savepoint test event") == 0
+    assert get_event_count("Committed test event") == 2
+    models.Event.objects.filter(name="Committed test event").delete()
+
+
+@override_settings(EVENT_SINK="buffered")
+def test_buffered_event_sink_write_error():
+    sink = events.get_event_sink()
+    # Too long for the name column, the error is logged and the committed transaction isn't affected
+    with transaction.atomic():
+        sink.record("Too long test event" * 20, {})
+        models.Event(name="Committed test event", data={}).save()
+    assert not models.Event.objects.filter(name__startswith="Too long test event").exists()
+    assert get_event_count("Committed test event") == 1
+
+    sink.record("Committed test event", {})
+    assert get_event_count("Committed test event") == 2
+    models.Event.objects.filter(name="Committed test event").delete()
+
+
+@override_settings(EVENT_SINK="buffered")
+@with_authenticated_client
+def test_buffered_event_sink_in_request(client):
+    title = "Buffered events evaluation"
+    response = client.get("/evaluation/create/")
+    assert response.status_code == 200, response.status_code
+    headers = {"X-CSRFToken": client.cookies["csrftoken"]}
+    response = client.post("/evaluation/create/", data={"title": title}, headers=headers)
+    assert response.status_code == 200, response.status_code
+
+    evaluation = models.Evaluation.objects.get(title=title)
+    created_events = models.Event.objects.filter(name="Evaluation created", created_at__gte=evaluation.created_at)
+    assert created_events.exists()
+    assert models.Event.objects.filter(name="Evaluation updated", data__evaluation_id=str(evaluation.id)).exists()
+    evaluation.delete()
+
+
+def test_prune_events():
+    for i in range(3):
+        models.Event(name="Prune test event", data={"number": i}).save()
+    old_created_at = timezone.now() - datetime.timedelta(days=30)
+    models.Event.objects.filter(name="Prune test event", data__number__lt=2).update(created_at=old_created_at)
+
+    events.prune_events(days=7, batch_size=1)
+    remaining = list(models.Event.objects.filter(name="Prune test event").values_list("data", flat=True))
+    assert remaining == [{"number": 2}], remaining
+    models.Event.objects.filter(name="Prune test event").delete()
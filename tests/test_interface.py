@@ -1,3 +1,6 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from eva_reg.evaluation import interface, models
 
 USER_DATA = {"email": "mr_interface_test@example.com", "password": "1-h4t3-p455w0rd-c0mpl3xity-53tt1ng5"}
@@ -37,3 +40,52 @@ def test_evaluation_facade():
     user_emails = [x["email"] for x in result]
     assert "new_user@example.com" not in user_emails, user_emails
     assert "mr_interface_test@example.com" in user_emails, user_emails
+
+
+def test_update_page_status():
+    user, _ = models.User.objects.get_or_create(email=USER_DATA["email"])
+    evaluation_id = interface.facade.evaluation.create(user_id=user.id)["id"]
+    evaluation = models.Evaluation.objects.get(id=evaluation_id)
+    modified_at = evaluation.modified_at
+    models.SearchIndexQueueItem.objects.filter(evaluation_id=evaluation_id).delete()
+
+    result = interface.facade.evaluation.update_page_status(
+        user_id=user.id, evaluation_id=evaluation_id, page_name="intro", status="IN_PROGRESS"
+    )
+    assert result == {"evaluation_id": evaluation_id, "page_name": "intro", "status": "IN_PROGRESS", "updated": True}
+    result = interface.facade.evaluation.update_page_status(
+        user_id=user.id, evaluation_id=evaluation_id, page_name="intro", status="IN_PROGRESS"
+    )
+    assert not result["updated"], result
+
+    interface.facade.evaluation.update_page_status(
+        user_id=user.id, evaluation_id=evaluation_id, page_name="intro", status="DONE"
+    )
+    result = interface.facade.evaluation.update_page_status(
+        user_id=user.id, evaluation_id=evaluation_id, page_name="intro", status="IN_PROGRESS"
+    )
+    assert not result["updated"], result
+
+    evaluation.refresh_from_db()
+    assert evaluation.page_statuses["intro"] == "DONE", evaluation.page_statuses
+    assert evaluation.page_statuses["title"] == "NOT_STARTED", evaluation.page_statuses
+    assert evaluation.modified_at == modified_at
+    assert not models.SearchIndexQueueItem.objects.filter(evaluation_id=evaluation_id).exists()
+    models.Evaluation.objects.filter(id=evaluation_id).delete()
+
+
+def test_get_evaluation_fields():
+    user, _ = models.User.objects.get_or_create(email=USER_DATA["email"])
+    evaluation_id = interface.facade.evaluation.create(user_id=user.id)["id"]
+    interface.facade.evaluation.update(user_id=user.id, evaluation_id=evaluation_id, data={"title": "Projected"})
+
+    with CaptureQueriesContext(connection) as context:
+        result = interface.facade.evaluation.get(evaluation_id=evaluation_id, fields=["title", "page_statuses"])
+    assert set(result) == {"title", "page_statuses"}, result.keys()
+    assert result["title"] == "Projected", result
+    assert len(context.captured_queries) == 1, context.captured_queries
+    assert '"brief_description"' not in context.captured_queries[0]["sql"]
+
+    result = interface.facade.evaluation.get(evaluation_id=evaluation_id, fields=["id", "users"])
+    assert result == {"id": evaluation_id, "users": [{"email": USER_DATA["email"]}]}, result
+    models.Evaluation.objects.filter(id=evaluation_id).delete()
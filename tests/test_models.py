@@ -1,6 +1,13 @@
+import json
+import pathlib
+import tempfile
+
+from django.contrib.postgres.search import SearchQuery
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
 from nose.tools import with_setup
 
-from eva_reg.evaluation import choices, models
+from eva_reg.evaluation import choices, models, organisations, search_index
 
 
 def test_name_field():
@@ -66,6 +73,8 @@ def test_search_text():
         ],
     )
     process_evaluation_method.save()
+    search_index.process_queue()
+    test_eval.refresh_from_db()
     search_text = test_eval.search_text
     assert "elephants" in search_text, search_text
     assert "DfE" in search_text, search_text
@@ -76,6 +85,99 @@ def test_search_text():
     assert "other process method" in search_text, search_text
 
 
+def test_search_vector():
+    test_eval = models.Evaluation(title="Test search vector eval", brief_description="Juggling penguins")
+    test_eval.save()
+    outcome_measure = models.OutcomeMeasure(evaluation=test_eval, name="Number of unicycles")
+    outcome_measure.save()
+    search_index.process_queue()
+
+    matching_evaluations = models.Evaluation.objects.filter(search_vector=SearchQuery("penguins"))
+    assert test_eval in matching_evaluations
+    matching_evaluations = models.Evaluation.objects.filter(search_vector=SearchQuery("unicycles"))
+    assert test_eval in matching_evaluations
+    test_eval.delete()
+
+
+def test_incremental_search_text():
+    test_eval = models.Evaluation(title="Test incremental search eval")
+    test_eval.save()
+    intervention = models.Intervention(evaluation=test_eval, name="Tap dancing lessons")
+    intervention.save()
+    document = models.Document(evaluation=test_eval, title="Final report")
+    document.save()
+    search_index.process_queue()
+    test_eval.refresh_from_db()
+    assert "Tap dancing lessons" in test_eval.search_text, test_eval.search_text
+
+    intervention.name = "Ballet lessons"
+    intervention.save()
+    search_index.process_queue()
+    test_eval.refresh_from_db()
+    assert "Ballet lessons" in test_eval.search_text, test_eval.search_text
+    assert "Tap dancing lessons" not in test_eval.search_text, test_eval.search_text
+    assert test_eval.search_text.index("Ballet lessons") < test_eval.search_text.index("Final report")
+
+    models.Intervention.objects.filter(id=intervention.id).delete()
+    search_index.process_queue()
+    test_eval.refresh_from_db()
+    assert "Ballet lessons" not in test_eval.search_text, test_eval.search_text
+    assert not models.SearchFragment.objects.filter(source_id=intervention.id).exists()
+    test_eval.delete()
+    assert not models.SearchFragment.objects.filter(evaluation_id=test_eval.id).exists()
+
+
+def test_reindex_queue():
+    test_eval = models.Evaluation(title="Test reindex queue eval")
+    test_eval.save()
+    search_index.process_queue()
+
+    # Saving doesn't rebuild the search text, and many saves only queue the evaluation once
+    with transaction.atomic():
+        for i in range(3):
+            models.OutcomeMeasure(evaluation=test_eval, name=f"Outcome measure {i}").save()
+        test_eval.brief_description = "Synchronised swimming"
+        test_eval.save()
+    test_eval.refresh_from_db()
+    assert "Synchronised swimming" not in test_eval.search_text, test_eval.search_text
+    assert models.SearchIndexQueueItem.objects.filter(evaluation_id=test_eval.id).count() == 1
+
+    with CaptureQueriesContext(connection) as context:
+        assert search_index.process_queue() == 1
+    search_text_updates = [
+        query["sql"]
+        for query in context.captured_queries
+        if query["sql"].startswith('UPDATE "evaluation_evaluation"') and '"search_text"' in query["sql"]
+    ]
+    assert len(search_text_updates) == 1, search_text_updates
+    assert not models.SearchIndexQueueItem.objects.filter(evaluation_id=test_eval.id).exists()
+    test_eval.refresh_from_db()
+    assert "Synchronised swimming" in test_eval.search_text, test_eval.search_text
+    assert "Outcome measure 2" in test_eval.search_text, test_eval.search_text
+    test_eval.delete()
+
+
+def test_reindex_queue_rollback():
+    test_eval = models.Evaluation(title="Test reindex queue rollback eval")
+    test_eval.save()
+    search_index.process_queue()
+
+    with transaction.atomic():
+        test_eval.brief_description = "Rolled back"
+        test_eval.save()
+        transaction.set_rollback(True)
+    assert not models.SearchIndexQueueItem.objects.filter(evaluation_id=test_eval.id).exists()
+
+    # The next commit takes the rolled back transaction's ids with it, rather than leaving them pending
+    other_eval = models.Evaluation(title="Test reindex queue rollback other eval")
+    other_eval.save()
+    assert not search_index._get_pending_evaluation_ids()
+    assert models.SearchIndexQueueItem.objects.filter(evaluation_id=other_eval.id).exists()
+    search_index.process_queue()
+    test_eval.delete()
+    other_eval.delete()
+
+
 def test_user_save():
     new_email1 = "New_User1@example.org"
     new_email2 = "New_User2@Example.com"
@@ -85,3 +187,49 @@ def test_user_save():
     assert new_user1.is_external_user, new_user1.is_external_user
     assert new_user2.email == "new_user2@example.com", new_user2.email
     assert not new_user2.is_external_user, new_user2.is_external_user
+
+
+def get_linked_slugs(evaluation):
+    return set(evaluation.linked_organisations.values_list("slug", flat=True))
+
+
+def test_link_organisations():
+    evaluation = models.Evaluation(
+        title="Linked organisations evaluation", organisations=["department-for-education", "not-an-organisation"]
+    )
+    evaluation.save()
+    assert get_linked_slugs(evaluation) == {"department-for-education"}
+
+    evaluation = models.Evaluation.objects.get(id=evaluation.id)
+    with CaptureQueriesContext(connection) as context:
+        evaluation.save()
+    link_queries = [query for query in context.captured_queries if "linked_organisations" in query["sql"]]
+    assert not link_queries, link_queries
+
+    evaluation.organisations = ["department-for-transport"]
+    evaluation.save()
+    assert get_linked_slugs(evaluation) == {"department-for-transport"}
+    assert models.get_organisations().mapping["department-for-transport"] == "Department for Transport (DfT)"
+    evaluation.delete()
+
+
+def test_load_new_organisation():
+    evaluation = models.Evaluation(title="New organisation evaluation", organisations=["ministry-of-new-things"])
+    evaluation.save()
+    assert not get_linked_slugs(evaluation)
+    assert evaluation.get_list_organisations_display_names() == ["ministry-of-new-things"]
+
+    items = [{"title": "Ministry of New Things", "details": {"slug": "ministry-of-new-things", "abbreviation": "MNT"}}]
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory) / "organisations.json"
+        path.write_text(json.dumps(items))
+        created, _ = organisations.load_organisations(models.Organisation, path)
+    assert created == ["ministry-of-new-things"], created
+    assert organisations.link_evaluations(models.Evaluation, created) == 1
+    assert get_linked_slugs(evaluation) == {"ministry-of-new-things"}
+
+    models.forget_organisations()
+    assert models.get_organisations().mapping["ministry-of-new-things"] == "Ministry of New Things (MNT)"
+    evaluation.delete()
+    models.Organisation.objects.filter(slug="ministry-of-new-things").delete()
+    models.forget_organisations()
@@ -1,5 +1,17 @@
+import csv
+import pathlib
+import tempfile
+
+import openpyxl
+from django.core.management.base import CommandError
+
 from eva_reg.evaluation import models
 from eva_reg.evaluation.management.commands.upload_rsm_data import (
+    get_column_indexes,
+    get_evaluation_report_ids,
+    group_rows,
+    import_evaluations_from_file,
+    open_sheet,
     transform_and_create_from_rows,
 )
 
@@ -460,3 +472,194 @@ def test_upload_evaluation():
     assert evaluation.costs.all().count() == 1
     cost = evaluation.costs.first()
     assert cost.item_cost == 1000, cost.item_cost
+
+
+def test_upload_evaluation_search_text():
+    models.Evaluation.objects.filter(rsm_id=2).delete()
+    long_title_row = list(data_row[0])
+    long_title_row[headers.index("Evaluation title")] = "A" * 2000
+    transform_and_create_from_rows(2, [long_title_row], headers)
+    evaluation = models.Evaluation.objects.get(rsm_id=2)
+    assert len(evaluation.title) == 1024, len(evaluation.title)
+    assert evaluation.title.endswith("[…]"), evaluation.title[-10:]
+    assert "Local Sustainable Transport Fund" in evaluation.search_text, evaluation.search_text
+    assert "Reduced congestion" in evaluation.search_text, evaluation.search_text
+    assert evaluation.search_vector
+    assert evaluation.search_fragments.count() == 6, evaluation.search_fragments.count()
+    linked_organisations = list(evaluation.linked_organisations.values_list("slug", flat=True))
+    assert linked_organisations == ["department-for-transport"], linked_organisations
+    evaluation.delete()
+
+
+def test_group_rows():
+    column_indexes = get_column_indexes(headers)
+    rows = []
+    for evaluation_id, report_id in (("1", "2"), ("1", "1"), ("", "3"), ("1", ""), ("1", "2"), ("2", "1")):
+        row = list(data_row[0])
+        row[column_indexes["Evaluation ID"]] = evaluation_id
+        row[column_indexes["Report ID"]] = report_id
+        rows.append(row)
+    grouped_rows = dict(group_rows(iter(rows), column_indexes))
+    assert list(grouped_rows) == ["1", "2"], list(grouped_rows)
+    report_rows = grouped_rows["1"]
+    assert get_evaluation_report_ids(report_rows) == ["1", "2"], get_evaluation_report_ids(report_rows)
+    assert len(report_rows["2"]) == 2, report_rows["2"]
+    assert len(report_rows[""]) == 1, report_rows[""]
+
+    raised = False
+    try:
+        list(group_rows(iter(rows + rows[:1]), column_indexes))
+    except CommandError:
+        raised = True
+    assert raised
+
+
+def write_csv(csv_path, rows):
+    with csv_path.open("w", newline="") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(headers)
+        writer.writerows(rows)
+
+
+def test_import_rows_not_grouped():
+    models.Evaluation.objects.filter(rsm_id__in=[15, 16]).delete()
+    rows = []
+    for evaluation_id in ("15", "16", "15"):
+        row = list(data_row[0])
+        row[headers.index("Evaluation ID")] = evaluation_id
+        rows.append(row)
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = pathlib.Path(directory) / "rsm.csv"
+        write_csv(csv_path, rows)
+        raised = False
+        try:
+            import_evaluations_from_file(csv_path)
+        except CommandError:
+            raised = True
+    assert raised
+    # Checked before anything is written
+    assert not models.Evaluation.objects.filter(rsm_id__in=[15, 16]).exists()
+
+
+def test_open_sheet():
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = pathlib.Path(directory) / "rsm.csv"
+        write_csv(csv_path, data_row)
+
+        xlsx_path = pathlib.Path(directory) / "rsm.xlsx"
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet = workbook.create_sheet()
+        sheet.append(headers)
+        for row in data_row:
+            sheet.append([int(value) if value.isdigit() else value or None for value in row])
+        workbook.save(xlsx_path)
+
+        for path in (csv_path, xlsx_path):
+            with open_sheet(path) as (sheet_headers, rows):
+                assert sheet_headers == headers, sheet_headers
+                assert list(rows) == data_row, path
+
+
+def test_import_with_workers():
+    models.Evaluation.objects.filter(rsm_id__in=[11, 12, 13]).delete()
+    rows = []
+    for evaluation_id in ("11", "12"):
+        row = list(data_row[0])
+        row[headers.index("Evaluation ID")] = evaluation_id
+        rows.append(row)
+    # Too short to be transformed, this evaluation should be reported and skipped
+    rows.append(["13", "1"])
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = pathlib.Path(directory) / "rsm.csv"
+        write_csv(csv_path, rows)
+        imported = import_evaluations_from_file(csv_path, workers=2)
+
+    assert imported == 2, imported
+    evaluations = models.Evaluation.objects.filter(rsm_id__in=[11, 12, 13])
+    assert sorted(evaluations.values_list("rsm_id", flat=True)) == [11, 12]
+    for evaluation in evaluations:
+        assert evaluation.title == "Evaluation title", evaluation.title
+        assert evaluation.interventions.count() == 1
+        assert "Local Sustainable Transport Fund" in evaluation.search_text, evaluation.search_text
+    evaluations.delete()
+
+
+def test_import_with_update():
+    models.Evaluation.objects.filter(rsm_id=14).delete()
+    rows = []
+    for report_id in ("1", "2", "2"):
+        row = list(data_row[0])
+        row[headers.index("Evaluation ID")] = "14"
+        row[headers.index("Report ID")] = report_id
+        row[headers.index("Intervention name")] = f"Intervention {report_id}"
+        rows.append(row)
+    # Only the second report's rows give the title, so changing them decides it
+    rows[0][headers.index("Evaluation title")] = ""
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = pathlib.Path(directory) / "rsm.csv"
+        write_csv(csv_path, rows)
+        assert import_evaluations_from_file(csv_path) == 1
+        evaluation = models.Evaluation.objects.get(rsm_id=14)
+        intervention_ids = dict(evaluation.interventions.values_list("name", "id"))
+        assert sorted(intervention_ids) == ["Intervention 1", "Intervention 2"], intervention_ids
+
+        # Already imported, and unchanged
+        assert import_evaluations_from_file(csv_path) == 0
+        assert import_evaluations_from_file(csv_path, update=True) == 0
+
+        # Only the second report's rows change
+        for row in rows[1:]:
+            row[headers.index("Evaluation title")] = "Updated title"
+            row[headers.index("Intervention name")] = "Updated intervention"
+        write_csv(csv_path, rows)
+        assert import_evaluations_from_file(csv_path, update=True) == 1
+
+    assert models.Evaluation.objects.filter(rsm_id=14).count() == 1
+    evaluation = models.Evaluation.objects.get(rsm_id=14)
+    assert evaluation.title == "Updated title", evaluation.title
+    updated_intervention_ids = dict(evaluation.interventions.values_list("name", "id"))
+    assert sorted(updated_intervention_ids) == ["Intervention 1", "Updated intervention"], updated_intervention_ids
+    # The unchanged report's intervention is kept
+    assert updated_intervention_ids["Intervention 1"] == intervention_ids["Intervention 1"]
+    # The search text is rebuilt from the fragments by the reindex worker
+    fragments = models.SearchFragment.objects.filter(evaluation_id=evaluation.id, source_name="interventions")
+    assert fragments.filter(text__contains="Updated intervention").exists()
+    assert not fragments.filter(text__contains="Intervention 2").exists()
+    evaluation.delete()
+
+
+def test_import_with_update_before_hashes_stored():
+    models.Evaluation.objects.filter(rsm_id=15).delete()
+    rows = []
+    for report_id in ("1", "2", "3"):
+        row = list(data_row[0])
+        row[headers.index("Evaluation ID")] = "15"
+        row[headers.index("Report ID")] = report_id
+        row[headers.index("Intervention name")] = f"Intervention {report_id}"
+        rows.append(row)
+    # An intervention without a name, which can only be matched on its other fields
+    rows[2][headers.index("Intervention name")] = ""
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = pathlib.Path(directory) / "rsm.csv"
+        write_csv(csv_path, rows)
+        assert import_evaluations_from_file(csv_path) == 1
+        evaluation = models.Evaluation.objects.get(rsm_id=15)
+        intervention_ids = dict(evaluation.interventions.values_list("name", "id"))
+        assert sorted(intervention_ids, key=str) == ["Intervention 1", "Intervention 2", None], intervention_ids
+        # As if imported before the report hashes were stored, with an intervention added on the site since
+        models.RsmImport.objects.filter(evaluation=evaluation).delete()
+        models.Intervention.objects.create(evaluation=evaluation, name="Added by a user")
+
+        rows[1][headers.index("Intervention brief description")] = "Updated description"
+        write_csv(csv_path, rows)
+        assert import_evaluations_from_file(csv_path, update=True) == 1
+
+    evaluation = models.Evaluation.objects.get(rsm_id=15)
+    intervention_names = sorted(evaluation.interventions.values_list("name", flat=True), key=str)
+    # The interventions with the same names as in the file are replaced, the one added on the site is kept
+    assert intervention_names == ["Added by a user", "Intervention 1", "Intervention 2", None], intervention_names
+    intervention = evaluation.interventions.get(name="Intervention 2")
+    assert intervention.id != intervention_ids["Intervention 2"]
+    assert intervention.brief_description == "Updated description.", intervention.brief_description
+    assert models.RsmImport.objects.filter(evaluation=evaluation).exists()
+    evaluation.delete()
@@ -37,7 +37,11 @@ def check_schema_model_match_fields(model_name, schema_name, related_fields_to_i
 
 
 def test_evaluation_schema_has_relevant_fields():
-    check_schema_model_match_fields(model_name="Evaluation", schema_name="EvaluationSchema")
+    check_schema_model_match_fields(
+        model_name="Evaluation",
+        schema_name="EvaluationSchema",
+        related_fields_to_ignore={"search_vector", "search_fragments", "linked_organisations", "rsm_import"},
+    )
 
 
 def test_intervention_schema_has_relevant_fields():
@@ -1,4 +1,9 @@
-from eva_reg.evaluation import interface, models
+import json
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from eva_reg.evaluation import interface, models, search, search_index, views
 
 from . import utils
 
@@ -20,6 +25,7 @@ def test_search():
         user_id=user.id, evaluation_id=evaluation["id"], data={"title": "Test evaluation search by title"}
     )
     evaluation = interface.facade.evaluation.get(evaluation_id=evaluation["id"])
+    search_index.process_queue()
 
     search_page = client.get("/search/")
 
@@ -30,3 +36,207 @@ def test_search():
     results = search_form.submit()
 
     assert results.has_text(evaluation["title"])
+
+
+SAVE_USER_DATA = {"email": "mr_search_save_test@example.com", "password": "1-h4t3-p455w0rd-c0mpl3xity-53tt1ng5"}
+
+
+def test_search_after_saving_page():
+    client = utils.make_testino_client()
+    utils.register(client, **SAVE_USER_DATA)
+    user = models.User.objects.get(email=SAVE_USER_DATA["email"])
+    evaluation = models.Evaluation(title="Untitled")
+    evaluation.save()
+    evaluation.users.add(user)
+
+    # Saved by a request, which commits its transaction, then indexed by the worker
+    title_page = client.get(f"/evaluation/{evaluation.id}/title/")
+    form = title_page.get_form()
+    form["title"] = "Searchable wombat evaluation"
+    form.submit()
+    search_index.process_queue()
+
+    results = client.get("/search/?search_term=wombat")
+    assert results.has_text("Searchable wombat evaluation")
+
+    evaluation.delete()
+    user.delete()
+
+
+PAGINATION_USER_DATA = {"email": "mr_pagination_test@example.com", "password": "1-h4t3-p455w0rd-c0mpl3xity-53tt1ng5"}
+
+
+def get_result_titles(page):
+    return [element.text_content().strip() for element in page.all(".card-results h2")]
+
+
+def test_search_pagination():
+    client = utils.make_testino_client()
+    utils.register(client, **PAGINATION_USER_DATA)
+    user = models.User.objects.get(email=PAGINATION_USER_DATA["email"])
+
+    titles = {f"Paginated hedgehog evaluation {i}" for i in range(5)}
+    for title in titles:
+        evaluation = interface.facade.evaluation.create(user_id=user.id)
+        interface.facade.evaluation.update(user_id=user.id, evaluation_id=evaluation["id"], data={"title": title})
+    search_index.process_queue()
+
+    first_page = client.get("/search/?search_term=hedgehog&page_size=2")
+    assert first_page.has_text("5 results found")
+    first_page_titles = get_result_titles(first_page)
+    assert len(first_page_titles) == 2, first_page_titles
+    assert not first_page.has_one("a[rel='prev']")
+
+    second_page = first_page.click("a[rel='next']")
+    third_page = second_page.click("a[rel='next']")
+    assert not third_page.has_one("a[rel='next']")
+    seen_titles = first_page_titles + get_result_titles(second_page) + get_result_titles(third_page)
+    assert sorted(seen_titles) == sorted(titles), seen_titles
+
+    previous_page = third_page.click("a[rel='prev']")
+    assert get_result_titles(previous_page) == get_result_titles(second_page)
+    first_page_again = previous_page.click("a[rel='prev']")
+    assert get_result_titles(first_page_again) == first_page_titles
+    assert not first_page_again.has_one("a[rel='prev']")
+
+    models.Evaluation.objects.filter(title__in=titles).delete()
+    user.delete()
+
+
+def test_facet_counts():
+    titles = ["Facet count evaluation 1", "Facet count evaluation 2"]
+    models.Evaluation(
+        title=titles[0],
+        organisations=["department-for-education", "department-for-transport"],
+        topics=["EDUCATION_TRAINING_AND_SKILLS"],
+        evaluation_type=["IMPACT"],
+        visibility="PUBLIC",
+    ).save()
+    models.Evaluation(
+        title=titles[1],
+        organisations=["department-for-education"],
+        evaluation_type=["IMPACT", "PROCESS"],
+        visibility="DRAFT",
+    ).save()
+
+    qs = models.Evaluation.objects.filter(title__in=titles)
+    facet_counts = search.get_facet_counts(qs)
+    assert facet_counts["organisations"] == {"department-for-education": 2, "department-for-transport": 1}
+    assert facet_counts["topics"] == {"EDUCATION_TRAINING_AND_SKILLS": 1}
+    assert facet_counts["evaluation_type"] == {"IMPACT": 2, "PROCESS": 1}
+    assert facet_counts["visibility"] == {"PUBLIC": 1, "DRAFT": 1}
+
+    organisation_filters = views.make_facet_filters(
+        models.get_organisations().choices, facet_counts["organisations"], ["cabinet-office"]
+    )
+    assert [value for value, _, _ in organisation_filters] == [
+        "cabinet-office",
+        "department-for-education",
+        "department-for-transport",
+    ], organisation_filters
+    assert organisation_filters[0][2] == 0
+
+    filtered_qs = search.filter_by_organisations(qs, ["department-for-transport", "cabinet-office"])
+    assert list(filtered_qs.values_list("title", flat=True)) == [titles[0]]
+    filtered_qs = search.filter_by_organisations(qs, ["department-for-education"])
+    assert filtered_qs.count() == 2
+
+    qs.delete()
+
+
+QUERY_COUNT_USER_DATA = {"email": "mr_query_count_test@example.com", "password": "1-h4t3-p455w0rd-c0mpl3xity-53tt1ng5"}
+
+
+def count_search_page_queries(client, search_term):
+    with CaptureQueriesContext(connection) as context:
+        page = client.get(f"/search/?search_term={search_term}")
+    assert page.status_code == 200, page.status_code
+    return len(context.captured_queries)
+
+
+def test_search_results_query_count():
+    client = utils.make_testino_client()
+    utils.register(client, **QUERY_COUNT_USER_DATA)
+    user = models.User.objects.get(email=QUERY_COUNT_USER_DATA["email"])
+
+    def create_evaluation(title):
+        evaluation = models.Evaluation(
+            title=title, organisations=["department-for-education"], evaluation_type=["IMPACT"]
+        )
+        evaluation.save()
+        evaluation.users.add(user)
+        models.Intervention(evaluation=evaluation, name=f"{title} intervention").save()
+        models.OutcomeMeasure(evaluation=evaluation, name=f"{title} outcome measure").save()
+
+    create_evaluation("Lonely aardvark evaluation")
+    for i in range(6):
+        create_evaluation(f"Crowded badger evaluation {i}")
+    search_index.process_queue()
+
+    single_result_queries = count_search_page_queries(client, "aardvark")
+    many_results_queries = count_search_page_queries(client, "badger")
+    assert single_result_queries == many_results_queries, (single_result_queries, many_results_queries)
+
+    page = client.get("/search/?search_term=badger")
+    assert page.has_text("Crowded badger evaluation 0 intervention")
+    assert page.has_text("Crowded badger evaluation 0 outcome measure")
+    assert page.has_text("Department for Education (DfE)")
+
+    models.Evaluation.objects.filter(users=user).delete()
+    user.delete()
+
+
+# Enough evaluations that filtering by a rare value is cheaper through an index than by scanning the table
+INDEX_TEST_EVALUATION_COUNT = 50000
+INDEX_TEST_COMMON_VALUES = {"topics": ["ENVIRONMENT"], "evaluation_type": ["IMPACT"], "impact_design_name": ["RCT"]}
+INDEX_TEST_RARE_VALUES = {
+    "topics": ["BREXIT"],
+    "evaluation_type": ["ECONOMIC"],
+    "impact_design_name": ["SYNTHETIC_CONTROL_METHODS"],
+}
+
+
+def make_many_evaluations():
+    """
+    Copy one evaluation INDEX_TEST_EVALUATION_COUNT times in SQL, which is much quicker than creating them
+    through the ORM. Every thousandth copy has the rare values.
+    """
+    template = models.Evaluation(title="Index test evaluation", **INDEX_TEST_COMMON_VALUES)
+    models.Evaluation.objects.bulk_create([template])
+    table = models.Evaluation._meta.db_table
+    other_columns = [
+        field.column
+        for field in models.Evaluation._meta.concrete_fields
+        if field.column not in ("id", *INDEX_TEST_RARE_VALUES)
+    ]
+    list_values = [
+        f"CASE WHEN mod(n, 1000) = 0 THEN %s::jsonb ELSE {field_name} END" for field_name in INDEX_TEST_RARE_VALUES
+    ]
+    sql = (
+        f"INSERT INTO {table} (id, {', '.join(INDEX_TEST_RARE_VALUES)}, {', '.join(other_columns)}) "
+        f"SELECT md5(random()::text || n::text)::uuid, {', '.join(list_values)}, {', '.join(other_columns)} "
+        f"FROM {table}, generate_series(0, %s - 1) AS n WHERE id = %s"
+    )
+    params = [json.dumps(values) for values in INDEX_TEST_RARE_VALUES.values()]
+    params += [INDEX_TEST_EVALUATION_COUNT, template.id]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        cursor.execute(f"ANALYZE {table}")
+
+
+def test_list_field_filters_use_indexes():
+    field_indexes = {
+        "topics": "evaluation_topics_idx",
+        "evaluation_type": "evaluation_type_idx",
+        "impact_design_name": "evaluation_impact_design_idx",
+    }
+    with transaction.atomic():
+        make_many_evaluations()
+        for field_name, index_name in field_indexes.items():
+            values = INDEX_TEST_RARE_VALUES[field_name] + ["OTHER"]
+            qs = search.filter_by_any(models.Evaluation.objects.all(), field_name, values)
+            count = qs.filter(title="Index test evaluation").count()
+            assert count == INDEX_TEST_EVALUATION_COUNT // 1000, (field_name, count)
+            plan = qs.explain()
+            assert index_name in plan, plan
+        transaction.set_rollback(True)
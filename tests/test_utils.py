@@ -66,6 +66,22 @@ def test_apply_schema():
         result = utils.apply_schema(MySchema, {"date": datetime.date(2012, 4, 1)}, "wibble")
 
 
+def test_with_schema_reuses_schemas():
+    class MySchema(marshmallow.Schema):
+        date = marshmallow.fields.Date()
+        name = marshmallow.fields.Str()
+
+    assert utils.resolve_schema(MySchema) is utils.resolve_schema(MySchema)
+    assert utils.project_schema(MySchema, ["name"]) is utils.project_schema(MySchema(), ["name"])
+
+    @utils.with_schema(dump=MySchema, only_argument="fields")
+    def get_thing(name, fields=None):
+        return {"date": datetime.date(2012, 4, 1), "name": name}
+
+    assert get_thing("flibble") == {"date": "2012-04-01", "name": "flibble"}
+    assert get_thing("flibble", fields=["name"]) == {"name": "flibble"}
+
+
 def test_choices():
     class MadeUp(utils.Choices):
         A = "a"
@@ -84,6 +100,10 @@ def test_choices():
     assert MadeUp.labels == expected_labels, MadeUp.labels
     assert MadeUp.options == expected_options, MadeUp.options
     assert MadeUp.mapping == expected_mapping, MadeUp.mapping
+    assert "A" in MadeUp
+    assert "a" not in MadeUp
+    assert ["A"] not in MadeUp
+    assert MadeUp.get_labels(["C", "D", "A", "C"]) == ["a", "c"], MadeUp.get_labels(["C", "D", "A", "C"])
 
 
 def test_dictify():
@@ -134,3 +154,17 @@ def test_restrict_to_permitted_evaluations():
     assert expected_viewable_evaluation_titles.issubset(actual_viewable_evaluation_titles)
     assert "Draft evaluation 1" not in expected_viewable_evaluation_titles
     assert "Civil Service evaluation 1" not in expected_viewable_evaluation_titles
+
+
+@with_setup(create_fake_evaluations, remove_fake_evaluations)
+def test_visible_to():
+    peter_rabbit = models.User.objects.get(email="peter.rabbit2@example.com")
+    mrs_tiggywinkle = models.User.objects.get(email="mrs.tiggywinkle@example.org")
+    for user in (peter_rabbit, mrs_tiggywinkle):
+        qs = models.Evaluation.objects.visible_to(user)
+        sql = str(qs.query)
+        assert "EXISTS" in sql and "JOIN" not in sql, sql
+        ids = list(qs.values_list("id", flat=True))
+        assert len(ids) == len(set(ids))
+        contributed_ids = set(user.evaluations.values_list("id", flat=True))
+        assert contributed_ids and contributed_ids.issubset(ids)